@@ -1,11 +1,9 @@
 import uuid
-import requests
 import torch
 import librosa
 import tempfile
 import os
 from urllib.parse import urlparse
-import comfy.model_management
 from .utils import runwareUtils as rwUtils
 
 
@@ -139,6 +137,10 @@ class RunwareAudioInference:
                 "providerSettings": ("RUNWAREPROVIDERSETTINGS", {
                     "tooltip": "Provider-specific configuration settings"
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             }
         }
 
@@ -157,7 +159,7 @@ class RunwareAudioInference:
             print(f"[DEBUG] Sending Audio Inference Request:")
             print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps(genConfig, indent=2)}")
             
-            genResult = rwUtils.inferenecRequest(genConfig)
+            genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
             
             # Debug: Print the response received
             print(f"[DEBUG] Received Audio Inference Response:")
@@ -171,85 +173,79 @@ class RunwareAudioInference:
         # Extract task UUID for polling
         taskUUID = genConfig[0]["taskUUID"]
         
-        # Poll for audio completion
-        while True:
-            # Check for interrupt before each poll
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            # Poll for audio result
-            pollResult = rwUtils.pollVideoResult(taskUUID)
-            print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
+        # Wait for audio completion
+        pollResult = rwUtils.waitForTaskResult(taskUUID)
+        print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
+        
+        # Check for errors first
+        if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+            error_info = pollResult["errors"][0]
+            error_message = error_info.get("message", "Unknown error")
             
-            # Check for errors first
-            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                error_info = pollResult["errors"][0]
-                error_message = error_info.get("message", "Unknown error")
+            # Extract more detailed error info if available
+            if "responseContent" in error_info:
+                response_content = error_info["responseContent"]
+                # Handle both string and dict response content
+                if isinstance(response_content, str):
+                    detailed_message = response_content
+                elif isinstance(response_content, dict):
+                    detailed_message = response_content.get("message", str(response_content))
+                else:
+                    detailed_message = str(response_content)
                 
-                # Extract more detailed error info if available
-                if "responseContent" in error_info:
-                    response_content = error_info["responseContent"]
-                    # Handle both string and dict response content
-                    if isinstance(response_content, str):
-                        detailed_message = response_content
-                    elif isinstance(response_content, dict):
-                        detailed_message = response_content.get("message", str(response_content))
-                    else:
-                        detailed_message = str(response_content)
-                    
-                    if detailed_message:
-                        error_message = f"{error_message}\nProvider Error: {detailed_message}"
-                
-                # Include taskUUID for debugging
-                task_uuid = error_info.get("taskUUID", "unknown")
-                raise Exception(f"Audio generation failed (Task: {task_uuid}): {error_message}")
+                if detailed_message:
+                    error_message = f"{error_message}\nProvider Error: {detailed_message}"
             
-            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                audioData = pollResult["data"][0]
+            # Include taskUUID for debugging
+            task_uuid = error_info.get("taskUUID", "unknown")
+            raise Exception(f"Audio generation failed (Task: {task_uuid}): {error_message}")
+        
+        if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+            audioData = pollResult["data"][0]
+            
+            # Check status directly
+            if "status" in audioData:
+                status = audioData["status"]
                 
-                # Check status directly
-                if "status" in audioData:
-                    status = audioData["status"]
+                if status == "success":
+                    audioUrls = self._extractAudioUrls(pollResult)
+                    hasAudio = len(audioUrls) > 0
+                    hasVideo = bool(audioData.get("videoURL") or audioData.get("videoBase64Data", False))
                     
-                    if status == "success":
-                        audioUrls = self._extractAudioUrls(pollResult)
-                        hasAudio = len(audioUrls) > 0
-                        hasVideo = bool(audioData.get("videoURL") or audioData.get("videoBase64Data", False))
-                        
-                        if hasAudio:
-                            audioObjects = []
-                            for audioUrl in audioUrls:
-                                audioObjects.append(self._downloadAndProcessAudio(audioUrl, params["sampleRate"], params["outputFormat"]))
-                            audioObj = self._mergeAudioObjects(audioObjects, params["sampleRate"])
-                            print(f"[DEBUG] Audio URL(s) found, returning batched audio. Count: {len(audioUrls)}")
-                            # Return empty video object when only audio is present (prevents errors in downstream nodes)
-                            emptyVideoObj = rwUtils.VideoObject("", width=0, height=0)
-                            return (audioObj, emptyVideoObj)
-                        
-                        if hasVideo:
-                            videos = rwUtils.convertVideoB64List(pollResult, width=None, height=None)
-                            print(f"[DEBUG] No audio URL in response, but video is present. Returning video.")
-                            # Extract first video object from tuple (ComfyUI expects single VideoObject, not tuple)
-                            if len(videos) > 0:
-                                # Return empty audio object when only video is present (prevents errors in downstream nodes)
-                                emptyAudioObj = {
-                                    "waveform": torch.zeros((1, 1, 1)),  # [batch, channels, samples]
-                                    "sample_rate": params["sampleRate"]
-                                }
-                                return (emptyAudioObj, videos[0])
-                            else:
-                                raise Exception("No video object found in response")
-                        
-                        raise Exception("No audio or video data received from API")
+                    if hasAudio:
+                        audioObjects = []
+                        for audioUrl in audioUrls:
+                            audioObjects.append(self._downloadAndProcessAudio(audioUrl, params["sampleRate"], params["outputFormat"]))
+                        audioObj = self._mergeAudioObjects(audioObjects, params["sampleRate"])
+                        if len(audioUrls) == 1 and audioUrls[0].startswith("http"):
+                            # Lets Media Upload reuse the hosted file instead of re-encoding the waveform.
+                            # Best effort: the generation already succeeded, so never fail the node here.
+                            try:
+                                rwUtils.registerMediaProvenance(audioObj["waveform"], audioUrls[0])
+                            except Exception as e:
+                                print(f"[Warning] Failed to register audio provenance: {e}")
+                        print(f"[DEBUG] Audio URL(s) found, returning batched audio. Count: {len(audioUrls)}")
+                        # Return empty video object when only audio is present (prevents errors in downstream nodes)
+                        emptyVideoObj = rwUtils.VideoObject("", width=0, height=0)
+                        return (audioObj, emptyVideoObj)
                     
-                    # If status is "processing", continue polling
-            
-            # Check for interrupt before waiting
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            # Wait before next poll (split into smaller chunks to allow more frequent interrupt checks)
-            for _ in range(10):  # 10 x 0.1 second = 1 second total
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                rwUtils.time.sleep(0.1)
+                    if hasVideo:
+                        videos = rwUtils.convertVideoB64List(pollResult, width=None, height=None)
+                        print(f"[DEBUG] No audio URL in response, but video is present. Returning video.")
+                        # Extract first video object from tuple (ComfyUI expects single VideoObject, not tuple)
+                        if len(videos) > 0:
+                            # Return empty audio object when only video is present (prevents errors in downstream nodes)
+                            emptyAudioObj = {
+                                "waveform": torch.zeros((1, 1, 1)),  # [batch, channels, samples]
+                                "sample_rate": params["sampleRate"]
+                            }
+                            return (emptyAudioObj, videos[0])
+                        else:
+                            raise Exception("No video object found in response")
+                    
+                    raise Exception("No audio or video data received from API")
+
+        raise Exception(f"Audio generation returned no audio (Task: {taskUUID}): {rwUtils.safe_json_dumps(pollResult)}")
 
     def _extractParameters(self, kwargs):
         """Extract and validate parameters from kwargs"""
@@ -497,15 +493,12 @@ class RunwareAudioInference:
     def _downloadAndProcessAudio(self, audioUrl, targetSampleRate, outputFormat):
         """Download audio file and process it for ComfyUI"""
         try:
-            response = requests.get(audioUrl, timeout=30)
-            response.raise_for_status()
-
             tempSuffix = self._inferAudioSuffix(audioUrl, outputFormat)
             with tempfile.NamedTemporaryFile(suffix=tempSuffix, delete=False) as tempFile:
-                tempFile.write(response.content)
                 tempFilePath = tempFile.name
             
             try:
+                rwUtils.getDownloadManager().download(audioUrl, tempFilePath, timeout=30, logPrefix="[Runware Audio Download]")
                 waveformNp, originalSampleRate = self._loadAudioFile(tempFilePath)
                 waveformNp = self._resampleAudio(waveformNp, originalSampleRate, targetSampleRate)
                 waveformTensor = self._convertToTensor(waveformNp)
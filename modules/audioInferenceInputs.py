@@ -141,7 +141,8 @@ class audioInferenceInputs:
         for i in range(1, self.MAX_REFERENCE_IMAGES + 1):
             image = kwargs.get(f"Reference Image {i}", None)
             if image is not None:
-                referenceImages.append(rwUtils.convertTensor2IMG(image))
+                referenceImages.append(image)
+        referenceImages = rwUtils.convertTensors2IMG(referenceImages, role="reference")
         if len(referenceImages) > 0:
             inputs["referenceImages"] = referenceImages
 
@@ -1,9 +1,44 @@
 from ..utils import runwareUtils as rwUtils
 from server import PromptServer
 from aiohttp import web
+import asyncio
 
 routes = PromptServer.instance.routes
 
+# Bridge routes wait on the Runware API; they must never block the ComfyUI server loop.
+DISCONNECT_POLL_INTERVAL = 0.25
+_bridgeSemaphore = None
+
+def _getBridgeSemaphore():
+    global _bridgeSemaphore
+    if _bridgeSemaphore is None:
+        _bridgeSemaphore = asyncio.Semaphore(rwUtils.getBridgeConcurrency())
+    return _bridgeSemaphore
+
+async def _limited(func, *args):
+    async with _getBridgeSemaphore():
+        return await func(*args)
+
+async def runBridged(reqPayload, func, *args):
+    """Await ``func(*args)`` under the bridge concurrency limit, cancelling it if the browser aborts the request."""
+    task = asyncio.ensure_future(_limited(func, *args))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            transport = reqPayload.transport
+            if transport is None or transport.is_closing():
+                print(f"[Runware] Client disconnected, cancelling {reqPayload.path} request")
+                task.cancel()
+                raise asyncio.CancelledError()
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+
+# Warm the model dropdowns before the first search
+rwUtils.prefetchModelSearch()
+
 @routes.post('/setAPIKey')
 async def setAPIKey(reqPayload):
     reqData = await reqPayload.json()
@@ -12,12 +47,14 @@ async def setAPIKey(reqPayload):
         return web.json_response({'success': False, 'error': 'Invalid API Key!'})
     try:
         apiKey = apiKey.strip()
-        apiCheckResult = rwUtils.checkAPIKey(apiKey)
+        apiCheckResult = await runBridged(reqPayload, rwUtils.runInBridgePool, rwUtils.checkAPIKey, apiKey)
         if(apiCheckResult == False):
             return web.json_response({'success': False, 'error': 'Failed To Set Your API Key, Please Try Again!'})
         elif(apiCheckResult != True):
             return web.json_response({'success': False, 'error': apiCheckResult})
-        rwUtils.setAPIKey(apiKey)
+        # Rewrites .env and reconnects the WebSocket client, so it runs off the server loop too
+        await runBridged(reqPayload, rwUtils.runInBridgePool, rwUtils.setAPIKey, apiKey)
+        rwUtils.prefetchModelSearch()
     except Exception as e:
         return web.json_response({'success': False, 'error': str(e)})
     return web.json_response({'success': True})
@@ -95,7 +132,7 @@ async def promptEnhance(reqPayload):
     }]
 
     try:
-        utilityResults = rwUtils.inferenecRequest(utilityConfig)
+        utilityResults = await runBridged(reqPayload, rwUtils.inferenecRequestAsync, utilityConfig)
     except Exception as e:
         return web.json_response({'success': False, 'error': str(e)})
     enhancedPrompt = utilityResults["data"][0]["text"]
@@ -110,33 +147,17 @@ async def modelSearch(reqPayload):
     modelType = reqData.get('modelType', "base")
     controlNetConditioning = reqData.get('condtioning', "all")
 
-    utilityConfig = [{
-        "taskType": "modelSearch",
-        "taskUUID": rwUtils.genRandUUID(),
-        "category": modelCategory,
-        "limit": 25,
-        "sort": "-downloadCount",
-    }]
-
-    aclTypes = ["controlnet", "lora", "lycoris", "embeddings", "vae"]
-
-    if(modelCategory not in aclTypes):
-        utilityConfig[0]["type"] = modelType
-    elif(modelCategory == "controlnet" and controlNetConditioning != "all"):
-        utilityConfig[0]["conditioning"] = controlNetConditioning
-    if(modelArch != "all"):
-        utilityConfig[0]["architecture"] = modelArch
-    if(modelQuery != ""):
-        utilityConfig[0]["search"] = modelQuery
-
     try:
-        utilityResults = rwUtils.inferenecRequest(utilityConfig)
+        searchResult = await runBridged(
+            reqPayload, rwUtils.searchModelsAsync,
+            modelQuery, modelCategory, modelArch, modelType, controlNetConditioning,
+        )
     except Exception as e:
         return web.json_response({'success': False, 'error': str(e)})
-    totalResults = utilityResults["data"][0]["totalResults"]
+    totalResults = searchResult["totalResults"]
     if(totalResults < 1):
         return web.json_response({'success': False, 'error': 'No Results Found!'})
-    results = utilityResults["data"][0].get("results", [])
+    results = searchResult.get("results", [])
     if not results:
         return web.json_response({'success': False, 'error': 'No Results Found!'})
     modelList = results
@@ -40,6 +40,10 @@ class imageCaptioning:
                     "placeholder": "Generated image caption will appear here automatically.",
                     "tooltip": "This field will be automatically populated with the generated image caption."
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             },
             "hidden": { "node_id": "UNIQUE_ID" }
         }
@@ -86,9 +90,7 @@ class imageCaptioning:
             actual_input_image = images_to_process[0]
         
         # Convert images to base64 format
-        converted_images = []
-        for img in images_to_process:
-            converted_images.append(rwUtils.convertTensor2IMG(img))
+        converted_images = rwUtils.convertTensors2IMG(images_to_process)
         
         # Create a dictionary with mandatory parameters
         task_params = {
@@ -118,7 +120,7 @@ class imageCaptioning:
 
         # Send the task with all applicable parameters
         genConfig = [task_params]
-        genResult = rwUtils.inferenecRequest(genConfig)
+        genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
         print(genResult)
         
         # Handle multiple results if multiple images were processed
@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 
 class txt2img:
@@ -212,6 +211,10 @@ class txt2img:
                 "advancedFeatures": ("RUNWAREIMAGEINFERENCEADVANCEDFEATURES", {
                     "tooltip": "Connect Runware Image  Advanced Feature Input to configure advancedFeatures: layerDiffuse (transparency), hiresFix (two-stage high-res), watermark, and regionalPrompting (per-region prompts and masks).",
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             }
         }
 
@@ -396,7 +399,7 @@ class txt2img:
             genConfig[0]["seedImage"] = seedImage
             genConfig[0]["strength"] = seedImageStrength
             if (maskImage is not None):
-                maskImage = rwUtils.convertTensor2IMG(maskImage)
+                maskImage = rwUtils.convertTensor2IMG(maskImage, role="mask")
                 genConfig[0]["maskImage"] = maskImage
                 if (enableMaskMargin):
                     genConfig[0]["maskMargin"] = maskImageMargin
@@ -458,7 +461,7 @@ class txt2img:
                 print(f"[DEBUG] Sending Image Inference Request:")
                 print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps(genConfig, indent=2)}")
                 
-                genResult = rwUtils.inferenecRequest(genConfig)
+                genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
                 
                 # Debug: Print the response received
                 print(f"[DEBUG] Received Image Inference Response:")
@@ -470,67 +473,54 @@ class txt2img:
             # Extract task UUID for polling (async delivery)
             taskUUID = genConfig[0]["taskUUID"]
             
-            # Poll for image completion
-            while True:
-                # Check for interrupt before each poll
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                
-                # Poll for image result
-                pollResult = rwUtils.pollVideoResult(taskUUID)  # Reuse pollVideoResult as it's generic
-                print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
-                
-                # Check for errors first
-                if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                    error_info = pollResult["errors"][0]
-                    error_message = error_info.get("message", "Unknown error")
-                    
-                    # Extract more detailed error info if available
-                    if "responseContent" in error_info:
-                        response_content = error_info["responseContent"]
-                        # Handle both string and dict response content
-                        if isinstance(response_content, str):
-                            detailed_message = response_content
-                        elif isinstance(response_content, dict):
-                            detailed_message = response_content.get("message", str(response_content))
-                        else:
-                            detailed_message = str(response_content)
-                        
-                        if detailed_message:
-                            error_message = f"{error_message}\nProvider Error: {detailed_message}"
-                    
-                    # Include taskUUID for debugging
-                    task_uuid = error_info.get("taskUUID", "unknown")
-                    raise Exception(f"Image generation failed (Task: {task_uuid}): {error_message}")
+            # Wait for image completion
+            pollResult = rwUtils.waitForTaskResult(taskUUID)
+            print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
+            
+            # Check for errors first
+            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+                error_info = pollResult["errors"][0]
+                error_message = error_info.get("message", "Unknown error")
                 
-                if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                    image_data = pollResult["data"][0]
+                # Extract more detailed error info if available
+                if "responseContent" in error_info:
+                    response_content = error_info["responseContent"]
+                    # Handle both string and dict response content
+                    if isinstance(response_content, str):
+                        detailed_message = response_content
+                    elif isinstance(response_content, dict):
+                        detailed_message = response_content.get("message", str(response_content))
+                    else:
+                        detailed_message = str(response_content)
                     
-                    # Check status directly
-                    if "status" in image_data:
-                        status = image_data["status"]
-                        
-                        if status == "success":
-                            # Check for image data (imageURL, imageBase64Data)
-                            if "imageURL" in image_data or "imageBase64Data" in image_data:
-                                # Extract URLs from all results
-                                image_urls = []
-                                
-                                for result in pollResult.get("data", []):
-                                    imageURL = result.get("imageURL")
-                                    if imageURL:
-                                        image_urls.append(imageURL)
-                                
-                                # Return URLs as comma-separated string (or single URL)
-                                image_url_str = ",".join(image_urls) if image_urls else ""
-                                
-                                return (image_url_str, None)
-                        
-                        # If status is "processing", continue polling
+                    if detailed_message:
+                        error_message = f"{error_message}\nProvider Error: {detailed_message}"
                 
-                # Check for interrupt before waiting
-                comfy.model_management.throw_exception_if_processing_interrupted()
+                # Include taskUUID for debugging
+                task_uuid = error_info.get("taskUUID", "unknown")
+                raise Exception(f"Image generation failed (Task: {task_uuid}): {error_message}")
+            
+            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+                image_data = pollResult["data"][0]
                 
-                # Wait before next poll (split into smaller chunks to allow more frequent interrupt checks)
-                for _ in range(10):  # 10 x 0.1 second = 1 second total
-                    comfy.model_management.throw_exception_if_processing_interrupted()
-                    rwUtils.time.sleep(0.1)
\ No newline at end of file
+                # Check status directly
+                if "status" in image_data:
+                    status = image_data["status"]
+                    
+                    if status == "success":
+                        # Check for image data (imageURL, imageBase64Data)
+                        if "imageURL" in image_data or "imageBase64Data" in image_data:
+                            # Extract URLs from all results
+                            image_urls = []
+                            
+                            for result in pollResult.get("data", []):
+                                imageURL = result.get("imageURL")
+                                if imageURL:
+                                    image_urls.append(imageURL)
+                            
+                            # Return URLs as comma-separated string (or single URL)
+                            image_url_str = ",".join(image_urls) if image_urls else ""
+                            
+                            return (image_url_str, None)
+
+            raise Exception(f"Image generation returned no image (Task: {taskUUID}): {rwUtils.safe_json_dumps(pollResult)}")
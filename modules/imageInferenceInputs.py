@@ -82,7 +82,7 @@ class imageInferenceInputs:
         if image is not None:
             inputs["image"] = rwUtils.convertTensor2IMG(image)
         if mask is not None:
-            inputs["mask"] = rwUtils.convertTensor2IMG(mask)
+            inputs["mask"] = rwUtils.convertTensor2IMG(mask, role="mask")
         if seedImage is not None:
             inputs["seedImage"] = rwUtils.convertTensor2IMG(seedImage)
 
@@ -129,15 +129,16 @@ class imageInferenceInputs:
             for _, _, _, rt, _ in reference_slots
         )
 
+        converted = rwUtils.convertTensors2IMG(
+            [image for image, _, _, _, _ in reference_slots], role="reference"
+        )
+
         if not has_tags and not has_roles and not has_type:
-            return [
-                rwUtils.convertTensor2IMG(image)
-                for image, _, _, _, _ in reference_slots
-            ]
+            return converted
 
         references = []
-        for image, tag, role, ref_type, strength in reference_slots:
-            entry = {"image": rwUtils.convertTensor2IMG(image)}
+        for image, (_, tag, role, ref_type, strength) in zip(converted, reference_slots):
+            entry = {"image": image}
             if isinstance(tag, str) and tag.strip() != "":
                 entry["tag"] = tag.strip()
             if isinstance(role, str) and role.strip() != "":
@@ -156,5 +157,5 @@ class imageInferenceInputs:
         for i in range(1, self.MAX_SUPER_RESOLUTION_REFERENCE_IMAGES + 1):
             image = kwargs.get(f"Super Resolution Reference Image {i}", None)
             if image is not None:
-                images.append(rwUtils.convertTensor2IMG(image))
-        return images
+                images.append(image)
+        return rwUtils.convertTensors2IMG(images, role="reference")
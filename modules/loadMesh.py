@@ -1,5 +1,7 @@
 import base64
 import os
+from .utils import runwareUtils as rwUtils
+from .mediaUpload import RunwareMediaUpload
 
 
 class RunwareLoadMesh:
@@ -18,15 +20,28 @@ class RunwareLoadMesh:
                     "tooltip": "Full path to .glb or .ply file. Use this to load from any directory.",
                 }),
             },
+            "optional": {
+                "mode": (["Base64", "Upload"], {
+                    "default": "Base64",
+                    "tooltip": "Base64 embeds the mesh in the request as a data URI. Upload streams it to Runware media storage once and outputs the mediaUUID, reused while the file is unchanged. Use Upload for large meshes.",
+                }),
+            },
         }
 
     RETURN_TYPES = ("STRING",)
     RETURN_NAMES = ("Base64",)
     FUNCTION = "load_mesh"
     CATEGORY = "Runware"
-    DESCRIPTION = "Load a 3D model file from a path or entering a path. Base64 encodes and outputs as data URI. Connect to Runware 3D Inference Inputs meshFile."
+    DESCRIPTION = "Load a 3D model file from a path or entering a path. Outputs a Base64 data URI, or in Upload mode the mediaUUID of the uploaded file. Connect to Runware 3D Inference Inputs meshFile."
 
-    def load_mesh(self, file_path):
+    @classmethod
+    def IS_CHANGED(cls, file_path, mode="Base64"):
+        full_path = os.path.expanduser((file_path or "").strip()) if isinstance(file_path, str) else ""
+        if not full_path or not os.path.isfile(full_path):
+            return ""
+        return f"{mode}:{rwUtils.fingerprintFile(full_path)}"
+
+    def load_mesh(self, file_path, mode="Base64"):
         path = (file_path or "").strip() if isinstance(file_path, str) else ""
         if not path:
             return ("",)
@@ -40,6 +55,13 @@ class RunwareLoadMesh:
             raise FileNotFoundError(
                 f"Runware Load Mesh: file not found: {full_path}"
             )
+        if mode == "Upload":
+            # Streamed in chunks, and skipped entirely when this content was uploaded before
+            mesh_uuid = RunwareMediaUpload().uploadWithCache(
+                rwUtils.fingerprintFile(full_path),
+                lambda: rwUtils.StreamedBase64(full_path),
+            )
+            return (mesh_uuid,)
         with open(full_path, 'rb') as f:
             mesh_bytes = f.read()
         mesh_base64 = base64.b64encode(mesh_bytes).decode('utf-8')
@@ -1,6 +1,5 @@
 import base64
 import os
-import time
 import torch
 import soundfile as sf
 import numpy as np
@@ -9,10 +8,16 @@ from .utils.runwareUtils import (
     RUNWARE_API_BASE_URL,
     genRandUUID,
     inferenecRequest,
-    pollVideoResult,
+    waitForTaskResult,
     sanitize_for_logging,
     safe_json_dumps,
     sendMediaUUID,
+    fingerprintArray,
+    fingerprintBytes,
+    fingerprintFile,
+    lookupMediaProvenance,
+    StreamedBase64,
+    getMediaStore,
 )
 
 
@@ -60,8 +65,14 @@ class RunwareMediaUpload:
     OUTPUT_NODE = True
 
     @classmethod
-    def IS_CHANGED(cls, **kwargs):
-        return float("NAN")
+    def IS_CHANGED(cls, media=None, **kwargs):
+        # Keyed on the media content, not the mediaUUID widget this node rewrites itself
+        if media is None:
+            return ""
+        try:
+            return lookupMediaProvenance(media) or cls()._fingerprintMedia(media)
+        except Exception:
+            return float("NAN")
 
     def uploadMedia(self, media=None, mediaUuid=None, **kwargs):
         """Main function to upload media and return mediaUUID"""
@@ -71,10 +82,16 @@ class RunwareMediaUpload:
         print(f"[Debug] uploadMedia called with media: {type(media)}, mediaUuid: {mediaUuid}")
         
         try:
-            mediaBase64 = self._convertMediaToBase64(media)
-            print(f"[Debug] Media converted to base64, length: {len(mediaBase64)}")
-            
-            mediaUuid = self._uploadToRunware(mediaBase64)
+            reference = lookupMediaProvenance(media)
+            if reference and not reference.startswith("http"):
+                # Output of another Runware node that already has a mediaUUID
+                print(f"[Debug] Reusing existing mediaUUID: {reference}")
+                mediaUuid = reference
+            elif reference:
+                # Hosted on Runware: let the API fetch the URL instead of downloading and re-encoding it here
+                mediaUuid = self.uploadWithCache(f"url:{reference}", lambda: reference)
+            else:
+                mediaUuid = self.uploadWithCache(self._fingerprintMedia(media), lambda: self._convertMediaToBase64(media))
             print(f"[Debug] Upload completed! MediaUUID: {mediaUuid}")
             print(f"[Debug] ===== RESULT: {mediaUuid} =====")
             
@@ -97,27 +114,62 @@ class RunwareMediaUpload:
         else:
             raise ValueError(f"Unsupported media type: {type(mediaTensor)}")
 
+    def uploadWithCache(self, fingerprint, buildPayload):
+        """Return the stored mediaUUID for ``fingerprint``, uploading ``buildPayload()`` on a miss"""
+        print(f"[Debug] Media fingerprint: {fingerprint}")
+        try:
+            cachedUuid = getMediaStore().get(fingerprint)
+        except Exception as e:
+            print(f"[Debug] Media cache lookup failed: {e}")
+            cachedUuid = None
+        if cachedUuid:
+            print(f"[Debug] Reusing cached mediaUUID: {cachedUuid}")
+            return cachedUuid
+
+        mediaPayload = buildPayload()
+        print(f"[Debug] Media payload ready, base64 length: {len(mediaPayload)}")
+        mediaUuid = self._uploadToRunware(mediaPayload)
+        try:
+            getMediaStore().set(fingerprint, mediaUuid)
+        except Exception as e:
+            print(f"[Debug] Failed to cache mediaUUID: {e}")
+        return mediaUuid
+
+    def _fingerprintMedia(self, mediaTensor):
+        """Content fingerprint of the media source: file bytes for video, samples and rate for audio"""
+        if self._isVideoFile(mediaTensor):
+            videoUrl = getattr(mediaTensor, 'video_url', None)
+            if isinstance(videoUrl, str) and videoUrl.startswith("data:"):
+                return fingerprintBytes(videoUrl.encode('utf-8'))
+            return fingerprintFile(self._extractVideoPath(self._getVideoFilePath(mediaTensor)))
+        if isinstance(mediaTensor, dict) and 'waveform' in mediaTensor:
+            waveform = mediaTensor['waveform']
+            sampleRate = mediaTensor.get('sample_rate', self.DEFAULT_SAMPLE_RATE)
+        else:
+            waveform = mediaTensor
+            sampleRate = self.DEFAULT_SAMPLE_RATE
+        return fingerprintArray(self._prepareWaveformNumpy(waveform), sampleRate)
+
     def _isVideoFile(self, mediaTensor):
         """Check if media tensor is a VideoFromFile object"""
         return (hasattr(mediaTensor, 'video_path') or 
                 str(type(mediaTensor)).find('VideoFromFile') != -1)
 
     def _convertVideoToBase64(self, videoTensor):
-        """Convert video file to base64 data URI"""
+        """Convert video file to a streamed base64 payload (the file is never loaded whole)"""
         print(f"[Debug] VideoFromFile object detected")
 
+        videoUrl = getattr(videoTensor, 'video_url', None)
+        if isinstance(videoUrl, str) and videoUrl.startswith("data:"):
+            # Base64 result from a Runware node is already a data URI
+            return videoUrl
+
         videoFile = self._getVideoFilePath(videoTensor)
         videoPath = self._extractVideoPath(videoFile)
 
-        print(f"[Debug] Processing video file: {videoPath}")
+        print(f"[Debug] Processing video file: {videoPath} ({self._getMimeType(videoPath)})")
 
-        with open(videoPath, 'rb') as f:
-            videoBytes = f.read()
-
-        mimeType = self._getMimeType(videoPath)
-        videoBase64 = base64.b64encode(videoBytes).decode('utf-8')
-
-        return f"data:{mimeType};base64,{videoBase64}"
+        return StreamedBase64(videoPath)
 
     def _getVideoFilePath(self, videoTensor):
         """Extract video file path from VideoFromFile object"""
@@ -221,7 +273,7 @@ class RunwareMediaUpload:
 
     def _stripDataUriPrefix(self, mediaDataUri):
         """Strip data URI prefix if present"""
-        if mediaDataUri.startswith("data:"):
+        if isinstance(mediaDataUri, str) and mediaDataUri.startswith("data:"):
             mediaData = mediaDataUri.split(",", 1)[1]
             print(f"[Debug] Stripped data URI prefix, media data length: {len(mediaData)}")
             return mediaData
@@ -250,32 +302,33 @@ class RunwareMediaUpload:
             raise Exception(f"Upload failed: {uploadResult}")
 
     def _pollForResult(self, taskUuid):
-        """Poll for media upload result"""
-        for attempt in range(self.MAX_POLL_ATTEMPTS):
-            try:
-                print(f"[Debug] Poll attempt {attempt + 1}/{self.MAX_POLL_ATTEMPTS}")
-
-                pollResult = pollVideoResult(taskUuid)
-                pollData = self._parsePollResponse(pollResult)
-                
-                if pollData:
-                    mediaUuid = pollData.get("mediaUUID", "")
-                    if mediaUuid == "1":
-                        print(f"[Debug] Still processing... attempt {attempt + 1}")
-                        time.sleep(self.POLL_INTERVAL)
-                        continue
-                    elif mediaUuid and mediaUuid != "1":
-                        print(f"[Debug] Upload completed! MediaUUID: {mediaUuid}")
-                        return mediaUuid
-                
-                print(f"[Debug] Attempt {attempt + 1}: No data in response, continuing...")
-                time.sleep(self.POLL_INTERVAL)
-            except Exception as e:
-                print(f"[Debug] Poll attempt {attempt + 1} failed: {str(e)}")
-                time.sleep(self.POLL_INTERVAL)
-                continue
-        
-        raise Exception("Polling timeout - upload did not complete")
+        """Wait for the media upload result from the shared task watcher"""
+        try:
+            pollResult = waitForTaskResult(
+                taskUuid,
+                isComplete=self._isUploadComplete,
+                timeout=self.MAX_POLL_ATTEMPTS * self.POLL_INTERVAL,
+            )
+        except TimeoutError:
+            raise Exception("Polling timeout - upload did not complete")
+
+        pollData = self._parsePollResponse(pollResult)
+        mediaUuid = pollData.get("mediaUUID", "") if pollData else ""
+        if not mediaUuid or mediaUuid == "1":
+            raise Exception(f"Upload failed: {pollResult}")
+        print(f"[Debug] Upload completed! MediaUUID: {mediaUuid}")
+        return mediaUuid
+
+    @staticmethod
+    def _isUploadComplete(pollResult):
+        """Upload is done once a real mediaUUID ("1" means still processing) or an error is reported"""
+        if not isinstance(pollResult, dict):
+            return False
+        if pollResult.get("errors"):
+            return True
+        pollData = (pollResult.get("data") or [{}])[0]
+        mediaUuid = pollData.get("mediaUUID", "")
+        return bool(mediaUuid) and mediaUuid != "1"
 
     def _parsePollResponse(self, pollResult):
         """Parse polling response"""
@@ -147,13 +147,10 @@ class photoMaker:
         seed = kwargs.get("seed")
         batchSize = kwargs.get("batchSize", 1)
 
-        imageList = [rwUtils.convertTensor2IMG(image1)]
-        if (image2 is not None):
-            imageList.append(rwUtils.convertTensor2IMG(image2))
-        if (image3 is not None):
-            imageList.append(rwUtils.convertTensor2IMG(image3))
-        if (image4 is not None):
-            imageList.append(rwUtils.convertTensor2IMG(image4))
+        imageList = rwUtils.convertTensors2IMG(
+            [image for image in (image1, image2, image3, image4) if image is not None],
+            role="reference",
+        )
 
         genConfig = [
             {
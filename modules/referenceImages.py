@@ -34,17 +34,20 @@ class referenceImages:
 
     def referenceImages(self, **kwargs):
         """Collect and convert reference images to list"""
-        imageList = []
+        tensors = []
         
         # Always include Image 1 (required)
         image1 = kwargs.get("Image 1")
         if image1 is not None:
-            imageList.append(rwUtils.convertTensor2IMG(image1))
+            tensors.append(image1)
         
         # Add optional images 2 through MAX_IMAGES
         for i in range(2, self.MAX_IMAGES + 1):
             image = kwargs.get(f"Image {i}", None)
             if image is not None:
-                imageList.append(rwUtils.convertTensor2IMG(image))
+                tensors.append(image)
+
+        # Encode all references in parallel, keeping slot order
+        imageList = rwUtils.convertTensors2IMG(tensors, role="reference")
 
         return (imageList,)
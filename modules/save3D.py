@@ -2,7 +2,6 @@ from .utils import runwareUtils as rwUtils
 import folder_paths
 import os
 import re
-import requests
 from datetime import datetime
 
 
@@ -69,50 +68,18 @@ class RunwareSave3D:
         filename = f"{safe_prefix}_{timestamp}.{extension}"
         filepath = os.path.join(threed_output_dir, filename)
 
-        # Download with retry logic
-        max_retries = 10
-        retry_delays = [2, 5, 10, 15, 20]
+        # Download through the shared pooled downloader (handles 422/502 retries)
+        try:
+            rwUtils.getDownloadManager().download(file_url, filepath, timeout=60, logPrefix="[Runware Save 3D]")
+        except Exception as e:
+            raise Exception(f"Failed to download 3D file: {e}")
 
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(file_url, stream=True, timeout=60)
-                print(f"[Runware Save 3D] Download attempt {attempt + 1}: {response.status_code}")
+        print(f"[Runware Save 3D] Successfully saved to: {filepath}")
 
-                if response.status_code == 422:
-                    print(f"[Runware Save 3D] Server still processing, waiting...")
-                    rwUtils.time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
+        # Send filepath to UI (like media upload mediaUUID)
+        rwUtils.sendSave3DFilepath(filepath, kwargs.get("node_id"))
 
-                if response.status_code == 502:
-                    print(f"[Runware Save 3D] Server error (502), retrying...")
-                    rwUtils.time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
-
-                response.raise_for_status()
-
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                print(f"[Runware Save 3D] Successfully saved to: {filepath}")
-
-                # Send filepath to UI (like media upload mediaUUID)
-                rwUtils.sendSave3DFilepath(filepath, kwargs.get("node_id"))
-
-                return {"result": (filepath,), "ui": {"text": (f"Saved: {filename}",)}}
-
-            except requests.exceptions.RequestException as e:
-                print(f"[Runware Save 3D] Attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    rwUtils.time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
-                else:
-                    raise Exception(f"Failed to download 3D file after {max_retries} attempts: {e}")
-            except Exception as e:
-                print(f"[Runware Save 3D] Unexpected error: {e}")
-                raise Exception(f"Failed to save 3D file: {e}")
-
-        raise Exception("Failed to download 3D file: max retries exceeded")
+        return {"result": (filepath,), "ui": {"text": (f"Saved: {filename}",)}}
 
 
 NODE_CLASS_MAPPINGS = {
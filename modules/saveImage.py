@@ -1,11 +1,10 @@
 import folder_paths
 import os
-import io
-import requests
 import torch
 import numpy as np
-from PIL import Image
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from .utils import runwareUtils as rwUtils
 
 
 def _is_svg_url(url: str) -> bool:
@@ -16,9 +15,7 @@ def _is_svg_url(url: str) -> bool:
 
 def _bytes_to_image_tensor(img_data: bytes):
     """Decode image bytes to ComfyUI IMAGE tensor [1, H, W, C] float32 0-1. Fails on SVG (use placeholder for SVG)."""
-    pil = Image.open(io.BytesIO(img_data)).convert("RGB")
-    arr = np.array(pil).astype(np.float32) / 255.0
-    return torch.from_numpy(arr).unsqueeze(0)
+    return rwUtils.decodeImagesToTensor([img_data], mode="RGB")
 
 
 def _placeholder_image_tensor():
@@ -72,20 +69,11 @@ class RunwareSaveImage:
             output_dir = folder_paths.get_temp_directory()
             file_type = "temp"
 
-        saved_files = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        tensors = []
 
-        for i, image_url in enumerate(image_urls):
-            response = requests.get(image_url, timeout=30)
-            response.raise_for_status()
-            img_data = response.content
-
-            # SVG (e.g. from Runware Vectorize) cannot be opened by PIL; save as file and use placeholder tensor
-            if _is_svg_url(image_url):
-                tensors.append(_placeholder_image_tensor())
-            else:
-                tensors.append(_bytes_to_image_tensor(img_data))
+        def fetch_and_save(indexed_url):
+            i, image_url = indexed_url
+            img_data = rwUtils.getDownloadManager().fetch(image_url, timeout=30, logPrefix="[Runware Save Image]")
 
             url_without_params = image_url.split("?")[0]
             ext = url_without_params.split(".")[-1].lstrip(".").lower() or "png"
@@ -100,11 +88,29 @@ class RunwareSaveImage:
                 f.write(img_data)
             print(f"[Runware] {'Saved' if saveImage else 'Preview'}: {filepath}")
 
-            saved_files.append({
+            return img_data, {
                 "filename": filename,
                 "subfolder": "",
                 "type": file_type
-            })
+            }
+
+        # Fetch and write every URL concurrently; map() keeps the original order.
+        workers = max(1, min(len(image_urls), rwUtils.getDownloadConcurrency()))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="RunwareSaveImage") as pool:
+            results = list(pool.map(fetch_and_save, enumerate(image_urls)))
+            images_data = [img_data for img_data, _ in results]
+            saved_files = [saved_file for _, saved_file in results]
+
+            # SVG (e.g. from Runware Vectorize) cannot be opened by PIL; save as file and use placeholder tensor
+            if any(_is_svg_url(image_url) for image_url in image_urls):
+                image_batch = torch.cat([
+                    _placeholder_image_tensor() if _is_svg_url(image_url) else _bytes_to_image_tensor(img_data)
+                    for image_url, img_data in zip(image_urls, images_data)
+                ], dim=0)
+            else:
+                # Raster batches decode straight into one preallocated tensor, slices filled in parallel.
+                image_batch = rwUtils.decodeImagesToTensor(images_data, mode="RGB", pool=pool)
+                # Downstream Runware nodes can send these URLs instead of re-uploading the pixels
+                rwUtils.registerDecodedProvenance(image_batch, images_data, image_urls, mode="RGB", pool=pool)
 
-        image_batch = torch.cat(tensors, dim=0)
         return {"result": (image_batch,), "ui": {"images": saved_files}}
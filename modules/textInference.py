@@ -31,6 +31,10 @@ class RunwareTextInference:
                 "inputs": ("RUNWARETEXTINFERENCEINPUTS", {
                     "tooltip": "Connect Runware Text Inference Inputs for inputs.images / inputs.videos (URLs or mediaUUIDs).",
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             },
         }
 
@@ -111,7 +115,7 @@ class RunwareTextInference:
         gen_config = [task]
         print(f"[Runware Text Inference] Request: {rwUtils.safe_json_dumps(gen_config, indent=2)}")
 
-        gen_result = rwUtils.inferenecRequest(gen_config)
+        gen_result = rwUtils.inferenecRequest(gen_config, bypassResultCache=kwargs.get("bypassResultCache", False))
         print(f"[Runware Text Inference] Response: {rwUtils.safe_json_dumps(gen_result, indent=2)}")
 
         return (self._finalize_text(gen_result),)
@@ -37,12 +37,13 @@ class RunwareTextInferenceInputsImages:
     )
 
     def createImages(self, **kwargs) -> Tuple[Dict[str, Any], ...]:
-        urls: List[str] = []
+        tensors = []
         for i in range(1, self._MAX_IMAGES + 1):
             tensor = kwargs.get(f"Image {i}", None)
             if tensor is None:
                 continue
-            urls.append(rwUtils.convertTensor2IMG(tensor))
+            tensors.append(tensor)
+        urls: List[str] = rwUtils.convertTensors2IMG(tensors)
 
         if not urls:
             return ({},)
@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 
 class threeDInference:
@@ -67,6 +66,16 @@ class threeDInference:
     RETURN_NAMES = ("3dObject",)
     CATEGORY = "Runware"
 
+    @staticmethod
+    def _isResultReady(pollResult):
+        """3D results may report output files before (or without) a terminal status."""
+        if not isinstance(pollResult, dict):
+            return False
+        if rwUtils.isTaskResultComplete(pollResult):
+            return True
+        data = pollResult.get("data") or [{}]
+        return len(data[0].get("outputs", {}).get("files", [])) > 0
+
     def generate3D(self, **kwargs):
         """Generate 3D model from inputs"""
         model = kwargs.get("Model", "meta:sam@3d")
@@ -132,71 +141,60 @@ class threeDInference:
         # Extract task UUID for polling
         taskUUID = genConfig[0]["taskUUID"]
 
-        # Poll for 3D generation completion
-        while True:
-            # Check for interrupt before each poll
-            comfy.model_management.throw_exception_if_processing_interrupted()
-
-            # Poll for result
-            pollResult = rwUtils.pollVideoResult(taskUUID)  # Reuse existing poll function
-            print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
-
-            # Check for errors
-            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                error_info = pollResult["errors"][0]
-                error_message = error_info.get("message", "Unknown error")
-
-                if "responseContent" in error_info:
-                    response_content = error_info["responseContent"]
-                    if isinstance(response_content, str):
-                        detailed_message = response_content
-                    elif isinstance(response_content, dict):
-                        detailed_message = response_content.get("message", str(response_content))
-                    else:
-                        detailed_message = str(response_content)
-
-                    if detailed_message:
-                        error_message = f"{error_message}\nProvider Error: {detailed_message}"
-
-                task_uuid = error_info.get("taskUUID", "unknown")
-                raise Exception(f"3D generation failed (Task: {task_uuid}): {error_message}")
-
-            # Check for successful completion
-            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                data = pollResult["data"][0]
-
-                # Check if outputs.files exists (3D inference response format)
-                outputs = data.get("outputs", {})
-                files = outputs.get("files", [])
-
-                if len(files) > 0:
-                    file_info = files[0]
-                    file_url = file_info.get("url", "")
-
-                    if file_url:
-                        print(f"[3D Inference] Generated 3D file URL: {file_url}")
-                        return (file_url,)
-
-                # Check status if available
-                if "status" in data:
-                    status = data["status"]
-                    if status == "success":
-                        # Try alternative response format
-                        if "outputs" in data and "files" in data["outputs"]:
-                            files = data["outputs"]["files"]
-                            if len(files) > 0:
-                                file_url = files[0].get("url", "")
-                                if file_url:
-                                    print(f"[3D Inference] Generated 3D file URL: {file_url}")
-                                    return (file_url,)
-
-            # Check for interrupt before waiting
-            comfy.model_management.throw_exception_if_processing_interrupted()
-
-            # Wait before next poll
-            for _ in range(10):  # 10 x 0.1 second = 1 second total
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                rwUtils.time.sleep(0.1)
+        # Wait for 3D generation completion
+        pollResult = rwUtils.waitForTaskResult(taskUUID, isComplete=self._isResultReady)
+        print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
+
+        # Check for errors
+        if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+            error_info = pollResult["errors"][0]
+            error_message = error_info.get("message", "Unknown error")
+
+            if "responseContent" in error_info:
+                response_content = error_info["responseContent"]
+                if isinstance(response_content, str):
+                    detailed_message = response_content
+                elif isinstance(response_content, dict):
+                    detailed_message = response_content.get("message", str(response_content))
+                else:
+                    detailed_message = str(response_content)
+
+                if detailed_message:
+                    error_message = f"{error_message}\nProvider Error: {detailed_message}"
+
+            task_uuid = error_info.get("taskUUID", "unknown")
+            raise Exception(f"3D generation failed (Task: {task_uuid}): {error_message}")
+
+        # Check for successful completion
+        if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+            data = pollResult["data"][0]
+
+            # Check if outputs.files exists (3D inference response format)
+            outputs = data.get("outputs", {})
+            files = outputs.get("files", [])
+
+            if len(files) > 0:
+                file_info = files[0]
+                file_url = file_info.get("url", "")
+
+                if file_url:
+                    print(f"[3D Inference] Generated 3D file URL: {file_url}")
+                    return (file_url,)
+
+            # Check status if available
+            if "status" in data:
+                status = data["status"]
+                if status == "success":
+                    # Try alternative response format
+                    if "outputs" in data and "files" in data["outputs"]:
+                        files = data["outputs"]["files"]
+                        if len(files) > 0:
+                            file_url = files[0].get("url", "")
+                            if file_url:
+                                print(f"[3D Inference] Generated 3D file URL: {file_url}")
+                                return (file_url,)
+
+        raise Exception(f"3D generation returned no file (Task: {taskUUID}): {rwUtils.safe_json_dumps(pollResult)}")
 
 
 NODE_CLASS_MAPPINGS = {
@@ -50,16 +50,17 @@ class threeDInferenceInputs:
             inputs["image"] = rwUtils.convertTensor2IMG(image)
 
         if mask is not None:
-            inputs["mask"] = rwUtils.convertTensor2IMG(mask)
+            inputs["mask"] = rwUtils.convertTensor2IMG(mask, role="mask")
 
         if mesh_file and isinstance(mesh_file, str) and mesh_file.strip():
             inputs["meshFile"] = mesh_file.strip()
 
-        images_list: list = []
+        image_slots: list = []
         for i in range(1, _IMAGE_SLOTS + 1):
             slot = kwargs.get(f"Images {i}")
             if slot is not None:
-                images_list.append(rwUtils.convertTensor2IMG(slot))
+                image_slots.append(slot)
+        images_list = rwUtils.convertTensors2IMG(image_slots)
         if images_list:
             inputs["images"] = images_list
 
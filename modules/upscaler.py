@@ -144,6 +144,10 @@ class upscaler:
                 "imageUpscalerSettings": ("RUNWAREIMAGEUPSCALERSETTINGS", {
                     "tooltip": "Connect Runware Image Upscaler Settings for settings.enhanceDetails and settings.realism.",
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             },
         }
 
@@ -278,7 +282,7 @@ class upscaler:
         print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps([genConfig], indent=2)}", flush=True)
         
         try:
-            genResult = rwUtils.inferenecRequest([genConfig])
+            genResult = rwUtils.inferenecRequest([genConfig], bypassResultCache=kwargs.get("bypassResultCache", False))
             
             # Debug: Print the response received
             print(f"[DEBUG] Received Image Upscale Response:", flush=True)
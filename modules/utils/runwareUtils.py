@@ -1,6 +1,6 @@
-from comfy.model_management import InterruptProcessingException
+from comfy.model_management import InterruptProcessingException, throw_exception_if_processing_interrupted
 from requests.adapters import HTTPAdapter
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from server import PromptServer
 from dotenv import load_dotenv
 from pathlib import Path
@@ -18,11 +18,37 @@ import json
 import os
 import io
 import threading
+import concurrent.futures
 import re
+import queue
+import itertools
+import sqlite3
+import mmap
+import shutil
+import weakref
+import copy
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qs
 
 from websockets.sync.client import connect as ws_connect
+from websockets.asyncio.client import connect as ws_connect_async
 from websockets.exceptions import ConnectionClosed, WebSocketException
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
 from ..version import __version__
 
 load_dotenv()
@@ -45,12 +71,13 @@ def getRunwareApiHeaders(include_auth=True):
     return headers
 
 BASEFOLDER = Path(__file__).parent.parent.parent
-IMAGE_CACHE_FILE = BASEFOLDER / "imagesCache.json"
-
-if not IMAGE_CACHE_FILE.exists():
-    with open(IMAGE_CACHE_FILE, "w") as f:
-        print("[Runware] Initializing images cache...")
-        json.dump({}, f)
+IMAGE_CACHE_FILE = BASEFOLDER / "imagesCache.json"  # legacy store, migrated into IMAGE_CACHE_DB
+IMAGE_CACHE_DB = BASEFOLDER / "runwareCache.db"
+IMAGE_CACHE_TTL = 30 * 24 * 60 * 60
+MEDIA_CACHE_TTL = 30 * 24 * 60 * 60
+RESULT_CACHE_DIR = BASEFOLDER / "resultCache"
+RESULT_CACHE_MAX_ENTRIES = 5000
+IMAGE_CACHE_SWEEP_INTERVAL = 60 * 60
 
 RUNWARE_REMBG_OUTPUT_FORMATS = {
     "outputFormat": (
@@ -59,11 +86,43 @@ RUNWARE_REMBG_OUTPUT_FORMATS = {
     )
 }
 
+# Upload encoder formats and their data URI mime types. Masks must survive the
+# round trip bit-exact, so they are always PNG whatever the configured format.
+IMAGE_ENCODE_FORMATS = {"PNG": "image/png", "WEBP": "image/webp", "JPEG": "image/jpeg"}
+LOSSLESS_ENCODE_ROLES = {"mask"}
+
 MAX_RETRIES = 4
 RETRY_COOLDOWNS = [1, 2, 5, 10]
 
+def getHttpPoolSize():
+    pool_size = os.getenv("RUNWARE_HTTP_POOL_SIZE")
+    if pool_size and pool_size.isdigit() and int(pool_size) > 0:
+        return int(pool_size)
+    else:
+        pool_size = 10
+        os.environ["RUNWARE_HTTP_POOL_SIZE"] = str(pool_size)
+        return pool_size
+
+def getHttpKeepAlive():
+    keep_alive = os.getenv("RUNWARE_HTTP_KEEPALIVE")
+    if keep_alive and keep_alive.isdigit():
+        return int(keep_alive)
+    else:
+        keep_alive = 60
+        os.environ["RUNWARE_HTTP_KEEPALIVE"] = str(keep_alive)
+        return keep_alive
+
+def getHttpTransport():
+    transport = os.getenv("RUNWARE_HTTP_TRANSPORT")
+    if transport and transport.lower() in ["requests", "httpx"]:
+        return transport.lower()
+    else:
+        transport = "requests"
+        os.environ["RUNWARE_HTTP_TRANSPORT"] = transport
+        return transport
+
 session = requests.Session()
-adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+adapter = HTTPAdapter(pool_connections=10, pool_maxsize=getHttpPoolSize())
 session.mount("http://", adapter)
 session.mount("https://", adapter)
 
@@ -167,6 +226,162 @@ def getEnableImagesCaching():
         os.environ["RUNWARE_ENABLE_IMAGES_CACHING"] = str(enable_images_caching)
         return enable_images_caching
 
+def getImageEncodeFormat(role="image"):
+    if role in LOSSLESS_ENCODE_ROLES:
+        return "PNG"
+    role_format = os.getenv(f"RUNWARE_IMAGE_ENCODE_FORMAT_{role.upper()}")
+    if role_format and role_format.upper() in IMAGE_ENCODE_FORMATS:
+        return role_format.upper()
+    encode_format = os.getenv("RUNWARE_IMAGE_ENCODE_FORMAT")
+    if encode_format and encode_format.upper() in IMAGE_ENCODE_FORMATS:
+        return encode_format.upper()
+    else:
+        encode_format = "PNG"
+        os.environ["RUNWARE_IMAGE_ENCODE_FORMAT"] = encode_format
+        return encode_format
+
+def getPngCompressLevel():
+    compress_level = os.getenv("RUNWARE_PNG_COMPRESS_LEVEL")
+    if compress_level and compress_level.isdigit() and int(compress_level) <= 9:
+        return int(compress_level)
+    else:
+        compress_level = 6
+        os.environ["RUNWARE_PNG_COMPRESS_LEVEL"] = str(compress_level)
+        return compress_level
+
+def getJpegQuality():
+    jpeg_quality = os.getenv("RUNWARE_JPEG_QUALITY")
+    if jpeg_quality and jpeg_quality.isdigit() and 1 <= int(jpeg_quality) <= 100:
+        return int(jpeg_quality)
+    else:
+        jpeg_quality = 95
+        os.environ["RUNWARE_JPEG_QUALITY"] = str(jpeg_quality)
+        return jpeg_quality
+
+def getImageEncodeWorkers():
+    encode_workers = os.getenv("RUNWARE_IMAGE_ENCODE_WORKERS")
+    if encode_workers and encode_workers.isdigit() and int(encode_workers) > 0:
+        return int(encode_workers)
+    else:
+        encode_workers = min(4, os.cpu_count() or 1)
+        os.environ["RUNWARE_IMAGE_ENCODE_WORKERS"] = str(encode_workers)
+        return encode_workers
+
+def getImageCacheMaxEntries():
+    max_entries = os.getenv("RUNWARE_IMAGE_CACHE_MAX_ENTRIES")
+    if max_entries and max_entries.isdigit() and int(max_entries) > 0:
+        return int(max_entries)
+    else:
+        max_entries = 50000
+        os.environ["RUNWARE_IMAGE_CACHE_MAX_ENTRIES"] = str(max_entries)
+        return max_entries
+
+def getTensorMemoMaxBytes():
+    max_bytes = os.getenv("RUNWARE_TENSOR_MEMO_MAX_BYTES")
+    if max_bytes and max_bytes.isdigit():
+        return int(max_bytes)
+    else:
+        max_bytes = 256 * 1024 * 1024
+        os.environ["RUNWARE_TENSOR_MEMO_MAX_BYTES"] = str(max_bytes)
+        return max_bytes
+
+def getFingerprintAlgorithm():
+    algorithm = os.getenv("RUNWARE_FINGERPRINT_ALGORITHM")
+    if algorithm and algorithm.lower() in ["auto", "xxh3_128", "blake3", "sha256"]:
+        return algorithm.lower()
+    else:
+        algorithm = "auto"
+        os.environ["RUNWARE_FINGERPRINT_ALGORITHM"] = algorithm
+        return algorithm
+
+def getUploadWorkers():
+    upload_workers = os.getenv("RUNWARE_UPLOAD_WORKERS")
+    if upload_workers and upload_workers.isdigit() and int(upload_workers) > 0:
+        return int(upload_workers)
+    else:
+        upload_workers = 2
+        os.environ["RUNWARE_UPLOAD_WORKERS"] = str(upload_workers)
+        return upload_workers
+
+def getUploadSyncMinSeconds():
+    sync_min_seconds = os.getenv("RUNWARE_UPLOAD_SYNC_MIN_SECONDS")
+    try:
+        return float(sync_min_seconds)
+    except (TypeError, ValueError):
+        sync_min_seconds = 1.0
+        os.environ["RUNWARE_UPLOAD_SYNC_MIN_SECONDS"] = str(sync_min_seconds)
+        return sync_min_seconds
+
+def getEnableResultCache():
+    enable_result_cache = os.getenv("RUNWARE_RESULT_CACHE")
+    if enable_result_cache and enable_result_cache.lower() in ["true", "false"]:
+        return enable_result_cache.lower() == "true"
+    else:
+        enable_result_cache = False
+        os.environ["RUNWARE_RESULT_CACHE"] = str(enable_result_cache)
+        return enable_result_cache
+
+def getResultCacheTTL():
+    result_cache_ttl = os.getenv("RUNWARE_RESULT_CACHE_TTL")
+    if result_cache_ttl and result_cache_ttl.isdigit():
+        return int(result_cache_ttl)
+    else:
+        result_cache_ttl = 7 * 24 * 60 * 60
+        os.environ["RUNWARE_RESULT_CACHE_TTL"] = str(result_cache_ttl)
+        return result_cache_ttl
+
+def getResultCacheMaxBytes():
+    max_bytes = os.getenv("RUNWARE_RESULT_CACHE_MAX_BYTES")
+    if max_bytes and max_bytes.isdigit():
+        return int(max_bytes)
+    else:
+        max_bytes = 2 * 1024 * 1024 * 1024
+        os.environ["RUNWARE_RESULT_CACHE_MAX_BYTES"] = str(max_bytes)
+        return max_bytes
+
+def getResultCacheBypass():
+    bypass = os.getenv("RUNWARE_RESULT_CACHE_BYPASS")
+    if bypass is None:
+        bypass = ""
+        os.environ["RUNWARE_RESULT_CACHE_BYPASS"] = bypass
+    return {taskType.strip() for taskType in bypass.split(",") if taskType.strip()}
+
+def getBridgeConcurrency():
+    bridge_concurrency = os.getenv("RUNWARE_BRIDGE_CONCURRENCY")
+    if bridge_concurrency and bridge_concurrency.isdigit() and int(bridge_concurrency) > 0:
+        return int(bridge_concurrency)
+    else:
+        bridge_concurrency = 4
+        os.environ["RUNWARE_BRIDGE_CONCURRENCY"] = str(bridge_concurrency)
+        return bridge_concurrency
+
+def getModelSearchTTL():
+    model_search_ttl = os.getenv("RUNWARE_MODEL_SEARCH_TTL")
+    if model_search_ttl and model_search_ttl.isdigit():
+        return int(model_search_ttl)
+    else:
+        model_search_ttl = 600
+        os.environ["RUNWARE_MODEL_SEARCH_TTL"] = str(model_search_ttl)
+        return model_search_ttl
+
+def getModelSearchStaleTTL():
+    model_search_stale = os.getenv("RUNWARE_MODEL_SEARCH_STALE_TTL")
+    if model_search_stale and model_search_stale.isdigit():
+        return int(model_search_stale)
+    else:
+        model_search_stale = 86400
+        os.environ["RUNWARE_MODEL_SEARCH_STALE_TTL"] = str(model_search_stale)
+        return model_search_stale
+
+def getEnableSingleFlight():
+    enable_single_flight = os.getenv("RUNWARE_SINGLE_FLIGHT")
+    if enable_single_flight and enable_single_flight.lower() in ["true", "false"]:
+        return enable_single_flight.lower() == "true"
+    else:
+        enable_single_flight = True
+        os.environ["RUNWARE_SINGLE_FLIGHT"] = str(enable_single_flight)
+        return enable_single_flight
+
 def getMinImageCacheSize():
     min_image_cache_size = os.getenv("RUNWARE_MIN_IMAGE_CACHE_SIZE")
     if min_image_cache_size and min_image_cache_size.isdigit():
@@ -176,6 +391,15 @@ def getMinImageCacheSize():
         os.environ["RUNWARE_MIN_IMAGE_CACHE_SIZE"] = str(min_image_cache_size)
         return min_image_cache_size
 
+def getRequestBatchWindow():
+    batch_window = os.getenv("RUNWARE_REQUEST_BATCH_WINDOW_MS")
+    if batch_window and batch_window.isdigit():
+        return int(batch_window)
+    else:
+        batch_window = 0
+        os.environ["RUNWARE_REQUEST_BATCH_WINDOW_MS"] = str(batch_window)
+        return batch_window
+
 def getCustomEndpoint():
     custom_endpoint = os.getenv("RUNWARE_CUSTOM_ENDPOINT")
     if custom_endpoint and isinstance(custom_endpoint, str):
@@ -200,7 +424,7 @@ def getRunwareWsHeadersDict():
     return headers
 
 WS_CONNECT_TIMEOUT = 10
-WS_READ_TIMEOUT = 1
+REQUEST_BATCH_MAX_TASKS = 32
 
 SESSION_TIMEOUT = getTimeout()
 RUNWARE_API_KEY = getAPIKey()
@@ -243,6 +467,7 @@ def setAPIKey(apiKey: str):
         RUNWARE_API_KEY = apiKey
         os.environ["RUNWARE_API_KEY"] = apiKey
         _reset_ws_client()
+        getModelSearchCache().clear()
         return True
 
 def setTimeout(timeout: int):
@@ -298,74 +523,217 @@ def getOrdinal(num):
     return ordinals.get(num, f"{num}th")
 
 
+_transport_loop = None
+_transport_loop_lock = threading.Lock()
+
+
+def getTransportLoop():
+    """Return the process-wide event loop that drives all Runware socket I/O."""
+    global _transport_loop
+    with _transport_loop_lock:
+        if _transport_loop is None or _transport_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever,
+                name="RunwareTransportLoop",
+                daemon=True,
+            ).start()
+            _transport_loop = loop
+        return _transport_loop
+
+
+def runOnTransportLoop(coro, timeout=None):
+    """Run a coroutine on the transport loop and block the calling thread until it finishes."""
+    loop = getTransportLoop()
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    if running_loop is loop:
+        coro.close()
+        raise RuntimeError("runOnTransportLoop() cannot block the Runware transport loop itself")
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+MEDIA_STREAM_CHUNK_BYTES = 3 * 256 * 1024  # a multiple of 3, so chunks base64-encode without padding
+
+
+class StreamedBase64:
+    """A file sent as a base64 JSON string, read chunk by chunk and never held in memory."""
+
+    def __init__(self, filePath, chunkSize=MEDIA_STREAM_CHUNK_BYTES):
+        self.filePath = filePath
+        self.size = os.path.getsize(filePath)
+        self.chunkSize = max(3, chunkSize - chunkSize % 3)
+
+    def __len__(self):
+        return 4 * ((self.size + 2) // 3)
+
+    def __iter__(self):
+        if self.size == 0:
+            return
+        # Encode straight from the page cache through a memory map; slices of
+        # the memoryview are zero-copy, so the only buffer is the encoded chunk.
+        with open(self.filePath, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, len(mapped), self.chunkSize):
+                    yield base64.b64encode(view[offset:offset + self.chunkSize])
+            finally:
+                view.release()
+
+    def __repr__(self):
+        return f"<streamed base64 of {self.filePath} ({self.size} bytes)>"
+
+
+def hasStreamedPayload(value):
+    if isinstance(value, StreamedBase64):
+        return True
+    if isinstance(value, dict):
+        return any(hasStreamedPayload(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(hasStreamedPayload(item) for item in value)
+    return False
+
+
+class StreamedJsonBody:
+    """JSON body of a task list with StreamedBase64 values spliced in; its length is known up front."""
+
+    def __init__(self, genConfig):
+        self._streams = []
+        token = f"__runware_stream_{genRandUUID()}_"
+
+        def replace(value):
+            if isinstance(value, StreamedBase64):
+                self._streams.append(value)
+                return f"{token}{len(self._streams) - 1}__"
+            if isinstance(value, dict):
+                return {key: replace(item) for key, item in value.items()}
+            if isinstance(value, (list, tuple)):
+                return [replace(item) for item in value]
+            return value
+
+        text = json.dumps(replace(genConfig))
+        parts = re.split(re.escape(token) + r"(\d+)__", text)
+        # Alternates JSON text, stream index, JSON text, ...
+        self._parts = [
+            part.encode("utf-8") if index % 2 == 0 else self._streams[int(part)]
+            for index, part in enumerate(parts)
+        ]
+
+    def __len__(self):
+        return sum(len(part) for part in self._parts)
+
+    def __iter__(self):
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+            else:
+                yield from part
+
+    def iterText(self):
+        """The body as str fragments, for a fragmented WebSocket text message."""
+        for chunk in self:
+            yield chunk.decode("utf-8")
+
+    async def aiter(self):
+        for chunk in self:
+            yield chunk
+
+
 class RunwareWebSocketClient:
-    """Persistent WebSocket client for Runware API task requests."""
+    """Persistent asyncio WebSocket client for Runware API task requests, running on the transport loop."""
 
     def __init__(self):
-        self._conn_lock = threading.RLock()
-        self._pending_lock = threading.Lock()
         self._ws = None
+        self._connect_lock = None
+        self._reader_task = None
         self._connection_session_uuid = None
-        self._reader_thread = None
-        self._stop_reader = threading.Event()
+        # Requests are indexed by taskUUID so each reply item is routed in O(1);
+        # authentication and taskUUID-less requests get their own slots.
         self._pending = {}
+        self._pending_by_task = {}
+        self._auth_pending = None
+        self._anonymous_pending = []
+        self._outbox = None
+        # Requests grouped by the frame they went out in, oldest first
+        self._frames = []
 
     def close(self):
-        with self._conn_lock:
-            self._stop_reader.set()
-            if self._ws is not None:
-                try:
-                    self._ws.close()
-                except Exception:
-                    pass
-                self._ws = None
-            if self._reader_thread and self._reader_thread.is_alive():
-                self._reader_thread.join(timeout=2)
-            self._reader_thread = None
-            with self._pending_lock:
-                for pending in self._pending.values():
-                    pending["response"] = {"errors": [{"message": "WebSocket connection closed"}]}
-                    pending["event"].set()
-                self._pending.clear()
-
-    def _connect(self):
-        url = getCustomEndpoint()
-        self._stop_reader.set()
-        if self._ws is not None:
+        runOnTransportLoop(self._close(), timeout=WS_CONNECT_TIMEOUT)
+
+    async def _close(self):
+        self._fail_pending("WebSocket connection closed")
+        await self._disconnect()
+
+    def _fail_pending(self, message):
+        for pending in list(self._pending.values()):
+            if not pending["future"].done():
+                pending["future"].set_result({"errors": [{"message": message}]})
+        self._pending.clear()
+        self._pending_by_task.clear()
+        self._auth_pending = None
+        self._anonymous_pending.clear()
+        self._frames.clear()
+
+    def _fail_sent_on(self, ws, message):
+        # Raised as a connection error so wsRequestWrapper retries them on a new socket
+        for pending in list(self._pending.values()):
+            if pending.get("ws") is ws and not pending["future"].done():
+                pending["future"].set_exception(ConnectionError(message))
+
+    async def _drop(self, ws):
+        """Tear down ``ws`` if it is still the current connection (another caller may have replaced it)."""
+        if ws is not None and ws is self._ws:
+            await self._disconnect()
+
+    async def _disconnect(self):
+        ws, self._ws = self._ws, None
+        reader_task, self._reader_task = self._reader_task, None
+        if reader_task is not None and not reader_task.done():
+            reader_task.cancel()
+        if ws is not None:
             try:
-                self._ws.close()
+                await ws.close()
             except Exception:
                 pass
-            self._ws = None
-        if self._reader_thread and self._reader_thread.is_alive():
-            self._reader_thread.join(timeout=2)
+        if reader_task is not None:
+            try:
+                await reader_task
+            except BaseException:
+                pass
+        if ws is not None:
+            self._fail_sent_on(ws, "WebSocket connection closed")
 
-        self._stop_reader.clear()
-        self._ws = ws_connect(
-            url,
+    async def _connect(self):
+        await self._disconnect()
+        self._ws = await ws_connect_async(
+            getCustomEndpoint(),
             max_size=None,
             additional_headers=getRunwareWsHeadersDict(),
             open_timeout=WS_CONNECT_TIMEOUT,
         )
-        self._reader_thread = threading.Thread(
-            target=self._reader_loop,
-            name="RunwareWebSocketReader",
-            daemon=True,
-        )
-        self._reader_thread.start()
-        self._authenticate()
-
-    def _ensure_connected(self):
-        reader_alive = self._reader_thread is not None and self._reader_thread.is_alive()
-        if self._ws is None or not reader_alive:
-            self._connect()
-            return
+        self._reader_task = asyncio.get_running_loop().create_task(self._reader_loop(self._ws))
         try:
-            self._ws.ping()
-        except Exception:
-            self._connect()
-
-    def _authenticate(self, api_key=None):
+            await self._authenticate()
+        except BaseException:
+            await self._disconnect()
+            raise
+
+    async def _ensure_connected(self):
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        async with self._connect_lock:
+            if self._ws is None or self._reader_task is None or self._reader_task.done():
+                await self._connect()
+            return self._ws
+
+    async def _authenticate(self, api_key=None):
         key = api_key or getAPIKey()
         if not key:
             raise Exception(
@@ -377,7 +745,7 @@ class RunwareWebSocketClient:
         }
         if self._connection_session_uuid:
             auth_task["connectionSessionUUID"] = self._connection_session_uuid
-        response = self._send_and_wait([auth_task], timeout=10, is_auth=True)
+        response = await self._send_and_wait([auth_task], timeout=10, is_auth=True)
         if "errors" in response:
             error_message = response["errors"][0].get("message", "Authentication failed")
             raise Exception(error_message)
@@ -386,134 +754,249 @@ class RunwareWebSocketClient:
         if session_uuid:
             self._connection_session_uuid = session_uuid
 
-    def _reader_loop(self):
-        while not self._stop_reader.is_set() and self._ws is not None:
-            try:
-                raw = self._ws.recv(timeout=WS_READ_TIMEOUT)
-            except TimeoutError:
-                continue
-            except ConnectionClosed:
-                break
-            except WebSocketException as e:
-                if not self._stop_reader.is_set():
-                    print(f"[Runware] WebSocket reader error: {e}")
-                break
-
-            if not raw:
-                continue
-
-            try:
-                message = json.loads(raw)
-            except json.JSONDecodeError:
-                print(f"[Runware] WebSocket received invalid JSON")
-                continue
+    async def _reader_loop(self, ws):
+        try:
+            async for raw in ws:
+                if not raw:
+                    continue
 
-            if self._is_ping_response(message):
-                continue
+                try:
+                    message = json.loads(raw)
+                except json.JSONDecodeError:
+                    print(f"[Runware] WebSocket received invalid JSON")
+                    continue
 
-            self._dispatch_message(message)
+                if self._is_ping_response(message):
+                    continue
 
-        with self._pending_lock:
-            for pending in self._pending.values():
-                if pending["response"] is None:
-                    pending["response"] = {"errors": [{"message": "WebSocket connection closed"}]}
-                    pending["event"].set()
+                self._dispatch_message(message)
+        except asyncio.CancelledError:
+            # Deliberate disconnect: _disconnect fails the requests sent on this
+            # socket, and their callers retry on the next connection.
+            raise
+        except ConnectionClosed:
+            pass
+        except WebSocketException as e:
+            print(f"[Runware] WebSocket reader error: {e}")
+
+        if self._ws is ws:
+            self._ws = None
+        self._fail_sent_on(ws, "WebSocket connection closed")
 
     @staticmethod
     def _is_ping_response(message):
         data = message.get("data") or []
         return bool(data) and data[0].get("taskType") == "ping" and data[0].get("pong")
 
+    @staticmethod
+    def _is_auth_message(message):
+        return any(
+            item.get("taskType") == "authentication"
+            for item in (message.get("data") or []) + (message.get("errors") or [])
+        )
+
     def _dispatch_message(self, message):
-        with self._pending_lock:
-            for pending in list(self._pending.values()):
-                if pending["response"] is not None:
-                    continue
+        if self._is_auth_message(message):
+            auth_pending = self._auth_pending
+            if auth_pending is not None and not auth_pending["future"].done():
+                auth_pending["future"].set_result(message)
+            return
 
-                if pending["is_auth"]:
-                    if message.get("data") and any(
-                        item.get("taskType") == "authentication" for item in message["data"]
-                    ):
-                        pending["response"] = message
-                        pending["event"].set()
-                        continue
-                    if message.get("errors") and any(
-                        item.get("taskType") == "authentication" for item in message["errors"]
-                    ):
-                        pending["response"] = message
-                        pending["event"].set()
+        touched = {}
+        unrouted = {}
+        frame_targets = None
+        for item in message.get("data", []):
+            if item.get("taskUUID") and item["taskUUID"] not in self._pending_by_task:
+                unrouted.setdefault(item["taskUUID"], {}).setdefault("data", []).append(item)
+                continue
+            for pending in self._pending_by_task.get(item.get("taskUUID"), ()):
+                if pending["future"].done():
                     continue
-
-                for item in message.get("data", []):
-                    task_uuid = item.get("taskUUID")
-                    if task_uuid and task_uuid in pending["task_uuids"]:
-                        pending["collected_data"].append(item)
-                        pending["task_uuids"].discard(task_uuid)
-
-                for item in message.get("errors", []):
-                    task_uuid = item.get("taskUUID")
-                    if task_uuid and task_uuid in pending["task_uuids"]:
-                        pending["collected_errors"].append(item)
-                        pending["task_uuids"].discard(task_uuid)
-                    elif (
-                        not task_uuid
-                        and len(self._pending) == 1
-                        and pending["task_uuids"]
-                        and len(pending["task_uuids"]) == 1
-                    ):
-                        pending["collected_errors"].append(item)
-                        pending["task_uuids"].clear()
-
-                if pending["task_uuids"]:
+                pending["collected_data"].append(item)
+                pending["task_uuids"].discard(item["taskUUID"])
+                touched[id(pending)] = pending
+
+        for item in message.get("errors", []):
+            task_uuid = item.get("taskUUID")
+            if task_uuid and task_uuid not in self._pending_by_task:
+                unrouted.setdefault(task_uuid, {}).setdefault("errors", []).append(item)
+                continue
+            if task_uuid:
+                targets = self._pending_by_task.get(task_uuid, ())
+            else:
+                if frame_targets is None:
+                    frame_targets = self._unanswered_frame()
+                targets = frame_targets
+            for pending in targets:
+                if pending["future"].done():
                     continue
+                pending["collected_errors"].append(item)
+                if task_uuid:
+                    pending["task_uuids"].discard(task_uuid)
+                else:
+                    pending["task_uuids"].clear()
+                touched[id(pending)] = pending
+
+        # Frames for tasks nobody is waiting on synchronously are pushed async results.
+        for task_uuid, result in unrouted.items():
+            getTaskWatcher().offer(task_uuid, result)
+
+        if not touched and not unrouted and self._anonymous_pending:
+            pending = self._anonymous_pending.pop(0)
+            if not pending["future"].done():
+                pending["future"].set_result(message)
+            return
+
+        for pending in touched.values():
+            if pending["task_uuids"]:
+                continue
+            response = {}
+            if pending["collected_data"]:
+                response["data"] = pending["collected_data"]
+            if pending["collected_errors"]:
+                response["errors"] = pending["collected_errors"]
+            pending["future"].set_result(response)
+
+    def _track_frame(self, pendings):
+        self._frames = [frame for frame in self._frames if self._live(frame)]
+        self._frames.append(pendings)
+
+    def _live(self, frame):
+        return [
+            pending for pending in frame
+            if id(pending) in self._pending and not pending["future"].done()
+        ]
 
-                response = {}
-                if pending["collected_data"]:
-                    response["data"] = pending["collected_data"]
-                if pending["collected_errors"]:
-                    response["errors"] = pending["collected_errors"]
-                if not response:
-                    response = message
-                pending["response"] = response
-                pending["event"].set()
-
-    def _send_and_wait(self, gen_config, timeout, is_auth=False):
-        wait_event = threading.Event()
+    def _unanswered_frame(self):
+        """Requests of the oldest frame with no reply yet, the target of an untagged error."""
+        self._frames = [frame for frame in self._frames if self._live(frame)]
+        for frame in self._frames:
+            if not any(pending["collected_data"] or pending["collected_errors"] for pending in frame):
+                return self._live(frame)
+        return []
+
+    def _register_pending(self, pending):
+        self._pending[id(pending)] = pending
+        if pending["is_auth"]:
+            self._auth_pending = pending
+        elif pending["task_uuids"]:
+            for task_uuid in pending["task_uuids"]:
+                self._pending_by_task.setdefault(task_uuid, []).append(pending)
+        else:
+            self._anonymous_pending.append(pending)
+
+    def _unregister_pending(self, pending, task_uuids):
+        self._pending.pop(id(pending), None)
+        if self._auth_pending is pending:
+            self._auth_pending = None
+        for task_uuid in task_uuids:
+            waiters = self._pending_by_task.get(task_uuid)
+            if waiters is None:
+                continue
+            if pending in waiters:
+                waiters.remove(pending)
+            if not waiters:
+                del self._pending_by_task[task_uuid]
+        if pending in self._anonymous_pending:
+            self._anonymous_pending.remove(pending)
+
+    async def _send_and_wait(self, gen_config, timeout, is_auth=False, attempt=None):
+        future = asyncio.get_running_loop().create_future()
         task_uuids = {task.get("taskUUID") for task in gen_config if task.get("taskUUID")}
         pending = {
-            "event": wait_event,
-            "response": None,
+            "future": future,
             "task_uuids": set(task_uuids),
             "is_auth": is_auth,
             "collected_data": [],
             "collected_errors": [],
         }
-        pending_id = id(pending)
-
-        with self._pending_lock:
-            self._pending[pending_id] = pending
+        self._register_pending(pending)
 
         try:
-            payload = json.dumps(gen_config)
-            with self._conn_lock:
-                self._ensure_connected()
-                self._ws.send(payload)
+            ws = self._ws if is_auth else await self._ensure_connected()
+            if ws is None:
+                raise ConnectionError("WebSocket connection lost before sending")
+            if attempt is not None:
+                attempt["ws"] = ws
+            if is_auth:
+                pending["ws"] = ws
+                await ws.send(json.dumps(gen_config))
+            else:
+                await self._send(ws, gen_config, pending, attempt)
 
-            if not wait_event.wait(timeout):
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
                 raise TimeoutError(f"WebSocket request timed out after {timeout} seconds")
+        finally:
+            self._unregister_pending(pending, task_uuids)
+
+    async def _send(self, ws, gen_config, pending, attempt=None):
+        """Send a task list, coalescing with concurrent callers when request batching is enabled."""
+        window = getRequestBatchWindow() / 1000
+        if hasStreamedPayload(gen_config) or window <= 0:
+            pending["ws"] = ws
+            self._track_frame([pending])
+            if hasStreamedPayload(gen_config):
+                # Streamed media goes out alone as one fragmented message
+                await ws.send(StreamedJsonBody(gen_config).iterText())
+            else:
+                await ws.send(json.dumps(gen_config))
+            return
 
-            if pending["response"] is None:
-                raise Exception("WebSocket request failed: empty response")
-            return pending["response"]
+        loop = asyncio.get_running_loop()
+        batch = self._outbox
+        if batch is None:
+            batch = self._outbox = {"tasks": [], "pendings": [], "ws": None, "sent": loop.create_future()}
+            loop.call_later(window, self._flush_outbox, batch)
+        batch["tasks"].extend(gen_config)
+        batch["pendings"].append(pending)
+        if len(batch["tasks"]) >= REQUEST_BATCH_MAX_TASKS:
+            self._flush_outbox(batch)
+        try:
+            await asyncio.shield(batch["sent"])
         finally:
-            with self._pending_lock:
-                self._pending.pop(pending_id, None)
+            # The batch may have gone out on a newer socket than ``ws``
+            if attempt is not None and batch["ws"] is not None:
+                attempt["ws"] = batch["ws"]
 
-    def request(self, gen_config, timeout):
-        def recaller():
-            return self._send_and_wait(gen_config, timeout=timeout)
+    def _flush_outbox(self, batch):
+        if self._outbox is not batch:
+            return
+        self._outbox = None
+        asyncio.get_running_loop().create_task(self._send_batch(batch))
+
+    async def _send_batch(self, batch):
+        # Replies are split back to each caller by the taskUUID index.
+        try:
+            ws = await self._ensure_connected()
+            if ws is None:
+                raise ConnectionError("WebSocket connection lost before sending")
+            batch["ws"] = ws
+            for pending in batch["pendings"]:
+                pending["ws"] = ws
+            self._track_frame(batch["pendings"])
+            await ws.send(json.dumps(batch["tasks"]))
+        except Exception as e:
+            batch["sent"].set_exception(e)
+        else:
+            batch["sent"].set_result(None)
 
-        return wsRequestWrapper(recaller)
+    async def request_async(self, gen_config, timeout, retries=MAX_RETRIES):
+        attempt = {}
+
+        async def recaller():
+            attempt.clear()
+            return await self._send_and_wait(gen_config, timeout=timeout, attempt=attempt)
+
+        async def reconnect():
+            # Only the socket this request failed on; another caller may already have replaced it
+            await self._drop(attempt.get("ws"))
+
+        return await wsRequestWrapper(recaller, reconnect, retries)
+
+    def request(self, gen_config, timeout):
+        return runOnTransportLoop(self.request_async(gen_config, timeout))
 
 
 _ws_client = None
@@ -536,30 +1019,127 @@ def _reset_ws_client():
             _ws_client = None
 
 
-def wsRequestWrapper(recaller):
-    for attempt in range(MAX_RETRIES + 1):
+async def wsRequestWrapper(recaller, reconnect, retries=MAX_RETRIES):
+    for attempt in range(retries + 1):
         try:
-            return recaller()
+            return await recaller()
         except (
             WebSocketException,
             ConnectionClosed,
             ConnectionError,
             OSError,
             TimeoutError,
-        ):
-            if attempt == MAX_RETRIES:
+        ) as e:
+            if attempt == retries:
                 raise
             cooldown = RETRY_COOLDOWNS[attempt]
             print(
                 f"[Runware] WebSocket request failed! Retrying in {cooldown} seconds..."
                 f" (Attempt {attempt + 1}/{MAX_RETRIES})"
             )
-            time.sleep(cooldown)
-            _reset_ws_client()
+            await asyncio.sleep(cooldown)
+            # A timed-out request says nothing about the socket; only drop broken connections.
+            if not isinstance(e, TimeoutError):
+                await reconnect()
             continue
     return False
 
 
+HTTP_TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if httpx else ())
+HTTP_REQUEST_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+_httpx_missing_warned = False
+
+
+def usesAsyncHttpTransport(endpoint=None):
+    """True when REST requests should go through the async httpx client instead of requests."""
+    global _httpx_missing_warned
+    if usesWebSocketTransport(endpoint) or getHttpTransport() != "httpx":
+        return False
+    if httpx is None:
+        if not _httpx_missing_warned:
+            print("[Runware] RUNWARE_HTTP_TRANSPORT=httpx but httpx is not installed, falling back to requests. Install it with: pip install 'httpx[http2]'")
+            _httpx_missing_warned = True
+        return False
+    return True
+
+
+class RunwareHttpClient:
+    """Async REST client for the Runware API with HTTP/2 multiplexing and a sized keep-alive pool."""
+
+    def __init__(self):
+        self._client = None
+
+    def _get_client(self):
+        if self._client is None:
+            pool_size = getHttpPoolSize()
+            limits = httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=getHttpKeepAlive(),
+            )
+            try:
+                self._client = httpx.AsyncClient(http2=True, limits=limits, follow_redirects=False)
+            except ImportError:
+                print("[Runware] HTTP/2 support needs the 'h2' package, using HTTP/1.1 with httpx.")
+                self._client = httpx.AsyncClient(limits=limits, follow_redirects=False)
+        return self._client
+
+    async def post(self, gen_config, headers, timeout, retries=MAX_RETRIES):
+        # httpx only decodes zstd with the optional zstandard package, so don't advertise it.
+        headers = {**headers, "Accept-Encoding": "gzip, deflate, br"}
+        client = self._get_client()
+        for attempt in range(retries + 1):
+            try:
+                if hasStreamedPayload(gen_config):
+                    body = StreamedJsonBody(gen_config)
+                    response = await client.post(
+                        RUNWARE_API_BASE_URL,
+                        headers={**headers, "Content-Length": str(len(body))},
+                        content=body.aiter(),
+                        timeout=timeout,
+                    )
+                else:
+                    response = await client.post(
+                        RUNWARE_API_BASE_URL,
+                        headers=headers,
+                        json=gen_config,
+                        timeout=timeout,
+                    )
+                break
+            except (httpx.ConnectError, httpx.RemoteProtocolError):
+                if attempt == retries:
+                    raise
+                cooldown = RETRY_COOLDOWNS[attempt]
+                print(f"[Runware] Error API Request Failed! Retrying in {cooldown} seconds... (Attempt {attempt+1}/{MAX_RETRIES})")
+                await asyncio.sleep(cooldown)
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            print(f"[Debugging] Runware JSON Decode Error: {str(e)}")
+            print(f"[Debugging] Runware Response Status Code: {response.status_code}")
+            print(f"[Debugging] Runware Response Headers: {response.headers}")
+            print(f"[Debugging] Runware Raw Response Content: {response.content}")
+            raise Exception("Error: Invalid JSON response from API!")
+
+    async def close(self):
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client():
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = RunwareHttpClient()
+        return _http_client
+
+
 def checkAPIKeyWithWebSocket(apiKey):
     url = getCustomEndpoint()
     ws = None
@@ -691,11 +1271,48 @@ def sendVideoOutputs(draftId, videoId, nodeID):
         },
     )
 
-def inferenecRequest(genConfig):
+def taskErrorMessage(genResult):
+    """User-facing message for the first error of an API response."""
+    error_obj = genResult["errors"][0]
+    error_message = error_obj.get("message", "Unknown error")
+
+    # Add allowedValues if present
+    if "allowedValues" in error_obj:
+        allowed_values = error_obj["allowedValues"]
+        error_message += f"\n\nAllowed values:\n" + "\n".join(f"  - {val}" for val in allowed_values)
+
+    # Add documentation link if present
+    if "documentation" in error_obj:
+        error_message += f"\n\nDocumentation: {error_obj['documentation']}"
+
+    return error_message
+
+
+def inferenecRequest(genConfig, bypassResultCache=False):
     global RUNWARE_API_KEY, SESSION_TIMEOUT
     RUNWARE_API_KEY = os.getenv("RUNWARE_API_KEY")
     SESSION_TIMEOUT = int(os.getenv("RUNWARE_TIMEOUT"))
     endpoint = refreshRunwareEndpoint()
+    getTaskWatcher().noteTaskTypes(genConfig)
+
+    inflight = getInflightRegistry()
+    flight, isLeader = inflight.join(genConfig)
+    if not isLeader:
+        return inflight.wait(flight, genConfig[0].get("taskUUID"))
+    try:
+        genResult = _inferenceRequest(genConfig, endpoint, bypassResultCache)
+    except BaseException as e:
+        getResultCache().forget(*(task.get("taskUUID") for task in genConfig))
+        inflight.fail(flight, e)
+        raise
+    inflight.resolve(flight, genResult)
+    return genResult
+
+
+def _inferenceRequest(genConfig, endpoint, bypassResultCache=False):
+    cachedResult = getResultCache().lookup(genConfig, bypass=bypassResultCache)
+    if cachedResult is not None:
+        return cachedResult
 
     if usesWebSocketTransport(endpoint):
         try:
@@ -719,63 +1336,58 @@ def inferenecRequest(genConfig):
 
         if "errors" in genResult:
             print(f"[DEBUG] API Error Response: {safe_json_dumps(genResult, indent=2) if isinstance(genResult, dict) else genResult}")
-            error_obj = genResult["errors"][0]
-            error_message = error_obj.get("message", "Unknown error")
-
-            if "allowedValues" in error_obj:
-                allowed_values = error_obj["allowedValues"]
-                error_message += f"\n\nAllowed values:\n" + "\n".join(f"  - {val}" for val in allowed_values)
-
-            if "documentation" in error_obj:
-                error_message += f"\n\nDocumentation: {error_obj['documentation']}"
-
-            raise Exception(error_message)
+            raise Exception(taskErrorMessage(genResult))
+        getResultCache().observe(genConfig[0].get("taskUUID"), genResult)
         return genResult
 
     headers = getRunwareApiHeaders()
 
     try:
-        def recaller():
-            return session.post(
-                RUNWARE_API_BASE_URL,
-                headers=headers,
-                json=genConfig,
-                timeout=SESSION_TIMEOUT,
-                allow_redirects=False,
-                stream=True,
+        if usesAsyncHttpTransport():
+            genResult = runOnTransportLoop(
+                _get_http_client().post(genConfig, headers, SESSION_TIMEOUT)
             )
+        else:
+            def recaller():
+                if hasStreamedPayload(genConfig):
+                    # Sized iterable body: sent with a Content-Length, read chunk by chunk
+                    return session.post(
+                        RUNWARE_API_BASE_URL,
+                        headers=headers,
+                        data=StreamedJsonBody(genConfig),
+                        timeout=SESSION_TIMEOUT,
+                        allow_redirects=False,
+                        stream=True,
+                    )
+                return session.post(
+                    RUNWARE_API_BASE_URL,
+                    headers=headers,
+                    json=genConfig,
+                    timeout=SESSION_TIMEOUT,
+                    allow_redirects=False,
+                    stream=True,
+                )
 
-        genResult = generalRequestWrapper(recaller)
-        try:
-            genResult = genResult.json()
-        except json.JSONDecodeError as e:
-            print(f"[Debugging] Runware JSON Decode Error: {str(e)}")
-            print(f"[Debugging] Runware Response Status Code: {genResult.status_code}")
-            print(f"[Debugging] Runware Response Headers: {genResult.headers}")
-            print(f"[Debugging] Runware Raw Response Content: {genResult.content}")
-            raise Exception("Error: Invalid JSON response from API!")
+            genResult = generalRequestWrapper(recaller)
+            try:
+                genResult = genResult.json()
+            except json.JSONDecodeError as e:
+                print(f"[Debugging] Runware JSON Decode Error: {str(e)}")
+                print(f"[Debugging] Runware Response Status Code: {genResult.status_code}")
+                print(f"[Debugging] Runware Response Headers: {genResult.headers}")
+                print(f"[Debugging] Runware Raw Response Content: {genResult.content}")
+                raise Exception("Error: Invalid JSON response from API!")
         if "errors" in genResult:
             print(f"[DEBUG] API Error Response: {safe_json_dumps(genResult, indent=2) if isinstance(genResult, dict) else genResult}")
-            error_obj = genResult["errors"][0]
-            error_message = error_obj.get("message", "Unknown error")
-            
-            # Add allowedValues if present
-            if "allowedValues" in error_obj:
-                allowed_values = error_obj["allowedValues"]
-                error_message += f"\n\nAllowed values:\n" + "\n".join(f"  - {val}" for val in allowed_values)
-            
-            # Add documentation link if present
-            if "documentation" in error_obj:
-                error_message += f"\n\nDocumentation: {error_obj['documentation']}"
-            
-            raise Exception(error_message)
+            raise Exception(taskErrorMessage(genResult))
         else:
+            getResultCache().observe(genConfig[0].get("taskUUID"), genResult)
             return genResult
-    except requests.exceptions.Timeout:
+    except HTTP_TIMEOUT_ERRORS:
         raise Exception(
             f"Error: Request Timed Out After {SESSION_TIMEOUT} Seconds - Please Try Again!"
         )
-    except requests.exceptions.RequestException:
+    except HTTP_REQUEST_ERRORS:
         raise Exception("Error: Runware Request Failed!")
     except Exception as e:
         if "invalid api key" in str(e).lower():
@@ -793,156 +1405,851 @@ def inferenecRequest(genConfig):
     return False
 
 
-async def uploadImage(imageDataUri):
+def uploadImageSync(imageDataUri):
+    """Run one imageUpload task and return the imageUUID; raises on transport errors."""
     uploadTaskConfig = [
         {"taskType": "imageUpload", "taskUUID": genRandUUID(), "image": imageDataUri}
     ]
+    uploadResult = inferenecRequest(uploadTaskConfig)
+    if (
+        uploadResult
+        and "data" in uploadResult
+        and "imageUUID" in uploadResult["data"][0]
+    ):
+        return uploadResult["data"][0]["imageUUID"]
+    return False
 
+async def _inference_request_async(genConfig, endpoint):
+    # Transport-loop counterpart of _inferenceRequest for the WebSocket and httpx transports
+    cachedResult = getResultCache().lookup(genConfig)
+    if cachedResult is not None:
+        return cachedResult
     try:
-        uploadResult = inferenecRequest(uploadTaskConfig)
-        if (
-            uploadResult
-            and "data" in uploadResult
-            and "imageUUID" in uploadResult["data"][0]
-        ):
-            imageUUID = uploadResult["data"][0]["imageUUID"]
-            return imageUUID
-    except Exception as e:
-        return False
+        if usesWebSocketTransport(endpoint):
+            genResult = await _get_ws_client().request_async(genConfig, SESSION_TIMEOUT)
+        else:
+            genResult = await _get_http_client().post(genConfig, getRunwareApiHeaders(), SESSION_TIMEOUT)
+    except (TimeoutError,) + HTTP_TIMEOUT_ERRORS:
+        raise Exception(
+            f"Error: Request Timed Out After {SESSION_TIMEOUT} Seconds - Please Try Again!"
+        )
+    except HTTP_REQUEST_ERRORS:
+        raise Exception("Error: Runware Request Failed!")
+    if "errors" in genResult:
+        print(f"[DEBUG] API Error Response: {safe_json_dumps(genResult, indent=2) if isinstance(genResult, dict) else genResult}")
+        raise Exception(taskErrorMessage(genResult))
+    getResultCache().observe(genConfig[0].get("taskUUID"), genResult)
+    return genResult
 
-    return False
 
-async def uploadAndCacheImage(imgSig: str, imgDataUri: str):
+async def inferenecRequestAsync(genConfig):
+    """Awaitable inferenecRequest for code running on another event loop, e.g. aiohttp routes."""
+    global RUNWARE_API_KEY, SESSION_TIMEOUT
+    RUNWARE_API_KEY = os.getenv("RUNWARE_API_KEY")
+    SESSION_TIMEOUT = int(os.getenv("RUNWARE_TIMEOUT"))
+    endpoint = refreshRunwareEndpoint()
+    if not usesWebSocketTransport(endpoint) and not usesAsyncHttpTransport(endpoint):
+        return await runInBridgePool(inferenecRequest, genConfig)
+
+    getTaskWatcher().noteTaskTypes(genConfig)
+    inflight = getInflightRegistry()
+    flight, isLeader = inflight.join(genConfig)
+    if not isLeader:
+        result = await asyncio.shield(asyncio.wrap_future(flight["future"]))
+        return retargetTaskResult(result, genConfig[0].get("taskUUID"))
+
+    future = asyncio.run_coroutine_threadsafe(
+        _inference_request_async(genConfig, endpoint), getTransportLoop()
+    )
     try:
-        imageUUID = await uploadImage(imgDataUri)
-        if imageUUID:
-            await imageStoreSet(imgSig, imageUUID)
-    except Exception as e:
-        return False
+        genResult = await asyncio.shield(asyncio.wrap_future(future))
+    except asyncio.CancelledError:
+        if flight is not None and flight["followers"]:
+            # Others are waiting on this request, let it finish for them
+            future.add_done_callback(lambda done: _settle_flight(flight, done))
+        else:
+            future.cancel()
+            getResultCache().forget(*(task.get("taskUUID") for task in genConfig))
+            inflight.fail(flight, Exception("Request was cancelled"))
+        raise
+    except BaseException as e:
+        getResultCache().forget(*(task.get("taskUUID") for task in genConfig))
+        inflight.fail(flight, e)
+        raise
+    inflight.resolve(flight, genResult)
+    return genResult
+
+
+def _settle_flight(flight, future):
+    inflight = getInflightRegistry()
+    if future.cancelled():
+        inflight.fail(flight, Exception("Request was cancelled"))
+    elif future.exception() is not None:
+        inflight.fail(flight, future.exception())
+    else:
+        inflight.resolve(flight, future.result())
 
-async def imageStoreSet(imgHash: str, imgUUID: str) -> bool:
+
+_bridgePool = None
+_bridgePoolLock = threading.Lock()
+
+
+def _get_bridge_pool():
+    global _bridgePool
+    with _bridgePoolLock:
+        if _bridgePool is None:
+            _bridgePool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=getBridgeConcurrency(),
+                thread_name_prefix="RunwareBridge",
+            )
+        return _bridgePool
+
+
+async def runInBridgePool(func, *args):
+    """Run a blocking call off the calling event loop (the ComfyUI server loop for bridge routes)."""
+    return await asyncio.get_running_loop().run_in_executor(_get_bridge_pool(), func, *args)
+
+
+async def uploadImage(imageDataUri):
     try:
-        with open(IMAGE_CACHE_FILE, "r") as f:
-            cache = json.load(f)
-        expires = (datetime.now() + timedelta(days=30)).isoformat()
-        cache[imgHash] = {"uuid": imgUUID, "expires": expires}
-        with open(IMAGE_CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
-        return True
+        return uploadImageSync(imageDataUri)
     except Exception as e:
         return False
 
-def imageStoreGet(imgHash: str) -> str | bool:
+async def uploadAndCacheImage(imgSig: str, imgDataUri: str):
     try:
-        with open(IMAGE_CACHE_FILE, "r") as f:
-            cache = json.load(f)
-        if imgHash not in cache:
-            return False
-        entry = cache[imgHash]
-        expires = datetime.fromisoformat(entry["expires"])
-        if datetime.now() > expires:
-            del cache[imgHash]
-            with open(IMAGE_CACHE_FILE, "w") as f:
-                json.dump(cache, f, indent=2)
-            return False
-        return entry["uuid"]
+        return await asyncio.wrap_future(getUploadQueue().submit(imgSig, imgDataUri))
     except Exception as e:
         return False
 
-def convertTensor2IMG(tensorImage):
-    global ENABLE_IMAGES_CACHING, MIN_IMAGE_CACHE_SIZE
-    ENABLE_IMAGES_CACHING = getEnableImagesCaching()
-    MIN_IMAGE_CACHE_SIZE = int(os.getenv("RUNWARE_MIN_IMAGE_CACHE_SIZE"))
 
-    imageNP = (tensorImage.squeeze().numpy() * 255).astype(np.uint8)
-    imgSig = hashlib.sha256(imageNP.tobytes()).hexdigest()
+UPLOAD_PRIORITY_FOREGROUND = 0
+UPLOAD_PRIORITY_BACKGROUND = 1
+
+
+class _UploadJob:
+    __slots__ = ("imgSig", "imgDataUri", "future", "started")
+
+    def __init__(self, imgSig, imgDataUri):
+        self.imgSig = imgSig
+        self.imgDataUri = imgDataUri
+        self.future = concurrent.futures.Future()
+        self.started = False
+
+
+class RunwareUploadQueue:
+    """Bounded background uploader with single-flight uploads per image signature and foreground priority."""
+
+    def __init__(self, workers=None):
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._stats = {"uploads": 0, "failures": 0, "deduped": 0, "bytes": 0, "seconds": 0.0}
+        self._workers = []
+        for index in range(workers or getUploadWorkers()):
+            worker = threading.Thread(target=self._worker, name=f"RunwareUploader-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, imgSig, imgDataUri, foreground=False):
+        """Queue an upload of ``imgDataUri`` and return a future resolving to its UUID (or False)."""
+        priority = UPLOAD_PRIORITY_FOREGROUND if foreground else UPLOAD_PRIORITY_BACKGROUND
+        with self._lock:
+            job = self._inflight.get(imgSig)
+            if job is not None:
+                self._stats["deduped"] += 1
+                if foreground and not job.started:
+                    self._queue.put((priority, next(self._sequence), job))
+                return job.future
+            job = _UploadJob(imgSig, imgDataUri)
+            self._inflight[imgSig] = job
+        self._queue.put((priority, next(self._sequence), job))
+        return job.future
+
+    def _worker(self):
+        while True:
+            _, _, job = self._queue.get()
+            with self._lock:
+                if job.started:
+                    continue
+                job.started = True
+            started_at = time.time()
+            try:
+                imageUUID = uploadImageSync(job.imgDataUri)
+                if imageUUID:
+                    getUploadPolicy().recordUpload(len(job.imgDataUri), time.time() - started_at)
+                    try:
+                        getImageStore().set(job.imgSig, imageUUID)
+                    except Exception as e:
+                        print(f"[Warning] Error caching image: {e}")
+                with self._lock:
+                    self._stats["uploads" if imageUUID else "failures"] += 1
+                    self._stats["bytes"] += len(job.imgDataUri)
+                    self._stats["seconds"] += time.time() - started_at
+                job.future.set_result(imageUUID)
+            except Exception as e:
+                with self._lock:
+                    self._stats["failures"] += 1
+                job.future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._inflight.pop(job.imgSig, None)
 
-    if ENABLE_IMAGES_CACHING:
-        imgUUID = imageStoreGet(imgSig)
-        if imgUUID:
-            return imgUUID
+    def getStats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["inFlight"] = len(self._inflight)
+        stats["queueDepth"] = self._queue.qsize()
+        stats["bytesPerSecond"] = stats["bytes"] / stats["seconds"] if stats["seconds"] else 0.0
+        return stats
 
-    image = Image.fromarray(imageNP)
-    with io.BytesIO() as buffer:
-        image.save(buffer, format="PNG")
-        imageRawData = buffer.getvalue()
-        imgBytes = len(imageRawData)
-        imgSize = int(imgBytes / 1024)
-        imgb64 = base64.b64encode(imageRawData).decode("utf-8")
-        imgDataUri = f"data:image/png;base64,{imgb64}"
 
-        if ENABLE_IMAGES_CACHING and imgSize >= MIN_IMAGE_CACHE_SIZE:
-            try:
-                loop = asyncio.get_running_loop()
-                loop.call_soon(lambda: asyncio.ensure_future(uploadAndCacheImage(imgSig, imgDataUri)))
-            except RuntimeError:
-                def run_coro():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    new_loop.run_until_complete(uploadAndCacheImage(imgSig, imgDataUri))
-                    new_loop.close()
-                threading.Thread(target=run_coro).start()
-        return imgDataUri
+UPLOAD_POLICY_INLINE = "inline"
+UPLOAD_POLICY_UPLOAD = "upload"
+UPLOAD_POLICY_INLINE_DEFERRED = "inline+deferred"
+UPLOAD_POLICY_ASSUMED_BANDWIDTH = 1024 * 1024  # bytes/s until a real upload has been measured
+UPLOAD_POLICY_BANDWIDTH_SMOOTHING = 0.3
+UPLOAD_POLICY_MAX_TRACKED = 4096
 
 
-def convertTensor2IMGBase64Only(tensorImage):
-    """Convert tensor to base64 data URI without caching - for frame images"""
-    imageNP = (tensorImage.squeeze().numpy() * 255).astype(np.uint8)
-    image = Image.fromarray(imageNP)
-    
-    with io.BytesIO() as buffer:
-        image.save(buffer, format="PNG")
-        imageRawData = buffer.getvalue()
-        imgb64 = base64.b64encode(imageRawData).decode("utf-8")
-        imgDataUri = f"data:image/png;base64,{imgb64}"
-    
-    return imgDataUri
+class RunwareUploadPolicy:
+    """Decides per image whether it is sent inline, uploaded first, or sent inline and uploaded in the background."""
 
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = OrderedDict()
+        self._bandwidth = None
+        self._decisions = {UPLOAD_POLICY_INLINE: 0, UPLOAD_POLICY_UPLOAD: 0, UPLOAD_POLICY_INLINE_DEFERRED: 0}
 
-def convertTensor2IMGForVideo(tensorImage):
-    """Convert tensor to image and force upload to get UUID for video frame images"""
-    imageNP = (tensorImage.squeeze().numpy() * 255).astype(np.uint8)
-    imgSig = hashlib.sha256(imageNP.tobytes()).hexdigest()
+    def recordUpload(self, sizeBytes, seconds):
+        if seconds <= 0 or sizeBytes <= 0:
+            return
+        sample = sizeBytes / seconds
+        with self._lock:
+            if self._bandwidth is None:
+                self._bandwidth = sample
+            else:
+                self._bandwidth += UPLOAD_POLICY_BANDWIDTH_SMOOTHING * (sample - self._bandwidth)
+
+    def _note_seen(self, imgSig):
+        count = self._seen.pop(imgSig, 0) + 1
+        self._seen[imgSig] = count
+        while len(self._seen) > UPLOAD_POLICY_MAX_TRACKED:
+            self._seen.popitem(last=False)
+        return count
+
+    def decide(self, imgSig, sizeBytes, wireBytes, minCacheSizeKB):
+        """Pick a policy for an encoded image of ``sizeBytes`` that is ``wireBytes`` as a data URI."""
+        with self._lock:
+            seen = self._note_seen(imgSig)
+            bandwidth = self._bandwidth or UPLOAD_POLICY_ASSUMED_BANDWIDTH
+            transferSeconds = wireBytes / bandwidth
+            if sizeBytes / 1024 < minCacheSizeKB:
+                decision = UPLOAD_POLICY_INLINE
+            elif seen > 1 or transferSeconds >= getUploadSyncMinSeconds():
+                decision = UPLOAD_POLICY_UPLOAD
+            else:
+                decision = UPLOAD_POLICY_INLINE_DEFERRED
+            self._decisions[decision] += 1
+        print(
+            f"[Runware] Upload policy: {decision} for {int(sizeBytes / 1024)} KB image "
+            f"(seen {seen}x, ~{transferSeconds:.2f}s at {int(bandwidth / 1024)} KB/s)"
+        )
+        return decision
 
-    # Check if already cached
-    imgUUID = imageStoreGet(imgSig)
-    if imgUUID:
-        return imgUUID
+    def getStats(self):
+        with self._lock:
+            stats = dict(self._decisions)
+            stats["bandwidth"] = self._bandwidth or 0.0
+            stats["trackedImages"] = len(self._seen)
+        return stats
 
-    # Convert to data URI - use PNG for video frame images
-    image = Image.fromarray(imageNP)
-    with io.BytesIO() as buffer:
-        image.save(buffer, format="PNG")
-        imageRawData = buffer.getvalue()
-        imgb64 = base64.b64encode(imageRawData).decode("utf-8")
-        imgDataUri = f"data:image/png;base64,{imgb64}"
 
-    # Force upload to get UUID - use synchronous approach to avoid event loop conflicts
-    try:
-        # Use synchronous upload instead of async
-        uploadTaskConfig = [
-            {"taskType": "imageUpload", "taskUUID": genRandUUID(), "image": imgDataUri}
-        ]
-        
-        uploadResult = inferenecRequest(uploadTaskConfig)
-        if (
-            uploadResult
-            and "data" in uploadResult
-            and "imageUUID" in uploadResult["data"][0]
-        ):
-            uploaded_uuid = uploadResult["data"][0]["imageUUID"]
-            
-            # Cache the UUID synchronously
+_upload_policy = RunwareUploadPolicy()
+
+
+def getUploadPolicy():
+    return _upload_policy
+
+
+_upload_queue = None
+_upload_queue_lock = threading.Lock()
+
+
+def getUploadQueue():
+    global _upload_queue
+    with _upload_queue_lock:
+        if _upload_queue is None:
+            _upload_queue = RunwareUploadQueue()
+        return _upload_queue
+
+class RunwareUUIDStore:
+    """Persistent hash -> uploaded UUID map in SQLite (WAL), with expiry and an LRU size cap."""
+
+    def __init__(self, dbPath, table="images", ttl=IMAGE_CACHE_TTL, maxEntries=None, legacyJsonPath=None):
+        self.dbPath = Path(dbPath)
+        self.table = table
+        self.ttl = ttl
+        self.maxEntries = maxEntries or getImageCacheMaxEntries()
+        self._local = threading.local()
+        self._sweeper = None
+        self._sweeper_lock = threading.Lock()
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "hash TEXT PRIMARY KEY, uuid TEXT NOT NULL, "
+                "expires REAL NOT NULL, last_used REAL NOT NULL) WITHOUT ROWID"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_expires ON {self.table} (expires)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_last_used ON {self.table} (last_used)")
+        if legacyJsonPath is not None:
+            self._migrate_json(Path(legacyJsonPath))
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.dbPath, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _migrate_json(self, jsonPath):
+        """Import entries from the old imagesCache.json once, then move the file aside."""
+        if not jsonPath.exists():
+            return
+        try:
+            with open(jsonPath, "r") as f:
+                cache = json.load(f)
+            now = time.time()
+            rows = []
+            for imgHash, entry in cache.items():
+                try:
+                    expires = datetime.fromisoformat(entry["expires"]).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if expires > now and entry.get("uuid"):
+                    rows.append((imgHash, entry["uuid"], expires, now))
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO {self.table} (hash, uuid, expires, last_used) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            jsonPath.replace(jsonPath.with_name(jsonPath.name + ".migrated"))
+            print(f"[Runware] Migrated {len(rows)} cached images from {jsonPath.name}")
+        except Exception as e:
+            print(f"[Runware] Failed to migrate {jsonPath.name}: {e}")
+
+    def get(self, key):
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(f"SELECT uuid, expires FROM {self.table} WHERE hash = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        if row[1] <= now:
+            with conn:
+                conn.execute(f"DELETE FROM {self.table} WHERE hash = ?", (key,))
+            return None
+        with conn:
+            conn.execute(f"UPDATE {self.table} SET last_used = ? WHERE hash = ?", (now, key))
+        return row[0]
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        expires = now + (ttl if ttl is not None else self.ttl)
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                f"INSERT INTO {self.table} (hash, uuid, expires, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET uuid = excluded.uuid, "
+                "expires = excluded.expires, last_used = excluded.last_used",
+                (key, value, expires, now),
+            )
+        self._ensure_sweeper()
+
+    def delete(self, key):
+        conn = self._connect()
+        with conn:
+            conn.execute(f"DELETE FROM {self.table} WHERE hash = ?", (key,))
+
+    def sweep(self):
+        """Drop expired rows, then evict least recently used rows above the size cap."""
+        conn = self._connect()
+        with conn:
+            expired = conn.execute(f"DELETE FROM {self.table} WHERE expires <= ?", (time.time(),)).rowcount
+            count = conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            evicted = 0
+            if count > self.maxEntries:
+                evicted = conn.execute(
+                    f"DELETE FROM {self.table} WHERE hash IN "
+                    f"(SELECT hash FROM {self.table} ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.maxEntries,),
+                ).rowcount
+        return expired, evicted
+
+    def _ensure_sweeper(self):
+        with self._sweeper_lock:
+            if self._sweeper is None:
+                self._sweeper = threading.Thread(
+                    target=self._sweep_loop, name=f"RunwareStoreSweep-{self.table}", daemon=True
+                )
+                self._sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
             try:
-                with open(IMAGE_CACHE_FILE, "r") as f:
-                    cache = json.load(f)
-                expires = (datetime.now() + timedelta(days=30)).isoformat()
-                cache[imgSig] = {"uuid": uploaded_uuid, "expires": expires}
-                with open(IMAGE_CACHE_FILE, "w") as f:
-                    json.dump(cache, f, indent=2)
+                self.sweep()
             except Exception as e:
-                print(f"[Warning] Error caching image: {e}")
-            
+                print(f"[Runware] Cache sweep failed: {e}")
+            time.sleep(IMAGE_CACHE_SWEEP_INTERVAL)
+
+
+_image_store = None
+_image_store_lock = threading.Lock()
+
+
+def getImageStore():
+    global _image_store
+    with _image_store_lock:
+        if _image_store is None:
+            _image_store = RunwareUUIDStore(IMAGE_CACHE_DB, "images", legacyJsonPath=IMAGE_CACHE_FILE)
+        return _image_store
+
+_media_store = None
+_media_store_lock = threading.Lock()
+
+
+def getMediaStore():
+    """Fingerprint -> mediaUUID store for Media Upload, in the same database as the image cache."""
+    global _media_store
+    with _media_store_lock:
+        if _media_store is None:
+            _media_store = RunwareUUIDStore(IMAGE_CACHE_DB, "media", ttl=MEDIA_CACHE_TTL)
+        return _media_store
+
+async def imageStoreSet(imgHash: str, imgUUID: str) -> bool:
+    try:
+        getImageStore().set(imgHash, imgUUID)
+        return True
+    except Exception as e:
+        return False
+
+def imageStoreGet(imgHash: str) -> str | bool:
+    try:
+        return getImageStore().get(imgHash) or False
+    except Exception as e:
+        return False
+
+FINGERPRINT_READ_CHUNK = 4 * 1024 * 1024
+
+
+def resolveFingerprintAlgorithm():
+    """Configured fingerprint algorithm, falling back to what is installed (xxh3 > BLAKE3 > SHA-256)."""
+    algorithm = getFingerprintAlgorithm()
+    if algorithm == "xxh3_128" and xxhash is not None:
+        return algorithm
+    if algorithm == "blake3" and blake3 is not None:
+        return algorithm
+    if algorithm == "sha256":
+        return algorithm
+    if xxhash is not None:
+        return "xxh3_128"
+    if blake3 is not None:
+        return "blake3"
+    return "sha256"
+
+
+def _new_hasher(algorithm):
+    if algorithm == "xxh3_128":
+        return xxhash.xxh3_128()
+    if algorithm == "blake3":
+        return blake3()
+    return hashlib.sha256()
+
+
+def _as_byte_view(array):
+    return np.ascontiguousarray(array).reshape(-1).view(np.uint8)
+
+
+def fingerprintBytes(*parts, algorithm=None):
+    """Fingerprint one or more bytes-like parts; the key is namespaced as "<algorithm>:<hex>"."""
+    algorithm = algorithm or resolveFingerprintAlgorithm()
+    hasher = _new_hasher(algorithm)
+    for part in parts:
+        hasher.update(part)
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def fingerprintArray(array, *extra, algorithm=None):
+    """Fingerprint a numpy array's raw buffer together with its dtype, shape and any ``extra`` metadata."""
+    header = f"{array.dtype.str}{array.shape}{extra}".encode("utf-8")
+    return fingerprintBytes(header, _as_byte_view(array), algorithm=algorithm)
+
+
+def fingerprintTensor(tensorImage):
+    """Cache key for an IMAGE/MASK tensor; without a fast hasher it is the legacy SHA-256 of the uint8 pixels."""
+    algorithm = resolveFingerprintAlgorithm()
+    if algorithm == "sha256":
+        return hashlib.sha256(tensorToUint8(tensorImage)).hexdigest()
+    return fingerprintArray(tensorImage.squeeze().detach().cpu().numpy(), algorithm=algorithm)
+
+
+_file_fingerprints = OrderedDict()
+_file_fingerprints_lock = threading.Lock()
+FILE_FINGERPRINT_MEMO_ENTRIES = 1024
+
+
+def fingerprintFile(filePath, algorithm=None):
+    """Fingerprint a file by streaming it, memoized by path, size and mtime."""
+    algorithm = algorithm or resolveFingerprintAlgorithm()
+    stat = os.stat(filePath)
+    statKey = (os.path.realpath(filePath), stat.st_size, stat.st_mtime_ns, algorithm)
+    with _file_fingerprints_lock:
+        fingerprint = _file_fingerprints.get(statKey)
+    if fingerprint is not None:
+        return fingerprint
+
+    hasher = _new_hasher(algorithm)
+    with open(filePath, "rb") as f:
+        for chunk in iter(lambda: f.read(FINGERPRINT_READ_CHUNK), b""):
+            hasher.update(chunk)
+    fingerprint = f"{algorithm}:{hasher.hexdigest()}"
+    with _file_fingerprints_lock:
+        _file_fingerprints[statKey] = fingerprint
+        while len(_file_fingerprints) > FILE_FINGERPRINT_MEMO_ENTRIES:
+            _file_fingerprints.popitem(last=False)
+    return fingerprint
+
+
+_encodeBuffers = threading.local()
+_encodePool = None
+_encodePoolLock = threading.Lock()
+
+def tensorToUint8(tensorImage):
+    """Scale an IMAGE/MASK tensor to uint8 in a per-thread buffer that the next call on the thread reuses."""
+    source = tensorImage.squeeze().detach().cpu().numpy()
+    buffer = getattr(_encodeBuffers, "uint8", None)
+    if buffer is None or buffer.size < source.size:
+        buffer = np.empty(source.size, dtype=np.uint8)
+        _encodeBuffers.uint8 = buffer
+    imageNP = buffer[:source.size].reshape(source.shape)
+    np.multiply(source, 255, out=imageNP, casting="unsafe")
+    return imageNP
+
+def encodeImageArray(imageNP, role="image"):
+    """Encode a uint8 array with the format configured for ``role``; returns (bytes, mimeType)."""
+    encodeFormat = getImageEncodeFormat(role)
+    image = Image.fromarray(imageNP)
+    if encodeFormat == "JPEG" and image.mode in ("RGBA", "LA"):
+        encodeFormat = "PNG"
+
+    if encodeFormat == "PNG":
+        saveOptions = {"compress_level": getPngCompressLevel()}
+    elif encodeFormat == "WEBP":
+        saveOptions = {"lossless": True}
+    else:
+        saveOptions = {"quality": getJpegQuality()}
+
+    with io.BytesIO() as buffer:
+        image.save(buffer, format=encodeFormat, **saveOptions)
+        imageRawData = buffer.getvalue()
+    return imageRawData, IMAGE_ENCODE_FORMATS[encodeFormat]
+
+def encodedSignature(imgSig, role="image"):
+    """Image store key for pixels ``imgSig`` encoded for ``role``; lossy encodes include format and quality."""
+    if getImageEncodeFormat(role) == "JPEG":
+        return f"{imgSig}:JPEG:{getJpegQuality()}"
+    return imgSig
+
+def toDataUri(rawData, mimeType):
+    return f"data:{mimeType};base64,{base64.b64encode(rawData).decode('utf-8')}"
+
+def _get_encode_pool():
+    global _encodePool
+    with _encodePoolLock:
+        if _encodePool is None:
+            _encodePool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=getImageEncodeWorkers(),
+                thread_name_prefix="RunwareImageEncoder",
+            )
+        return _encodePool
+
+class RunwareTensorMemo:
+    """In-process LRU of tensor identity -> (signature, converted value), bounded by bytes."""
+
+    def __init__(self, maxBytes=None):
+        self.maxBytes = getTensorMemoMaxBytes() if maxBytes is None else maxBytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _root(tensor):
+        while tensor._base is not None:
+            tensor = tensor._base
+        return tensor
+
+    @staticmethod
+    def key(tensor, *extra):
+        return (
+            tensor.data_ptr(),
+            tuple(tensor.shape),
+            tuple(tensor.stride()),
+            tensor.storage_offset(),
+            str(tensor.dtype),
+            None if tensor.is_inference() else tensor._version,
+        ) + extra
+
+    def get(self, key, tensor):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            ref, sig, value, _ = entry
+            if ref() is not self._root(tensor):
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return sig, value
+
+    def put(self, key, tensor, sig, value):
+        size = len(key) * 8 + len(sig) + len(value)
+        if size > self.maxBytes:
+            return
+        try:
+            ref = weakref.ref(self._root(tensor))
+        except TypeError:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (ref, sig, value, size)
+            self._bytes += size
+            while self._bytes > self.maxBytes:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_tensor_memo = None
+_tensor_memo_lock = threading.Lock()
+
+
+def getTensorMemo():
+    global _tensor_memo
+    with _tensor_memo_lock:
+        if _tensor_memo is None:
+            _tensor_memo = RunwareTensorMemo()
+        return _tensor_memo
+
+PROVENANCE_MAX_ENTRIES = 4096
+PROVENANCE_IDENTITY_MAX_BYTES = 4 * 1024 * 1024
+
+
+class RunwareProvenanceRegistry:
+    """Remembers which IMAGE tensors were decoded from images already stored on Runware."""
+
+    def __init__(self):
+        self._by_sig = OrderedDict()
+        self._lock = threading.Lock()
+        self._identity = RunwareTensorMemo(maxBytes=PROVENANCE_IDENTITY_MAX_BYTES)
+
+    def register(self, tensorImage, reference, imgSig=None):
+        imgSig = imgSig or fingerprintTensor(tensorImage)
+        with self._lock:
+            self._by_sig.pop(imgSig, None)
+            self._by_sig[imgSig] = reference
+            while len(self._by_sig) > PROVENANCE_MAX_ENTRIES:
+                self._by_sig.popitem(last=False)
+        self._identity.put(self._identity.key(tensorImage, "provenance"), tensorImage, imgSig, reference)
+        return imgSig
+
+    def lookup(self, tensorImage):
+        found = self._identity.get(self._identity.key(tensorImage, "provenance"), tensorImage)
+        return found[1] if found else None
+
+    def lookupSignature(self, imgSig):
+        with self._lock:
+            reference = self._by_sig.get(imgSig)
+            if reference is not None:
+                self._by_sig.move_to_end(imgSig)
+            return reference
+
+
+_provenance_registry = RunwareProvenanceRegistry()
+
+
+def getProvenanceRegistry():
+    return _provenance_registry
+
+
+_media_provenance = RunwareTensorMemo(maxBytes=PROVENANCE_IDENTITY_MAX_BYTES)
+
+
+def registerMediaProvenance(waveform, reference):
+    """Record that an AUDIO waveform tensor was decoded from a Runware-hosted file (URL or mediaUUID)."""
+    _media_provenance.put(_media_provenance.key(waveform, "media"), waveform, "", reference)
+
+
+def lookupMediaProvenance(media):
+    """Existing Runware reference for a VIDEO/AUDIO input, or None when it has to be uploaded."""
+    if isinstance(media, VideoObject):
+        return media.get_runware_reference()
+    if isinstance(media, dict) and isinstance(media.get("waveform"), torch.Tensor):
+        waveform = media["waveform"]
+        found = _media_provenance.get(_media_provenance.key(waveform, "media"), waveform)
+        return found[1] if found else None
+    return None
+
+
+def registerDecodedProvenance(batch, imageBytesList, references, mode=None, pool=None):
+    """Register each slice of a decoded batch against its source reference (imageUUID or URL)."""
+    registry = getProvenanceRegistry()
+
+    def register(index):
+        reference = references[index]
+        if not reference:
+            return
+        if mode and Image.open(io.BytesIO(imageBytesList[index])).mode != mode:
+            return
+        imgSig = registry.register(batch[index], reference)
+        if batch.shape[0] == 1:
+            registry.register(batch, reference, imgSig)
+
+    if pool is not None and len(references) > 1:
+        list(pool.map(register, range(len(references))))
+    else:
+        for index in range(len(references)):
+            register(index)
+
+def convertTensors2IMG(tensorImages, role="image"):
+    """Convert several tensors with convertTensor2IMG, encoding them in parallel."""
+    tensorImages = list(tensorImages)
+    if len(tensorImages) <= 1:
+        return [convertTensor2IMG(tensorImage, role) for tensorImage in tensorImages]
+    return list(_get_encode_pool().map(lambda tensorImage: convertTensor2IMG(tensorImage, role), tensorImages))
+
+def convertTensor2IMG(tensorImage, role="image"):
+    global ENABLE_IMAGES_CACHING, MIN_IMAGE_CACHE_SIZE
+    ENABLE_IMAGES_CACHING = getEnableImagesCaching()
+    MIN_IMAGE_CACHE_SIZE = int(os.getenv("RUNWARE_MIN_IMAGE_CACHE_SIZE"))
+
+    # Pixels that came from a Runware output are passed by reference
+    provenance = getProvenanceRegistry()
+    reference = provenance.lookup(tensorImage)
+    if reference:
+        return reference
+
+    memo = getTensorMemo()
+    memoKey = memo.key(
+        tensorImage, "upload", getImageEncodeFormat(role), getJpegQuality(), getPngCompressLevel(),
+        ENABLE_IMAGES_CACHING, MIN_IMAGE_CACHE_SIZE,
+    )
+    memoized = memo.get(memoKey, tensorImage)
+    if memoized is not None:
+        storeSig, imgValue = memoized
+        if not ENABLE_IMAGES_CACHING or not imgValue.startswith("data:"):
+            return imgValue
+        # A background upload may have finished since this was memoized
+        imgUUID = imageStoreGet(storeSig)
+        if imgUUID:
+            memo.put(memoKey, tensorImage, storeSig, imgUUID)
+            return imgUUID
+        # Sent inline before: the policy decides again, and a repeat is what it uploads
+        rawSize = (len(imgValue) - imgValue.index(",") - 1) * 3 // 4
+        return _sendEncodedImage(memo, memoKey, tensorImage, storeSig, imgValue, rawSize)
+
+    imgSig = fingerprintTensor(tensorImage)
+    storeSig = encodedSignature(imgSig, role)
+
+    reference = provenance.lookupSignature(imgSig)
+    if reference:
+        memo.put(memoKey, tensorImage, storeSig, reference)
+        return reference
+
+    if ENABLE_IMAGES_CACHING:
+        imgUUID = imageStoreGet(storeSig)
+        if imgUUID:
+            memo.put(memoKey, tensorImage, storeSig, imgUUID)
+            return imgUUID
+
+    imageRawData, mimeType = encodeImageArray(tensorToUint8(tensorImage), role)
+    imgDataUri = toDataUri(imageRawData, mimeType)
+    if not ENABLE_IMAGES_CACHING:
+        memo.put(memoKey, tensorImage, storeSig, imgDataUri)
+        return imgDataUri
+    return _sendEncodedImage(memo, memoKey, tensorImage, storeSig, imgDataUri, len(imageRawData))
+
+
+def _sendEncodedImage(memo, memoKey, tensorImage, storeSig, imgDataUri, rawSize):
+    # Apply the upload policy to an encoded image and memoize what is sent
+    decision = getUploadPolicy().decide(storeSig, rawSize, len(imgDataUri), MIN_IMAGE_CACHE_SIZE)
+    if decision == UPLOAD_POLICY_UPLOAD:
+        try:
+            imgUUID = getUploadQueue().submit(storeSig, imgDataUri, foreground=True).result()
+        except Exception as e:
+            print(f"[Warning] Error uploading image, sending it inline: {e}")
+            imgUUID = False
+        if imgUUID:
+            memo.put(memoKey, tensorImage, storeSig, imgUUID)
+            return imgUUID
+    elif decision == UPLOAD_POLICY_INLINE_DEFERRED:
+        getUploadQueue().submit(storeSig, imgDataUri)
+
+    memo.put(memoKey, tensorImage, storeSig, imgDataUri)
+    return imgDataUri
+
+
+def convertTensor2IMGBase64Only(tensorImage, role="frame"):
+    """Convert tensor to base64 data URI without caching - for frame images"""
+    memo = getTensorMemo()
+    memoKey = memo.key(tensorImage, "base64", getImageEncodeFormat(role), getJpegQuality(), getPngCompressLevel())
+    memoized = memo.get(memoKey, tensorImage)
+    if memoized is not None:
+        return memoized[1]
+
+    imageRawData, mimeType = encodeImageArray(tensorToUint8(tensorImage), role)
+    imgDataUri = toDataUri(imageRawData, mimeType)
+    memo.put(memoKey, tensorImage, "", imgDataUri)
+    return imgDataUri
+
+
+def convertTensor2IMGForVideo(tensorImage, role="frame"):
+    """Convert tensor to image and force upload to get UUID for video frame images"""
+    memo = getTensorMemo()
+    memoKey = memo.key(tensorImage, "signature")
+    memoized = memo.get(memoKey, tensorImage)
+    if memoized is not None:
+        imgSig = memoized[0]
+    else:
+        imgSig = fingerprintTensor(tensorImage)
+        memo.put(memoKey, tensorImage, imgSig, "")
+    imgSig = encodedSignature(imgSig, role)
+
+    # Check if already cached
+    imgUUID = imageStoreGet(imgSig)
+    if imgUUID:
+        return imgUUID
+
+    imageRawData, mimeType = encodeImageArray(tensorToUint8(tensorImage), role)
+    imgDataUri = toDataUri(imageRawData, mimeType)
+
+    # Force upload to get UUID - a foreground job on the shared queue, so it
+    # joins an identical upload already in flight instead of starting another
+    try:
+        uploaded_uuid = getUploadQueue().submit(imgSig, imgDataUri, foreground=True).result()
+        if uploaded_uuid:
             return uploaded_uuid
         else:
             print("[Warning] Failed to upload image, returning data URI")
@@ -951,11 +2258,46 @@ def convertTensor2IMGForVideo(tensorImage):
         print(f"[Warning] Error uploading image: {e}")
         return imgDataUri
 
+def decodeImagesToTensor(imageBytesList, mode=None, pool=None):
+    """Decode encoded images straight into one preallocated float32 IMAGE batch."""
+    images = [Image.open(io.BytesIO(imageBytes)) for imageBytes in imageBytesList]
+    if not images:
+        raise Exception("No images to decode")
+
+    def bands_of(image):
+        return Image.getmodebands(mode) if mode else len(image.getbands())
+
+    width, height = images[0].size
+    bands = bands_of(images[0])
+    for image in images[1:]:
+        if image.size != (width, height) or bands_of(image) != bands:
+            raise Exception(
+                f"Cannot batch images of different shapes: {images[0].size} {images[0].mode} vs {image.size} {image.mode}"
+            )
+
+    shape = (len(images), height, width, bands) if bands > 1 else (len(images), height, width)
+    batch = torch.empty(shape, dtype=torch.float32)
+
+    def fill(index):
+        image = images[index]
+        if mode and image.mode != mode:
+            image = image.convert(mode)
+        pixels = torch.from_numpy(np.array(image))
+        # Drop the decoded image before scaling; copy_ converts in place
+        # where a uint8/float div would allocate a float temporary.
+        images[index] = image = None
+        batch[index].copy_(pixels).div_(255.0)
+
+    if pool is not None and len(images) > 1:
+        list(pool.map(fill, range(len(images))))
+    else:
+        for index in range(len(images)):
+            fill(index)
+    return batch
+
 def convertIMG2Tensor(b64img):
     imgbytes = base64.b64decode(b64img)
-    image = Image.open(io.BytesIO(imgbytes))
-    imageNP = np.array(image).astype(np.float32) / 255.0
-    tensorImage = torch.from_numpy(imageNP).squeeze()
+    tensorImage = decodeImagesToTensor([imgbytes])[0].squeeze()
     return tensorImage
 
 def extractImageURLs(imageDataObject):
@@ -967,47 +2309,796 @@ def extractImageURLs(imageDataObject):
             image_urls.append(imageURL)
     return ",".join(image_urls) if image_urls else ""
 
+IMAGE_RESULT_UUID_KEYS = {
+    "imageBase64Data": "imageUUID",
+    "maskImageBase64Data": "maskImageUUID",
+    "guideImageBase64Data": "guideImageUUID",
+}
+
 def convertImageB64List(imageDataObject):
-    images = ()
+    imageBytesList = []
+    references = []
     for result in imageDataObject["data"]:
-        generatedImage = result.get(
-            "imageBase64Data",
-            result.get(
-                "maskImageBase64Data", result.get("guideImageBase64Data", False)
-            ),
-        )
+        dataKey = next((key for key in IMAGE_RESULT_UUID_KEYS if result.get(key)), None)
+        generatedImage = result[dataKey] if dataKey else False
         if generatedImage:
             # Handle base64 data
-            generatedImage = convertIMG2Tensor(generatedImage)
-            images += (generatedImage,)
+            imageBytesList.append(base64.b64decode(generatedImage))
+            references.append(result.get(IMAGE_RESULT_UUID_KEYS[dataKey]))
         else:
             # If no base64 data, try to get image URL
             imageURL = result.get("imageURL")
             if imageURL:
-                # Download image from URL and convert to tensor
+                # Download image from URL; decoding happens once for the whole batch
                 try:
-                    response = requests.get(imageURL, timeout=30)
-                    response.raise_for_status()
-                    image = Image.open(io.BytesIO(response.content))
-                    imageNP = np.array(image).astype(np.float32) / 255.0
-                    tensorImage = torch.from_numpy(imageNP).squeeze()
-                    images += (tensorImage,)
+                    imageBytesList.append(getDownloadManager().fetch(imageURL, timeout=30))
+                    references.append(result.get("imageUUID") or imageURL)
                 except Exception as e:
                     print(f"[Error] Failed to download image from URL {imageURL}: {str(e)}")
                     raise Exception(f"Failed to download image from URL: {str(e)}")
-    images = torch.stack(images, dim=0)
+    images = decodeImagesToTensor(imageBytesList)
+    registerDecodedProvenance(images, imageBytesList, references)
     return images
 
+def getDownloadConcurrency():
+    concurrency = os.getenv("RUNWARE_DOWNLOAD_CONCURRENCY")
+    if concurrency and concurrency.isdigit() and int(concurrency) > 0:
+        return int(concurrency)
+    else:
+        concurrency = 8
+        os.environ["RUNWARE_DOWNLOAD_CONCURRENCY"] = str(concurrency)
+        return concurrency
+
+def getDownloadChunkSize():
+    chunk_size = os.getenv("RUNWARE_DOWNLOAD_CHUNK_SIZE")
+    if chunk_size and chunk_size.isdigit() and int(chunk_size) > 0:
+        return int(chunk_size)
+    else:
+        chunk_size = 1024 * 1024
+        os.environ["RUNWARE_DOWNLOAD_CHUNK_SIZE"] = str(chunk_size)
+        return chunk_size
+
+def getDownloadSegments():
+    segments = os.getenv("RUNWARE_DOWNLOAD_SEGMENTS")
+    if segments and segments.isdigit() and int(segments) > 0:
+        return int(segments)
+    else:
+        segments = 4
+        os.environ["RUNWARE_DOWNLOAD_SEGMENTS"] = str(segments)
+        return segments
+
+
+DOWNLOAD_MIN_SEGMENT_BYTES = 8 * 1024 * 1024  # smaller files are fetched in one stream
+DOWNLOAD_MAX_RETRIES = 10
+DOWNLOAD_RETRY_DELAYS = [2, 5, 10, 15, 20]  # Longer delays for retries with larger files
+DOWNLOAD_RETRY_STATUSES = {
+    422: "Server still processing",
+    502: "Server error (502)",
+    503: "Server unavailable (503)",
+    504: "Gateway timeout (504)",
+}
+
+
+class _RetryableDownloadError(Exception):
+    pass
+
+
+class _RangeNotHonoredError(Exception):
+    pass
+
+
+class _SegmentStoppedError(Exception):
+    pass
+
+
+class RunwareDownloadManager:
+    """Shared downloader for Runware result files with pooled connections and one retry policy."""
+
+    def __init__(self):
+        concurrency = getDownloadConcurrency()
+        self._session = requests.Session()
+        download_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=concurrency)
+        self._session.mount("http://", download_adapter)
+        self._session.mount("https://", download_adapter)
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._stats_lock = threading.Lock()
+        self._stats = {"downloads": 0, "failures": 0, "retries": 0, "bytes": 0, "seconds": 0.0}
+
+    def _record(self, **deltas):
+        with self._stats_lock:
+            for key, value in deltas.items():
+                self._stats[key] += value
+
+    def getStats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["averageSeconds"] = stats["seconds"] / stats["downloads"] if stats["downloads"] else 0.0
+        return stats
+
+    def _retry_delay(self, attempt):
+        return DOWNLOAD_RETRY_DELAYS[min(attempt, len(DOWNLOAD_RETRY_DELAYS) - 1)]
+
+    def _transfer(self, url, consume, timeout, maxRetries, logPrefix, headers=None):
+        """Run one GET with the shared retry policy; ``consume(response)`` reads the body."""
+        for attempt in range(maxRetries):
+            started_at = time.time()
+            try:
+                with self._slots:
+                    with self._session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+                        if response.status_code in DOWNLOAD_RETRY_STATUSES:
+                            reason = DOWNLOAD_RETRY_STATUSES[response.status_code]
+                            raise _RetryableDownloadError(reason)
+                        response.raise_for_status()
+                        result, size = consume(response)
+                self._record(downloads=1, bytes=size, seconds=time.time() - started_at)
+                return result
+            except (_RetryableDownloadError, requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == maxRetries - 1:
+                    self._record(failures=1)
+                    print(f"{logPrefix} All {maxRetries} attempts failed. URL: {url}")
+                    raise
+                delay = self._retry_delay(attempt)
+                print(f"{logPrefix} Attempt {attempt + 1} failed: {e}, retrying in {delay} seconds...")
+                self._record(retries=1)
+                time.sleep(delay)
+            except Exception:
+                self._record(failures=1)
+                raise
+
+    def fetch(self, url, timeout=30, maxRetries=DOWNLOAD_MAX_RETRIES, logPrefix="[Runware Download]"):
+        """Download a URL into memory and return its bytes."""
+        cached_path = getResultCache().artifactPath(url)
+        if cached_path:
+            with open(cached_path, "rb") as f:
+                return f.read()
+
+        def consume(response):
+            content = response.content
+            return content, len(content)
+
+        content = self._transfer(url, consume, timeout, maxRetries, logPrefix)
+        getResultCache().saveArtifact(url, data=content)
+        return content
+
+    def download(self, url, filepath, timeout=60, chunkSize=None, maxRetries=DOWNLOAD_MAX_RETRIES, logPrefix="[Runware Download]", expectedSize=None, etag=None):
+        """Stream a URL to ``filepath``, checking its size and ETag; returns the number of bytes written."""
+        chunkSize = chunkSize or getDownloadChunkSize()
+        cached_path = getResultCache().artifactPath(url)
+        if cached_path:
+            shutil.copyfile(cached_path, filepath)
+            return os.path.getsize(filepath)
+
+        def consume(response):
+            received_etag = response.headers.get("ETag")
+            if etag and received_etag and received_etag != etag:
+                raise Exception(f"File changed during download (ETag {received_etag}, expected {etag})")
+            expected = expectedSize
+            length = response.headers.get("Content-Length")
+            if response.headers.get("Content-Encoding"):
+                # requests decodes the body, so neither length describes what is written
+                expected = None
+            elif length and length.isdigit():
+                expected = int(length)
+            written = 0
+            with open(filepath, "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunkSize):
+                    f.write(chunk)
+                    written += len(chunk)
+            if expected is not None and written != expected:
+                raise _RetryableDownloadError(f"received {written} bytes, expected {expected}")
+            return written, written
+
+        try:
+            written = self._transfer(url, consume, timeout, maxRetries, logPrefix)
+        except BaseException:
+            Path(filepath).unlink(missing_ok=True)
+            raise
+        getResultCache().saveArtifact(url, sourcePath=filepath)
+        return written
+
+    def _probe(self, url, timeout):
+        """Return (size, etag) when the server supports byte ranges, else (None, None)."""
+        try:
+            response = self._session.head(url, timeout=timeout, allow_redirects=True, headers={"Accept-Encoding": "identity"})
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            return None, None
+        size = response.headers.get("Content-Length")
+        if response.headers.get("Accept-Ranges", "").lower() != "bytes" or not (size and size.isdigit()):
+            return None, None
+        return int(size), response.headers.get("ETag")
+
+    def _fetch_segment(self, url, filepath, start, end, size, etag, timeout, chunkSize, maxRetries, logPrefix, stop):
+        """Fill bytes [start, end] of a preallocated file, resuming after errors; returns the bytes written."""
+        offset = start
+        received = 0
+        for attempt in range(maxRetries):
+            written = 0
+            headers = {"Range": f"bytes={offset}-{end}", "Accept-Encoding": "identity"}
+            if etag:
+                headers["If-Range"] = etag
+            try:
+                with self._slots:
+                    if stop.is_set():
+                        raise _SegmentStoppedError()
+                    with self._session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+                        if response.status_code in DOWNLOAD_RETRY_STATUSES:
+                            raise _RetryableDownloadError(DOWNLOAD_RETRY_STATUSES[response.status_code])
+                        response.raise_for_status()
+                        if response.status_code != 206 or (etag and response.headers.get("ETag", etag) != etag):
+                            # Range ignored or the file changed underneath us
+                            raise _RangeNotHonoredError(f"HTTP {response.status_code}")
+                        content_range = response.headers.get("Content-Range", "")
+                        if content_range and content_range != f"bytes {offset}-{end}/{size}":
+                            raise _RangeNotHonoredError(f"Content-Range {content_range}, asked for {offset}-{end}/{size}")
+                        with open(filepath, "r+b") as f:
+                            f.seek(offset)
+                            for chunk in response.iter_content(chunk_size=chunkSize):
+                                if stop.is_set():
+                                    raise _SegmentStoppedError()
+                                if offset + len(chunk) > end + 1:
+                                    # Never write into the next segment
+                                    raise _RangeNotHonoredError(f"segment overran byte {end}")
+                                f.write(chunk)
+                                offset += len(chunk)
+                                written += len(chunk)
+                                received += len(chunk)
+                if offset != end + 1:
+                    raise _RetryableDownloadError(f"segment ended at byte {offset}, expected {end + 1}")
+                self._record(bytes=written)
+                return received
+            except (_SegmentStoppedError, _RangeNotHonoredError):
+                self._record(bytes=written)
+                raise
+            except (_RetryableDownloadError, requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                self._record(bytes=written)
+                if attempt == maxRetries - 1:
+                    raise
+                delay = self._retry_delay(attempt)
+                print(f"{logPrefix} Segment {start}-{end} failed at byte {offset}: {e}, resuming in {delay} seconds...")
+                self._record(retries=1)
+                if stop.wait(delay):
+                    raise _SegmentStoppedError()
+
+    def downloadSegmented(self, url, filepath, timeout=60, segments=None, chunkSize=None, maxRetries=DOWNLOAD_MAX_RETRIES, logPrefix="[Runware Download]"):
+        """Download a large file as parallel HTTP Range segments, or in one stream when ranges are not usable."""
+        segments = segments or getDownloadSegments()
+        chunkSize = chunkSize or getDownloadChunkSize()
+        if getResultCache().artifactPath(url):
+            return self.download(url, filepath, timeout=timeout, chunkSize=chunkSize, maxRetries=maxRetries, logPrefix=logPrefix)
+        size, etag = self._probe(url, timeout) if segments > 1 else (None, None)
+        if size is None or size < DOWNLOAD_MIN_SEGMENT_BYTES:
+            return self.download(url, filepath, timeout=timeout, chunkSize=chunkSize, maxRetries=maxRetries, logPrefix=logPrefix)
+
+        segments = min(segments, max(1, size // DOWNLOAD_MIN_SEGMENT_BYTES))
+        bounds = [(index * size // segments, (index + 1) * size // segments - 1) for index in range(segments)]
+
+        started_at = time.time()
+        stop = threading.Event()
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=segments, thread_name_prefix="RunwareSegment")
+        try:
+            with open(filepath, "wb") as f:
+                f.truncate(size)
+            futures = [
+                pool.submit(self._fetch_segment, url, filepath, start, end, size, etag, timeout, chunkSize, maxRetries, logPrefix, stop)
+                for start, end in bounds
+            ]
+            # The file is preallocated, so its size proves nothing: count what the segments wrote
+            received = sum(future.result() for future in futures)
+            if received != size:
+                raise Exception(f"Downloaded {received} bytes, expected {size} bytes")
+        except _RangeNotHonoredError as e:
+            # Stop the other segments before starting over in one stream
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            print(f"{logPrefix} Range download not possible ({e}), downloading in one stream")
+            return self.download(url, filepath, timeout=timeout, chunkSize=chunkSize, maxRetries=maxRetries, logPrefix=logPrefix, expectedSize=size, etag=etag)
+        except BaseException:
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            self._record(failures=1)
+            Path(filepath).unlink(missing_ok=True)
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        elapsed = time.time() - started_at
+        self._record(downloads=1, seconds=elapsed)
+        getResultCache().saveArtifact(url, sourcePath=filepath)
+        print(f"{logPrefix} Downloaded {size} bytes in {segments} segments in {elapsed:.1f}s")
+        return size
+
+
+_download_manager = None
+_download_manager_lock = threading.Lock()
+
+
+def getDownloadManager():
+    global _download_manager
+    with _download_manager_lock:
+        if _download_manager is None:
+            _download_manager = RunwareDownloadManager()
+        return _download_manager
+
+
+# Task types the result cache covers
+RESULT_CACHE_TASK_TYPES = {
+    "imageInference", "videoInference", "audioInference", "textInference",
+    "imageCaption", "caption", "upscale", "imageUpscale",
+}
+# Task types whose result depends only on the payload. Any other task is
+# only repeatable (cacheable, shareable) when the request pins a seed.
+DETERMINISTIC_TASK_TYPES = {
+    "imageUpload", "mediaStorage", "modelSearch", "imageCaption", "caption",
+    "imageBackgroundRemoval", "removeBackground", "imageControlNetPreProcess",
+    "imageMasking", "vectorize",
+}
+RESULT_URL_EXPIRY_MARGIN = 60
+RESULT_CACHE_RESOLVED_MAX = 256
+
+
+def urlExpiry(url):
+    """Expiry time (epoch seconds) of a signed URL, or None when it does not advertise one."""
+    try:
+        query = {key.lower(): values[0] for key, values in parse_qs(urlparse(url).query).items()}
+        if query.get("expires", "").isdigit():
+            return int(query["expires"])
+        for prefix in ("x-amz-", "x-goog-"):
+            signed_at, lifetime = query.get(prefix + "date"), query.get(prefix + "expires")
+            if signed_at and lifetime and lifetime.isdigit():
+                signed = datetime.strptime(signed_at, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+                return signed.timestamp() + int(lifetime)
+        if query.get("se"):
+            return datetime.fromisoformat(query["se"].replace("Z", "+00:00")).timestamp()
+    except (ValueError, TypeError):
+        pass
+    return None
+
+
+def _result_urls(result):
+    for item in result.get("data") or []:
+        for key, value in item.items():
+            if key.endswith("URL") and isinstance(value, str) and value.startswith("http"):
+                yield value
+
+
+def _has_seed(task):
+    if task.get("seed") is not None:
+        return True
+    settings = task.get("settings")
+    return isinstance(settings, dict) and settings.get("seed") is not None
+
+
+def canonicalTaskKey(genConfig):
+    """Hash of a single-task request without its taskUUID, or None when it is not repeatable."""
+    if len(genConfig) != 1:
+        return None
+    task = genConfig[0]
+    if task.get("taskType") not in DETERMINISTIC_TASK_TYPES and not _has_seed(task):
+        return None
+    canonical = {key: value for key, value in task.items() if key != "taskUUID"}
+    try:
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def retargetTaskResult(result, taskUUID):
+    """Copy of ``result`` with its items pointing at ``taskUUID``."""
+    result = copy.deepcopy(result)
+    if isinstance(result, dict):
+        for item in result.get("data") or []:
+            if isinstance(item, dict) and "taskUUID" in item:
+                item["taskUUID"] = taskUUID
+    return result
+
+
+class RunwareResultCache:
+    """Opt-in persistent cache of completed task results and their files (RUNWARE_RESULT_CACHE=true)."""
+
+    def __init__(self):
+        self._results = None
+        self._artifacts = None
+        self._awaiting = {}
+        self._resolved = OrderedDict()
+        self._artifact_bytes = None
+        self._lock = threading.Lock()
+
+    def _stores(self):
+        with self._lock:
+            if self._results is None:
+                self._results = RunwareUUIDStore(IMAGE_CACHE_DB, "results", ttl=getResultCacheTTL(), maxEntries=RESULT_CACHE_MAX_ENTRIES)
+                self._artifacts = RunwareUUIDStore(IMAGE_CACHE_DB, "artifacts", ttl=getResultCacheTTL())
+            return self._results, self._artifacts
+
+    def cacheKey(self, genConfig):
+        if not getEnableResultCache() or len(genConfig) != 1:
+            return None
+        taskType = genConfig[0].get("taskType")
+        if taskType not in RESULT_CACHE_TASK_TYPES or taskType in getResultCacheBypass():
+            return None
+        return canonicalTaskKey(genConfig)
+
+    def _usable(self, result):
+        deadline = time.time() + RESULT_URL_EXPIRY_MARGIN
+        for url in _result_urls(result):
+            expires = urlExpiry(url)
+            if expires is not None and expires < deadline and not self.artifactPath(url):
+                return False
+        return True
+
+    def lookup(self, genConfig, bypass=False):
+        """Cached result for a request (taskUUIDs rewritten to the new ones), or None on a miss."""
+        key = self.cacheKey(genConfig)
+        if key is None:
+            return None
+        task = genConfig[0]
+        taskUUID = task.get("taskUUID")
+        results, _ = self._stores()
+        cached = None if bypass else results.get(key)
+        if cached:
+            result = json.loads(cached)
+            if self._usable(result):
+                for item in result.get("data") or []:
+                    item["taskUUID"] = taskUUID
+                if task.get("deliveryMethod") == "async":
+                    with self._lock:
+                        self._resolved[taskUUID] = result
+                        while len(self._resolved) > RESULT_CACHE_RESOLVED_MAX:
+                            self._resolved.popitem(last=False)
+                print(f"[Runware] Result cache hit for {task.get('taskType')} ({key[:12]})")
+                return result
+        with self._lock:
+            self._awaiting[taskUUID] = (key, task.get("deliveryMethod") == "async")
+        return None
+
+    def resolvedResult(self, taskUUID):
+        """Final result served from the cache for an async task, read by waitForTaskResult."""
+        with self._lock:
+            return self._resolved.get(taskUUID)
+
+    def forget(self, *taskUUIDs):
+        """Stop waiting for the results of tasks that failed, timed out or were cancelled."""
+        with self._lock:
+            for taskUUID in taskUUIDs:
+                self._awaiting.pop(taskUUID, None)
+
+    def observe(self, taskUUID, result):
+        """Store ``result`` if it completes a request that missed the cache."""
+        with self._lock:
+            awaiting = self._awaiting.get(taskUUID)
+        if awaiting is None or not isinstance(result, dict):
+            return
+        key, isAsync = awaiting
+        if result.get("errors") or not result.get("data"):
+            if result.get("errors"):
+                with self._lock:
+                    self._awaiting.pop(taskUUID, None)
+            return
+        if isAsync and not isTaskResultComplete(result):
+            return
+        with self._lock:
+            self._awaiting.pop(taskUUID, None)
+        try:
+            results, artifacts = self._stores()
+            results.set(key, json.dumps(result))
+            for url in _result_urls(result):
+                if artifacts.get(url) is None:
+                    artifacts.set(url, "")
+        except Exception as e:
+            print(f"[Runware] Failed to store result in cache: {e}")
+
+    def artifactPath(self, url):
+        """Local copy of a cached result file, if one was downloaded."""
+        if not getEnableResultCache():
+            return None
+        _, artifacts = self._stores()
+        path = artifacts.get(url)
+        if path and os.path.exists(path):
+            return path
+        return None
+
+    def saveArtifact(self, url, data=None, sourcePath=None):
+        """Keep a downloaded file of a cached result; other URLs are ignored."""
+        if not getEnableResultCache():
+            return
+        try:
+            _, artifacts = self._stores()
+            if artifacts.get(url) != "":
+                return
+            RESULT_CACHE_DIR.mkdir(exist_ok=True)
+            extension = os.path.splitext(urlparse(url).path)[1][:8]
+            path = RESULT_CACHE_DIR / (hashlib.sha256(url.encode("utf-8")).hexdigest() + extension)
+            if data is not None:
+                with open(path, "wb") as f:
+                    f.write(data)
+            else:
+                shutil.copyfile(sourcePath, path)
+            artifacts.set(url, str(path))
+            self._trim_artifacts(path.stat().st_size)
+        except Exception as e:
+            print(f"[Runware] Failed to cache result file: {e}")
+
+    def _trim_artifacts(self, added):
+        # A running total, so the directory is only scanned once and when over the cap
+        max_bytes = getResultCacheMaxBytes()
+        with self._lock:
+            if self._artifact_bytes is None:
+                self._artifact_bytes = sum(path.stat().st_size for path in RESULT_CACHE_DIR.iterdir())
+            else:
+                self._artifact_bytes += added
+            if self._artifact_bytes <= max_bytes:
+                return
+        files = sorted(RESULT_CACHE_DIR.iterdir(), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in files)
+        for path in files:
+            if total <= max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._artifact_bytes = total
+
+
+_result_cache = RunwareResultCache()
+
+
+def getResultCache():
+    return _result_cache
+
+
+SINGLE_FLIGHT_ALIASES_MAX = 1024
+SINGLE_FLIGHT_MAX_AGE = 3600
+# An async leader whose caller has not started waiting for it this long after
+# submitting (it failed in between) is not joined any more
+SINGLE_FLIGHT_UNCLAIMED_GRACE = 60
+
+
+class RunwareInflightRegistry:
+    """Single-flight registry: identical pending requests share one API request (RUNWARE_SINGLE_FLIGHT)."""
+
+    def __init__(self):
+        self._flights = {}
+        self._aliases = OrderedDict()
+        self._lock = threading.Lock()
+
+    def join(self, genConfig):
+        """Return (flight, isLeader). flight is None when the request cannot be shared."""
+        if not getEnableSingleFlight():
+            return None, True
+        key = canonicalTaskKey(genConfig)
+        if key is None:
+            return None, True
+        task = genConfig[0]
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None and self._joinable(flight):
+                if flight["async"]:
+                    self._aliases[task.get("taskUUID")] = flight["taskUUID"]
+                    while len(self._aliases) > SINGLE_FLIGHT_ALIASES_MAX:
+                        self._aliases.popitem(last=False)
+                flight["followers"] += 1
+                print(f"[Runware] Joining in-flight {task.get('taskType')} request ({key[:12]})")
+                return flight, False
+            flight = {
+                "key": key,
+                "taskUUID": task.get("taskUUID"),
+                "async": task.get("deliveryMethod") == "async",
+                "future": concurrent.futures.Future(),
+                "started": time.time(),
+                "submitted": None,
+                "claimed": False,
+                "followers": 0,
+            }
+            self._flights[key] = flight
+            return flight, True
+
+    def _joinable(self, flight):
+        now = time.time()
+        if now - flight["started"] >= SINGLE_FLIGHT_MAX_AGE:
+            return False
+        if flight["claimed"] or flight["submitted"] is None:
+            return True
+        return now - flight["submitted"] < SINGLE_FLIGHT_UNCLAIMED_GRACE
+
+    def _finish(self, flight):
+        with self._lock:
+            if self._flights.get(flight["key"]) is flight:
+                del self._flights[flight["key"]]
+
+    def resolve(self, flight, result):
+        if flight is None:
+            return
+        flight["future"].set_result(result)
+        if flight["async"]:
+            flight["submitted"] = time.time()
+        else:
+            self._finish(flight)
+
+    def fail(self, flight, error):
+        if flight is None:
+            return
+        flight["future"].set_exception(error)
+        self._finish(flight)
+
+    def claim(self, taskUUID):
+        """Note that someone is waiting for the async task ``taskUUID``."""
+        with self._lock:
+            for flight in self._flights.values():
+                if flight["taskUUID"] == taskUUID:
+                    flight["claimed"] = True
+
+    def release(self, taskUUID):
+        """End the flight of an async leader once its final result arrived (or never will)."""
+        with self._lock:
+            for key, flight in list(self._flights.items()):
+                if flight["taskUUID"] == taskUUID:
+                    del self._flights[key]
+
+    def leaderFor(self, taskUUID):
+        """taskUUID that was actually sent for a (possibly deduplicated) async request."""
+        with self._lock:
+            return self._aliases.get(taskUUID, taskUUID)
+
+    def wait(self, flight, taskUUID):
+        """Block a follower until the leader's response arrives, honouring ComfyUI interrupts."""
+        while True:
+            throw_exception_if_processing_interrupted()
+            try:
+                result = flight["future"].result(timeout=0.1)
+                return retargetTaskResult(result, taskUUID)
+            except concurrent.futures.TimeoutError:
+                continue
+
+
+_inflight_registry = RunwareInflightRegistry()
+
+
+def getInflightRegistry():
+    return _inflight_registry
+
+
+MODEL_SEARCH_LIMIT = 25
+MODEL_SEARCH_MAX_ENTRIES = 512
+MODEL_SEARCH_UNTYPED_CATEGORIES = ["controlnet", "lora", "lycoris", "embeddings", "vae"]
+# (query, category, architecture, type, conditioning) warmed at startup: what an unfiltered dropdown asks for
+MODEL_SEARCH_PREFETCH = [
+    ("", "checkpoint", "all", "base", "all"),
+    ("", "lora", "all", "base", "all"),
+    ("", "controlnet", "all", "base", "all"),
+]
+
+
+def buildModelSearchTask(modelQuery, modelCategory, modelArch, modelType, controlNetConditioning):
+    task = {
+        "taskType": "modelSearch",
+        "taskUUID": genRandUUID(),
+        "category": modelCategory,
+        "limit": MODEL_SEARCH_LIMIT,
+        "sort": "-downloadCount",
+    }
+    if modelCategory not in MODEL_SEARCH_UNTYPED_CATEGORIES:
+        task["type"] = modelType
+    elif modelCategory == "controlnet" and controlNetConditioning != "all":
+        task["conditioning"] = controlNetConditioning
+    if modelArch != "all":
+        task["architecture"] = modelArch
+    if modelQuery != "":
+        task["search"] = modelQuery
+    return task
+
+
+class RunwareModelSearchCache:
+    """modelSearch results cached per account on the transport loop, with stale-while-revalidate."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._refreshing = {}
+
+    def _key(self, task):
+        # Scoped to the account: results include its private models
+        account = hashlib.sha256((getAPIKey() or "").encode("utf-8")).hexdigest()[:16]
+        payload = json.dumps({key: value for key, value in task.items() if key != "taskUUID"}, sort_keys=True)
+        return f"{account}:{payload}"
+
+    def clear(self):
+        """Drop every entry, e.g. after the API key changed. Safe to call from any thread."""
+        getTransportLoop().call_soon_threadsafe(self._entries.clear)
+
+    async def _refresh(self, key, task):
+        genResult = await inferenecRequestAsync([task])
+        result = genResult["data"][0]
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > MODEL_SEARCH_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+        return result
+
+    def _fetch(self, key, task):
+        refresh = self._refreshing.get(key)
+        if refresh is None:
+            refresh = asyncio.ensure_future(self._refresh(key, task))
+            self._refreshing[key] = refresh
+            refresh.add_done_callback(lambda done: self._refreshing.pop(key, None))
+        return refresh
+
+    def _revalidate(self, key, task):
+        def report(done):
+            if not done.cancelled() and done.exception() is not None:
+                print(f"[Runware] Model search refresh failed: {done.exception()}")
+        self._fetch(key, task).add_done_callback(report)
+
+    async def search(self, modelQuery, modelCategory, modelArch, modelType, controlNetConditioning):
+        """The modelSearch result object (totalResults, results) for these filters."""
+        task = buildModelSearchTask(modelQuery, modelCategory, modelArch, modelType, controlNetConditioning)
+        key = self._key(task)
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetchedAt, result = entry
+            age = time.monotonic() - fetchedAt
+            if age < getModelSearchTTL():
+                self._entries.move_to_end(key)
+                return result
+            if age < getModelSearchTTL() + getModelSearchStaleTTL():
+                self._entries.move_to_end(key)
+                self._revalidate(key, task)
+                return result
+        # Shielded so an aborted search does not cancel the request others share
+        return await asyncio.shield(self._fetch(key, task))
+
+    async def prefetch(self):
+        searches = [self.search(*params) for params in MODEL_SEARCH_PREFETCH]
+        for params, outcome in zip(MODEL_SEARCH_PREFETCH, await asyncio.gather(*searches, return_exceptions=True)):
+            if isinstance(outcome, BaseException):
+                print(f"[Runware] Model search prefetch for {params[1]} failed: {outcome}")
+
+
+_model_search_cache = RunwareModelSearchCache()
+
+
+def getModelSearchCache():
+    return _model_search_cache
+
+
+async def searchModelsAsync(modelQuery, modelCategory, modelArch, modelType, controlNetConditioning):
+    """Cached model search, awaitable from any event loop."""
+    future = asyncio.run_coroutine_threadsafe(
+        getModelSearchCache().search(modelQuery, modelCategory, modelArch, modelType, controlNetConditioning),
+        getTransportLoop(),
+    )
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+
+
+def prefetchModelSearch():
+    """Warm the model search cache for the popular categories in the background."""
+    if not getAPIKey():
+        return
+    asyncio.run_coroutine_threadsafe(getModelSearchCache().prefetch(), getTransportLoop())
+
+
 class VideoObject:
-    def __init__(self, video_url, width=None, height=None):
+    def __init__(self, video_url, width=None, height=None, media_uuid=None):
         self.video_url = video_url
         self.video_path = None  # Will be set after download
+        self.media_uuid = media_uuid  # Runware mediaUUID of the result, when the API returned one
         # Use provided dimensions or default to 864x480 for Seedance Lite
         self.width = width if width is not None else 864
         self.height = height if height is not None else 480
     
     def get_dimensions(self):
         return (self.width, self.height)
+
+    def get_runware_reference(self):
+        """mediaUUID or URL the video already lives at on Runware, so it can be reused without re-uploading"""
+        if self.media_uuid:
+            return self.media_uuid
+        if self.video_url and self.video_url.startswith("http"):
+            return self.video_url
+        return None
     
     def save_to(self, filename, **kwargs):
         """Save video to file by downloading from URL with retry logic"""
@@ -1016,47 +3107,15 @@ class VideoObject:
             print(f"[Video Download] Skipping download - empty video URL (placeholder object)")
             return False
         
-        max_retries = 10
-        retry_delays = [2, 5, 10, 15, 20]  # Longer delays for retries with larger videos
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(self.video_url, stream=True, timeout=30)
-                print(f"[Video Download] Attempt {attempt + 1}: {response}")
-               
-                if response.status_code == 422:
-                    print(f"[Video Download] Server still processing, waiting...")
-                    time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
-                    
-                if response.status_code == 502:
-                    print(f"[Video Download] Server error (502), retrying in {retry_delays[min(attempt, len(retry_delays) - 1)]} seconds...")
-                    time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
-                
-                response.raise_for_status()
-                
-                with open(filename, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                
-                print(f"[Video Download] Successfully downloaded video to {filename}")
-                self.video_path = filename  # Store the downloaded path
-                return True
-                
-            except requests.exceptions.RequestException as e:
-                print(f"[Video Download] Attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delays[min(attempt, len(retry_delays) - 1)])
-                    continue
-                else:
-                    print(f"[Video Download] All {max_retries} attempts failed. Video URL: {self.video_url}")
-                    return False
-            except Exception as e:
-                print(f"[Video Download] Unexpected error: {e}")
-                return False
+        try:
+            getDownloadManager().downloadSegmented(self.video_url, filename, timeout=30, logPrefix="[Video Download]")
+        except Exception as e:
+            print(f"[Video Download] Failed to download video: {e}")
+            return False
 
-        return False
+        print(f"[Video Download] Successfully downloaded video to {filename}")
+        self.video_path = filename  # Store the downloaded path
+        return True
     
     def __str__(self):
         return f"VideoObject(url={self.video_url}, path={self.video_path}, dimensions={self.width}x{self.height})"
@@ -1074,62 +3133,325 @@ def convertVideoB64List(videoDataObject, width=None, height=None):
             videoURL = result.get("mediaURL") or result.get("videoURL")
             if videoURL:
                 # Create a proper video object that ComfyUI can handle
-                video_obj = VideoObject(videoURL, width, height)
+                video_obj = VideoObject(videoURL, width, height, media_uuid=result.get("mediaUUID"))
                 videos += (video_obj,)
     return videos
 
-def pollVideoResult(taskUUID):
-    """Poll async task result with taskType getResponse (video, audio, text inference, etc.)."""
-    endpoint = refreshRunwareEndpoint()
-
-    pollConfig = [
-        {
-            "taskType": "getResponse",
-            "taskUUID": taskUUID,
-        }
-    ]
-
-    if usesWebSocketTransport(endpoint):
-        try:
-            pollResult = _get_ws_client().request(pollConfig, timeout=30)
-        except Exception as e:
-            print(f"[Debugging] Poll request failed: {str(e)}")
-            return None
-
-        if "errors" in pollResult:
-            print(f"[Debugging] Poll error: {safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
-            return pollResult
-        return pollResult
-
+def _postRunwareTasks(taskConfig, timeout):
+    """POST a task list to the REST endpoint once; returns the decoded JSON or None on failure."""
     headers = getRunwareApiHeaders()
-    
+
     try:
-        def recaller():
-            return session.post(
-                RUNWARE_API_BASE_URL,
-                headers=headers,
-                json=pollConfig,
-                timeout=30,  # Shorter timeout for polling
-                allow_redirects=False,
-                stream=True,
-            )
-        
-        pollResult = generalRequestWrapper(recaller)
+        result = session.post(
+            RUNWARE_API_BASE_URL,
+            headers=headers,
+            json=taskConfig,
+            timeout=timeout,
+            allow_redirects=False,
+            stream=True,
+        )
         try:
-            pollResult = pollResult.json()
+            return result.json()
         except json.JSONDecodeError as e:
             print(f"[Debugging] Runware Poll JSON Decode Error: {str(e)}")
             return None
-            
-        if "errors" in pollResult:
-            print(f"[Debugging] Poll error: {safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
-            return pollResult
-        else:
-            return pollResult
     except Exception as e:
         print(f"[Debugging] Poll request failed: {str(e)}")
         return None
 
 
+def splitResultsByTask(result, taskUUIDs):
+    """Split a multi-task response into one ``{"data": [...], "errors": [...]}`` dict per taskUUID."""
+    split = {}
+    wanted = set(taskUUIDs)
+    for key in ("data", "errors"):
+        for item in result.get(key) or []:
+            task_uuid = item.get("taskUUID")
+            if task_uuid in wanted:
+                split.setdefault(task_uuid, {}).setdefault(key, []).append(item)
+    return split
+
+
+# A poll frame that has not been answered by then is dropped; the task is polled again later
+ASYNC_POLL_REQUEST_TIMEOUT = 10
+
+
+async def getResponseBatchAsync(taskUUIDs, timeout=ASYNC_POLL_REQUEST_TIMEOUT):
+    """Poll many async tasks with one getResponse frame, sent once; returns {taskUUID: result} or None."""
+    pollConfig = [{"taskType": "getResponse", "taskUUID": taskUUID} for taskUUID in taskUUIDs]
+    endpoint = refreshRunwareEndpoint()
+
+    if usesWebSocketTransport(endpoint):
+        request = _get_ws_client().request_async(pollConfig, timeout, retries=0)
+    elif usesAsyncHttpTransport():
+        request = _get_http_client().post(pollConfig, getRunwareApiHeaders(), timeout, retries=0)
+    else:
+        request = asyncio.get_running_loop().run_in_executor(
+            None, _postRunwareTasks, pollConfig, timeout
+        )
+    try:
+        pollResult = await asyncio.wait_for(request, timeout)
+    except Exception as e:
+        print(f"[Debugging] Poll request failed: {str(e) or type(e).__name__}")
+        return None
+
+    if not isinstance(pollResult, dict):
+        return None
+    if "errors" in pollResult:
+        print(f"[Debugging] Poll error: {safe_json_dumps(pollResult, indent=2)}")
+    return splitResultsByTask(pollResult, taskUUIDs)
+
+
+def pollVideoResult(taskUUID):
+    """Poll async task result with taskType getResponse (video, audio, text inference, etc.)."""
+    return runOnTransportLoop(getTaskWatcher().watch(taskUUID, oneShot=True))
+
+
 # Alias: getResponse is the generic async poll for any task type.
 pollGetResponse = pollVideoResult
+
+
+# Poll cadence per task type: (initial interval, fast phase seconds, max interval, deadline seconds).
+# Tasks are polled at the initial interval during the fast phase, then back off
+# exponentially with jitter up to the max interval until the deadline.
+ASYNC_POLL_PROFILES = {
+    "imageInference": (0.5, 8, 3, 900),
+    "photoMaker": (0.5, 8, 3, 900),
+    "mediaStorage": (0.5, 8, 3, 600),
+    "audioInference": (1, 15, 5, 1800),
+    "caption": (1, 15, 5, 1800),
+    "textInference": (1, 15, 5, 1800),
+    "videoInference": (2, 20, 10, 3600),
+    "3dInference": (2, 20, 10, 3600),
+    "upscale": (2, 20, 10, 2400),
+    "removeBackground": (2, 20, 10, 2400),
+}
+ASYNC_POLL_DEFAULT_PROFILE = (1, 10, 5, 3600)
+ASYNC_POLL_BACKOFF = 1.5
+ASYNC_POLL_JITTER = 0.2
+ASYNC_POLL_BATCH_SIZE = 50
+ASYNC_TASK_IDLE_EXPIRY = 60
+ASYNC_TASK_TYPES_MAX = 1000
+
+
+def isTaskResultComplete(result):
+    """Default completion check for a getResponse payload: errors or a non-processing status."""
+    if not isinstance(result, dict):
+        return False
+    if result.get("errors"):
+        return True
+    data = result.get("data") or []
+    if not data:
+        return False
+    return data[0].get("status") not in (None, "processing")
+
+
+class RunwareTaskWatcher:
+    """Process-wide scheduler for async tasks waiting on a pushed or polled result."""
+
+    def __init__(self):
+        self._watches = {}
+        self._tasks = {}
+        self._task_types = {}
+        self._wakeup = None
+        self._poller_task = None
+        self._polling = set()
+        self._batches = set()
+
+    def noteTaskTypes(self, genConfig):
+        """Remember task types of submitted async tasks so polling can use their profile."""
+        for task in genConfig:
+            if task.get("deliveryMethod") == "async" and task.get("taskUUID"):
+                self._task_types[task["taskUUID"]] = task.get("taskType")
+        while len(self._task_types) > ASYNC_TASK_TYPES_MAX:
+            self._task_types.pop(next(iter(self._task_types)))
+
+    def _new_task_state(self, taskUUID, now):
+        task_type = self._task_types.pop(taskUUID, None)
+        initial, fast_phase, max_interval, deadline = ASYNC_POLL_PROFILES.get(
+            task_type, ASYNC_POLL_DEFAULT_PROFILE
+        )
+        return {
+            "started": now,
+            "next_poll": now,
+            "interval": initial,
+            "fast_phase": fast_phase,
+            "max_interval": max_interval,
+            "deadline": now + deadline,
+        }
+
+    def _reschedule(self, state, now):
+        if now - state["started"] >= state["fast_phase"]:
+            state["interval"] = min(state["max_interval"], state["interval"] * ASYNC_POLL_BACKOFF)
+        jitter = random.uniform(1 - ASYNC_POLL_JITTER, 1 + ASYNC_POLL_JITTER)
+        state["next_poll"] = now + state["interval"] * jitter
+
+    async def watch(self, taskUUID, isComplete=None, oneShot=False):
+        future = asyncio.get_running_loop().create_future()
+        watch = {
+            "future": future,
+            "is_complete": isComplete or isTaskResultComplete,
+            "one_shot": oneShot,
+        }
+        self._watches.setdefault(taskUUID, []).append(watch)
+        now = time.monotonic()
+        state = self._tasks.get(taskUUID)
+        if state is None:
+            state = self._tasks[taskUUID] = self._new_task_state(taskUUID, now)
+        state["last_watched"] = now
+        self._ensure_poller()
+        try:
+            return await future
+        finally:
+            watches = self._watches.get(taskUUID, [])
+            if watch in watches:
+                watches.remove(watch)
+            if not watches:
+                self._watches.pop(taskUUID, None)
+
+    def offer(self, taskUUID, result):
+        """Deliver a result for a task to every watcher whose completion check accepts it."""
+        for watch in list(self._watches.get(taskUUID, ())):
+            if watch["future"].done():
+                continue
+            if watch["one_shot"]:
+                watch["future"].set_result(result)
+                continue
+            try:
+                complete = watch["is_complete"](result)
+            except Exception as e:
+                watch["future"].set_exception(e)
+                continue
+            if complete:
+                watch["future"].set_result(result)
+
+    def _fail_one_shot(self, taskUUID):
+        for watch in self._watches.get(taskUUID, ()):
+            if watch["one_shot"] and not watch["future"].done():
+                watch["future"].set_result(None)
+
+    def _expire_deadlines(self, now):
+        for taskUUID in list(self._watches):
+            state = self._tasks[taskUUID]
+            if now < state["deadline"]:
+                continue
+            for watch in self._watches.get(taskUUID, ()):
+                if not watch["future"].done():
+                    watch["future"].set_exception(TimeoutError(
+                        f"Task {taskUUID} exceeded its polling deadline of "
+                        f"{int(state['deadline'] - state['started'])} seconds"
+                    ))
+
+    def _ensure_poller(self):
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._poller_task is None or self._poller_task.done():
+            self._poller_task = asyncio.get_running_loop().create_task(self._poll_loop())
+
+    def _next_poll_delay(self, now):
+        delays = [
+            self._tasks[taskUUID]["next_poll"] - now
+            for taskUUID in self._watches if taskUUID not in self._polling
+        ]
+        if delays:
+            return max(0.0, min(delays))
+        # Everything watched is in a batch, which wakes the loop when it ends
+        return ASYNC_POLL_REQUEST_TIMEOUT if self._watches else None
+
+    def _expire_idle_tasks(self, now):
+        for taskUUID in list(self._tasks):
+            if taskUUID not in self._watches and now - self._tasks[taskUUID]["last_watched"] > ASYNC_TASK_IDLE_EXPIRY:
+                del self._tasks[taskUUID]
+
+    async def _poll_batch(self, taskUUIDs):
+        try:
+            results = await getResponseBatchAsync(taskUUIDs)
+            for taskUUID in taskUUIDs:
+                result = results.get(taskUUID) if results is not None else None
+                if result is None:
+                    self._fail_one_shot(taskUUID)
+                else:
+                    self.offer(taskUUID, result)
+        finally:
+            self._polling.difference_update(taskUUIDs)
+            self._wakeup.set()
+
+    def _start_batch(self, taskUUIDs):
+        # Batches run on their own, so one slow frame never holds up the others
+        self._polling.update(taskUUIDs)
+        batch = asyncio.get_running_loop().create_task(self._poll_batch(taskUUIDs))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _poll_loop(self):
+        while self._watches:
+            now = time.monotonic()
+            self._expire_deadlines(now)
+            due = [
+                taskUUID for taskUUID in self._watches
+                if taskUUID not in self._polling and now >= self._tasks[taskUUID]["next_poll"]
+            ]
+            for taskUUID in due:
+                self._reschedule(self._tasks[taskUUID], now)
+            for i in range(0, len(due), ASYNC_POLL_BATCH_SIZE):
+                self._start_batch(due[i:i + ASYNC_POLL_BATCH_SIZE])
+
+            self._expire_idle_tasks(time.monotonic())
+            delay = self._next_poll_delay(time.monotonic())
+            if delay is None:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+_task_watcher = None
+_task_watcher_lock = threading.Lock()
+
+
+def getTaskWatcher():
+    global _task_watcher
+    with _task_watcher_lock:
+        if _task_watcher is None:
+            _task_watcher = RunwareTaskWatcher()
+        return _task_watcher
+
+
+def waitForTaskResult(taskUUID, isComplete=None, timeout=None):
+    """Block until an async task delivers a complete result, honouring ComfyUI interrupts."""
+    inflight = getInflightRegistry()
+    watchedUUID = inflight.leaderFor(taskUUID)
+    future = None
+    try:
+        inflight.claim(watchedUUID)
+        cachedResult = getResultCache().resolvedResult(watchedUUID)
+        if cachedResult is not None and (isComplete or isTaskResultComplete)(cachedResult):
+            return retargetTaskResult(cachedResult, taskUUID) if watchedUUID != taskUUID else cachedResult
+
+        future = asyncio.run_coroutine_threadsafe(
+            getTaskWatcher().watch(watchedUUID, isComplete), getTransportLoop()
+        )
+        started_at = time.time()
+        while True:
+            throw_exception_if_processing_interrupted()
+            try:
+                result = future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:
+                if timeout is not None and time.time() - started_at > timeout:
+                    raise TimeoutError(
+                        f"Task {taskUUID} did not complete within {timeout} seconds"
+                    )
+                continue
+            if watchedUUID != taskUUID:
+                return retargetTaskResult(result, taskUUID)
+            getResultCache().observe(taskUUID, result)
+            return result
+    finally:
+        if future is not None:
+            future.cancel()
+        inflight.release(watchedUUID)
+        # A no-op after a stored result; otherwise the task failed, timed out or was interrupted
+        getResultCache().forget(taskUUID)
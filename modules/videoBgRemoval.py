@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 
 class videoBgRemoval:
@@ -105,34 +104,27 @@ class videoBgRemoval:
 
     def _pollForVideoResult(self, taskUuid):
         """Poll for video result"""
-        while True:
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            pollResult = rwUtils.pollVideoResult(taskUuid)
-            print(f"[Debugging] Poll result: {pollResult}")
-            
-            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                errorInfo = pollResult["errors"][0]
-                errorMessage = errorInfo.get("message", "Unknown error")
-                raise Exception(f"Video background removal failed: {errorMessage}")
+        pollResult = rwUtils.waitForTaskResult(taskUuid)
+        print(f"[Debugging] Poll result: {pollResult}")
+        
+        if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+            errorInfo = pollResult["errors"][0]
+            errorMessage = errorInfo.get("message", "Unknown error")
+            raise Exception(f"Video background removal failed: {errorMessage}")
+        
+        if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+            videoData = pollResult["data"][0]
             
-            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                videoData = pollResult["data"][0]
+            if "status" in videoData:
+                status = videoData["status"]
                 
-                if "status" in videoData:
-                    status = videoData["status"]
-                    
-                    if status == "success":
-                        if "videoURL" in videoData or "videoBase64Data" in videoData:
-                            videos = rwUtils.convertVideoB64List(pollResult, 1920, 1080)
-                            # SaveVideo expects a single video object, not a tuple
-                            return (videos[0],) if len(videos) > 0 else (None,)
-            
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            for _ in range(10):
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                rwUtils.time.sleep(0.1)
+                if status == "success":
+                    if "videoURL" in videoData or "videoBase64Data" in videoData:
+                        videos = rwUtils.convertVideoB64List(pollResult, 1920, 1080)
+                        # SaveVideo expects a single video object, not a tuple
+                        return (videos[0],) if len(videos) > 0 else (None,)
+
+        raise Exception(f"Video background removal returned no video: {pollResult}")
 
 
 # Node class mappings
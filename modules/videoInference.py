@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 
 class txt2vid:
@@ -238,6 +237,10 @@ class txt2vid:
                     "min": 60,
                     "max": 2592000,
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             }
         }
 
@@ -472,7 +475,7 @@ class txt2vid:
                 print(f"[DEBUG] Sending Video Inference Request:")
                 print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps(genConfig, indent=2)}")
                 
-                genResult = rwUtils.inferenecRequest(genConfig)
+                genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
                 
                 # Debug: Print the response received
                 print(f"[DEBUG] Received Video Inference Response:")
@@ -486,61 +489,48 @@ class txt2vid:
             # Extract task UUID for polling
             taskUUID = genConfig[0]["taskUUID"]
             
-            # Poll for video completion
-            while True:
-                # Check for interrupt before each poll
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                
-                # Poll for video result
-                pollResult = rwUtils.pollVideoResult(taskUUID)
-                print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
-                
-                # Check for errors first
-                if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                    error_info = pollResult["errors"][0]
-                    error_message = error_info.get("message", "Unknown error")
-                    
-                    # Extract more detailed error info if available
-                    if "responseContent" in error_info:
-                        response_content = error_info["responseContent"]
-                        # Handle both string and dict response content
-                        if isinstance(response_content, str):
-                            detailed_message = response_content
-                        elif isinstance(response_content, dict):
-                            detailed_message = response_content.get("message", str(response_content))
-                        else:
-                            detailed_message = str(response_content)
-                        
-                        if detailed_message:
-                            error_message = f"{error_message}\nProvider Error: {detailed_message}"
-                    
-                    # Include taskUUID for debugging
-                    task_uuid = error_info.get("taskUUID", "unknown")
-                    raise Exception(f"Video generation failed (Task: {task_uuid}): {error_message}")
+            # Wait for video completion
+            pollResult = rwUtils.waitForTaskResult(taskUUID)
+            print(f"[Debugging] Poll result: {rwUtils.safe_json_dumps(pollResult, indent=2) if isinstance(pollResult, (dict, list)) else pollResult}")
+            
+            # Check for errors first
+            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+                error_info = pollResult["errors"][0]
+                error_message = error_info.get("message", "Unknown error")
                 
-                if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                    video_data = pollResult["data"][0]
+                # Extract more detailed error info if available
+                if "responseContent" in error_info:
+                    response_content = error_info["responseContent"]
+                    # Handle both string and dict response content
+                    if isinstance(response_content, str):
+                        detailed_message = response_content
+                    elif isinstance(response_content, dict):
+                        detailed_message = response_content.get("message", str(response_content))
+                    else:
+                        detailed_message = str(response_content)
                     
-                    # Check status directly
-                    if "status" in video_data:
-                        status = video_data["status"]
-                        
-                        if status == "success":
-                            if "videoURL" in video_data or "videoBase64Data" in video_data:
-                                videos = rwUtils.convertVideoB64List(pollResult, width, height)
-                                # SaveVideo expects a single video object, not a tuple
-                                video_output = videos[0] if len(videos) > 0 else None
-                                return (video_output, genConfig, pollResult)
-                        
-                        # If status is "processing", continue polling
+                    if detailed_message:
+                        error_message = f"{error_message}\nProvider Error: {detailed_message}"
                 
-                # Check for interrupt before waiting
-                comfy.model_management.throw_exception_if_processing_interrupted()
+                # Include taskUUID for debugging
+                task_uuid = error_info.get("taskUUID", "unknown")
+                raise Exception(f"Video generation failed (Task: {task_uuid}): {error_message}")
+            
+            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+                video_data = pollResult["data"][0]
                 
-                # Wait before next poll (split into smaller chunks to allow more frequent interrupt checks)
-                for _ in range(10):  # 10 x 0.1 second = 1 second total
-                    comfy.model_management.throw_exception_if_processing_interrupted()
-                    rwUtils.time.sleep(0.1) 
+                # Check status directly
+                if "status" in video_data:
+                    status = video_data["status"]
+                    
+                    if status == "success":
+                        if "videoURL" in video_data or "videoBase64Data" in video_data:
+                            videos = rwUtils.convertVideoB64List(pollResult, width, height)
+                            # SaveVideo expects a single video object, not a tuple
+                            video_output = videos[0] if len(videos) > 0 else None
+                            return (video_output, genConfig, pollResult)
+
+            raise Exception(f"Video generation returned no video (Task: {taskUUID}): {rwUtils.safe_json_dumps(pollResult)}")
 
 
 # Node class mappings for ComfyUI registration
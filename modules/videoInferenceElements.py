@@ -140,11 +140,12 @@ class RunwareVideoInferenceElements:
         if frontal_image is not None:
             frontal_image_value = rwUtils.convertTensor2IMG(frontal_image)
 
-        refer_images: List[Any] = []
+        refer_slots: List[Any] = []
         for i in range(1, _REF_IMAGE_SLOTS + 1):
             slot = kwargs.get(f"images_{i}")
             if slot is not None:
-                refer_images.append(rwUtils.convertTensor2IMG(slot))
+                refer_slots.append(slot)
+        refer_images: List[Any] = rwUtils.convertTensors2IMG(refer_slots, role="reference")
 
         refer_videos: List[str] = []
         for i in range(1, _REF_VIDEO_SLOTS + 1):
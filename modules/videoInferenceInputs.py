@@ -129,7 +129,7 @@ class videoInferenceInputs:
             inputs["video"] = video.strip()
 
         if mask is not None:
-            inputs["mask"] = rwUtils.convertTensor2IMG(mask)
+            inputs["mask"] = rwUtils.convertTensor2IMG(mask, role="mask")
 
         if frame is not None:
             inputs["frame"] = rwUtils.convertTensor2IMG(frame)
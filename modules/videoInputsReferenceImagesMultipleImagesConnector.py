@@ -29,11 +29,12 @@ class RunwareVideoInputsReferenceImagesMultipleImagesConnector:
     CATEGORY = "Runware"
 
     def createImages(self, **kwargs) -> tuple[List[str]]:
-        images: List[str] = []
+        tensors = []
         for i in range(1, self.MAX_IMAGES + 1):
             image = kwargs.get(f"Image{i}")
             if image is not None:
-                images.append(rwUtils.convertTensor2IMG(image))
+                tensors.append(image)
+        images: List[str] = rwUtils.convertTensors2IMG(tensors, role="reference")
         return (images,)
 
 
@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 
 class videoTranscription:
@@ -28,6 +27,12 @@ class videoTranscription:
                     "tooltip": "Choose the model to use for video transcription."
                 }),
             },
+            "optional": {
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
+            },
             "hidden": { "node_id": "UNIQUE_ID" }
         }
 
@@ -65,7 +70,7 @@ class videoTranscription:
         print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps(genConfig, indent=2)}")
         
         try:
-            genResult = rwUtils.inferenecRequest(genConfig)
+            genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
             
             # Debug: Print the response received
             print(f"[DEBUG] Received Video Transcription Response:")
@@ -76,61 +81,45 @@ class videoTranscription:
         # Get task UUID for polling
         taskUUID = task_params["taskUUID"]
         
-        # Poll for result
-        while True:
-            # Check for interrupt before each poll
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            # Poll for result
-            pollResult = rwUtils.pollVideoResult(taskUUID)
-            print(f"[Debugging] Poll result: {pollResult}")
-            
-            # Check for errors first
-            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                error_info = pollResult["errors"][0]
-                error_message = error_info.get("message", "Unknown error")
-                raise Exception(f"Video transcription failed: {error_message}")
+        # Wait for the result
+        pollResult = rwUtils.waitForTaskResult(taskUUID)
+        print(f"[Debugging] Poll result: {pollResult}")
+        
+        # Check for errors first
+        if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+            error_info = pollResult["errors"][0]
+            error_message = error_info.get("message", "Unknown error")
+            raise Exception(f"Video transcription failed: {error_message}")
+        
+        # Check if we have data
+        if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+            data = pollResult["data"][0]
             
-            # Check if we have data
-            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                data = pollResult["data"][0]
+            # Check status
+            if "status" in data:
+                status = data["status"]
                 
-                # Check status
-                if "status" in data:
-                    status = data["status"]
+                if status == "success":
+                    # Handle both text (video captioning) and structuredData (age detection) outputs
+                    outputText = None
+                    
+                    if "text" in data:
+                        # Video captioning result
+                        outputText = data["text"]
+                    elif "structuredData" in data:
+                        # Age detection result - format as readable text
+                        structuredData = data["structuredData"]
+                        ageGroup = structuredData.get("ageGroup", "Unknown")
+                        confidence = structuredData.get("confidence", 0.0)
+                        outputText = f"Age Group: {ageGroup}\nConfidence: {confidence:.2%}"
                     
-                    if status == "success":
-                        # Handle both text (video captioning) and structuredData (age detection) outputs
-                        outputText = None
-                        
-                        if "text" in data:
-                            # Video captioning result
-                            outputText = data["text"]
-                        elif "structuredData" in data:
-                            # Age detection result - format as readable text
-                            structuredData = data["structuredData"]
-                            ageGroup = structuredData.get("ageGroup", "Unknown")
-                            confidence = structuredData.get("confidence", 0.0)
-                            outputText = f"Age Group: {ageGroup}\nConfidence: {confidence:.2%}"
-                        
-                        if outputText:
-                            # Send transcription result
-                            rwUtils.sendVideoTranscription(outputText, kwargs.get("node_id"))
-                            return (outputText,)
-                        else:
-                            raise Exception("No valid output (text or structuredData) in successful response")
-                    elif status == "processing":
-                        # Continue polling
-                        pass
+                    if outputText:
+                        # Send transcription result
+                        rwUtils.sendVideoTranscription(outputText, kwargs.get("node_id"))
+                        return (outputText,)
                     else:
-                        # Error or other status
-                        raise Exception(f"Unexpected status: {status}")
-            
-            # Check for interrupt before waiting
-            comfy.model_management.throw_exception_if_processing_interrupted()
-            
-            # Wait before next poll
-            for _ in range(10):  # 10 x 0.1 second = 1 second total
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                rwUtils.time.sleep(0.1)
+                        raise Exception("No valid output (text or structuredData) in successful response")
+                else:
+                    # Error or other status
+                    raise Exception(f"Unexpected status: {status}")
 
@@ -1,5 +1,4 @@
 from .utils import runwareUtils as rwUtils
-import comfy.model_management
 
 class videoUpscaler:
     RUNWARE_VUPSCALER_MODELS = {
@@ -66,6 +65,10 @@ class videoUpscaler:
                     "default": "mp4",
                     "tooltip": "Choose the output video format.",
                 }),
+                "bypassResultCache": ("BOOLEAN", {
+                    "tooltip": "Always send this request to the API instead of answering it from the persistent result cache (RUNWARE_RESULT_CACHE). The new result still refreshes the cache.",
+                    "default": False,
+                }),
             }
         }
 
@@ -134,7 +137,7 @@ class videoUpscaler:
             print(f"[DEBUG] Sending Video Upscale Request:")
             print(f"[DEBUG] Request Payload: {rwUtils.safe_json_dumps(genConfig, indent=2)}")
             
-            genResult = rwUtils.inferenecRequest(genConfig)
+            genResult = rwUtils.inferenecRequest(genConfig, bypassResultCache=kwargs.get("bypassResultCache", False))
             
             # Debug: Print the response received
             print(f"[DEBUG] Received Video Upscale Response:")
@@ -148,69 +151,48 @@ class videoUpscaler:
             # Extract task UUID for polling
             taskUUID = genConfig[0]["taskUUID"]
             max_poll_seconds = 2400  # 40 minutes
-            started_at = rwUtils.time.time()
             
-            # Poll for video completion
-            while True:
-                if rwUtils.time.time() - started_at > max_poll_seconds:
-                    raise TimeoutError(
-                        f"Video upscale timed out after {max_poll_seconds} seconds. "
-                        f"Task UUID: {taskUUID}"
-                    )
-
-                # Check for interrupt before each poll
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                
-                # Poll for video result
-                pollResult = rwUtils.pollVideoResult(taskUUID)
-                print(f"[Debugging] Poll result: {pollResult}")
-
-                if not isinstance(pollResult, dict):
-                    # Keep polling if transport layer returned empty/invalid payload.
-                    for _ in range(10):
-                        comfy.model_management.throw_exception_if_processing_interrupted()
-                        rwUtils.time.sleep(0.1)
-                    continue
-                
-                # Check for errors first
-                if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
-                    error_info = pollResult["errors"][0]
-                    error_message = error_info.get("message", "Unknown error")
-                    raise Exception(f"Video upscale failed: {error_message}")
+            # Wait for video completion
+            try:
+                pollResult = rwUtils.waitForTaskResult(taskUUID, timeout=max_poll_seconds)
+            except TimeoutError:
+                raise TimeoutError(
+                    f"Video upscale timed out after {max_poll_seconds} seconds. "
+                    f"Task UUID: {taskUUID}"
+                )
+            print(f"[Debugging] Poll result: {pollResult}")
+            
+            # Check for errors first
+            if pollResult and "errors" in pollResult and len(pollResult["errors"]) > 0:
+                error_info = pollResult["errors"][0]
+                error_message = error_info.get("message", "Unknown error")
+                raise Exception(f"Video upscale failed: {error_message}")
+            
+            if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
+                video_data = pollResult["data"][0]
                 
-                if pollResult and "data" in pollResult and len(pollResult["data"]) > 0:
-                    video_data = pollResult["data"][0]
+                # Check status directly
+                if "status" in video_data:
+                    status = video_data["status"]
                     
-                    # Check status directly
-                    if "status" in video_data:
-                        status = video_data["status"]
-                        
-                        if status == "success":
-                            if "mediaURL" in video_data or "videoURL" in video_data or "videoBase64Data" in video_data:
-                                out_width = width if useDimension == "custom" else video_data.get("width", 1920)
-                                out_height = height if useDimension == "custom" else video_data.get("height", 1080)
-                                videos = rwUtils.convertVideoB64List(pollResult, out_width, out_height)
-                                # SaveVideo expects a single video object, not a tuple
-                                return (videos[0],) if len(videos) > 0 else (None,)
-                            raise Exception(
-                                "Video upscale returned success without mediaURL/videoURL/videoBase64Data. "
-                                f"Response: {rwUtils.safe_json_dumps(video_data, indent=2)}"
-                            )
-                        if status in ("failed", "error", "cancelled", "canceled"):
-                            raise Exception(
-                                "Video upscale failed with terminal status "
-                                f"'{status}'. Response: {rwUtils.safe_json_dumps(video_data, indent=2)}"
-                            )
-                        
-                        # If status is "processing" (or unknown transient), continue polling
-                
-                # Check for interrupt before waiting
-                comfy.model_management.throw_exception_if_processing_interrupted()
-                
-                # Wait before next poll
-                for _ in range(10):  # 10 x 0.1 second = 1 second total
-                    comfy.model_management.throw_exception_if_processing_interrupted()
-                    rwUtils.time.sleep(0.1)
+                    if status == "success":
+                        if "mediaURL" in video_data or "videoURL" in video_data or "videoBase64Data" in video_data:
+                            out_width = width if useDimension == "custom" else video_data.get("width", 1920)
+                            out_height = height if useDimension == "custom" else video_data.get("height", 1080)
+                            videos = rwUtils.convertVideoB64List(pollResult, out_width, out_height)
+                            # SaveVideo expects a single video object, not a tuple
+                            return (videos[0],) if len(videos) > 0 else (None,)
+                        raise Exception(
+                            "Video upscale returned success without mediaURL/videoURL/videoBase64Data. "
+                            f"Response: {rwUtils.safe_json_dumps(video_data, indent=2)}"
+                        )
+                    if status in ("failed", "error", "cancelled", "canceled"):
+                        raise Exception(
+                            "Video upscale failed with terminal status "
+                            f"'{status}'. Response: {rwUtils.safe_json_dumps(video_data, indent=2)}"
+                        )
+
+            raise Exception(f"Video upscale returned no video. Response: {rwUtils.safe_json_dumps(pollResult, indent=2)}")
                         
         except Exception as e:
             print(f"[Error] Video upscale failed: {str(e)}")
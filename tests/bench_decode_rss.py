@@ -0,0 +1,79 @@
+"""Peak RSS of decoding a 4K result batch: the old per-image path vs decodeImagesToTensor.
+
+Not collected by pytest. Run with ``python tests/bench_decode_rss.py [count] [size]``.
+Each path runs in a fresh interpreter so ru_maxrss only sees that path; the
+figure reported is the peak above the baseline taken once the encoded images
+are in memory.
+"""
+import io
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+
+def encodedBatch(count, size):
+    ramp = np.linspace(0, 255, size, dtype=np.uint8)
+    images = []
+    for i in range(count):
+        pixels = np.empty((size, size, 3), dtype=np.uint8)
+        pixels[..., 0] = ramp[None, :]
+        pixels[..., 1] = ramp[:, None]
+        pixels[..., 2] = (i * 40) % 256
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format="PNG", compress_level=1)
+        images.append(buffer.getvalue())
+    return images
+
+
+def decodeOld(imagesData):
+    # The pre-user-009 Save Image path: one float32 tensor per image, then cat.
+    tensors = []
+    for imgData in imagesData:
+        pil = Image.open(io.BytesIO(imgData)).convert("RGB")
+        arr = np.array(pil).astype(np.float32) / 255.0
+        tensors.append(torch.from_numpy(arr).unsqueeze(0))
+    return torch.cat(tensors, dim=0)
+
+
+def decodeNew(imagesData):
+    from conftest import _install_comfy_runtime
+    _install_comfy_runtime()
+    from modules.utils import runwareUtils as rwUtils
+    return rwUtils.decodeImagesToTensor(imagesData, mode="RGB")
+
+
+def peakMB():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(path, count, size):
+    imagesData = encodedBatch(count, size)
+    decode = decodeNew if path == "new" else decodeOld
+    if path == "new":
+        from conftest import _install_comfy_runtime
+        _install_comfy_runtime()
+        from modules.utils import runwareUtils  # noqa: F401  (import cost is not decode cost)
+    baseline = peakMB()
+    started = time.perf_counter()
+    batch = decode(imagesData)
+    elapsed = time.perf_counter() - started
+    print(f"{path}: peak +{peakMB() - baseline:.0f} MB, {elapsed:.2f}s, batch {batch.nbytes / 2**20:.0f} MB {tuple(batch.shape)}")
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] in ("old", "new"):
+        measure(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
+        return
+    count = sys.argv[1] if len(sys.argv) > 1 else "4"
+    size = sys.argv[2] if len(sys.argv) > 2 else "4096"
+    for path in ("old", "new"):
+        subprocess.run([sys.executable, __file__, path, count, size], check=True)
+
+
+if __name__ == "__main__":
+    main()
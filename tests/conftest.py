@@ -0,0 +1,62 @@
+"""Test setup: the ComfyUI runtime modules runwareUtils imports are not importable outside ComfyUI."""
+import sys
+import types
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+class InterruptProcessingException(Exception):
+    pass
+
+
+def _install_comfy_runtime():
+    if "server" in sys.modules and "comfy.model_management" in sys.modules:
+        return
+    model_management = types.ModuleType("comfy.model_management")
+    model_management.InterruptProcessingException = InterruptProcessingException
+    model_management.throw_exception_if_processing_interrupted = lambda: None
+    comfy = types.ModuleType("comfy")
+    comfy.model_management = model_management
+    sys.modules.setdefault("comfy", comfy)
+    sys.modules.setdefault("comfy.model_management", model_management)
+
+    server = types.ModuleType("server")
+    sent = []
+
+    class PromptServer:
+        instance = types.SimpleNamespace(send_sync=lambda *args, **kwargs: sent.append(args), routes=web.RouteTableDef())
+
+    server.PromptServer = PromptServer
+    server.sent = sent
+    sys.modules.setdefault("server", server)
+
+
+def _install_node_package():
+    # The repo root is the ComfyUI node package, and pytest imports its
+    # __init__.py for package-level setup. That registers every node and route
+    # with a running ComfyUI, so stand in an empty package for it.
+    package = types.ModuleType(ROOT.name)
+    package.__file__ = str(ROOT / "__init__.py")
+    package.__path__ = [str(ROOT)]
+    sys.modules.setdefault(ROOT.name, package)
+
+
+_install_comfy_runtime()
+_install_node_package()
+
+
+@pytest.fixture
+def rwUtils(tmp_path, monkeypatch):
+    from modules.utils import runwareUtils
+    # Keep the on-disk caches out of the checkout
+    monkeypatch.setattr(runwareUtils, "IMAGE_CACHE_DB", tmp_path / "runwareCache.db")
+    monkeypatch.setattr(runwareUtils, "IMAGE_CACHE_FILE", tmp_path / "imagesCache.json")
+    monkeypatch.setattr(runwareUtils, "RESULT_CACHE_DIR", tmp_path / "resultCache")
+    monkeypatch.setattr(runwareUtils, "_image_store", None)
+    monkeypatch.setattr(runwareUtils, "_media_store", None)
+    return runwareUtils
@@ -0,0 +1,76 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+
+class FakeTransport:
+    def __init__(self):
+        self.closing = False
+
+    def is_closing(self):
+        return self.closing
+
+
+class FakeRequest:
+    path = "/test"
+
+    def __init__(self, payload=None):
+        self.payload = payload or {}
+        self.transport = FakeTransport()
+
+    async def json(self):
+        return self.payload
+
+
+@pytest.fixture
+def mainRoute(rwUtils):
+    from modules.bridges import mainRoute
+    return mainRoute
+
+
+def test_run_bridged_returns_result(mainRoute):
+    async def work(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    assert asyncio.run(mainRoute.runBridged(FakeRequest(), work, 42)) == 42
+
+
+def test_run_bridged_cancels_when_client_disconnects(mainRoute):
+    cancelled = []
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        request = FakeRequest()
+        call = asyncio.ensure_future(mainRoute.runBridged(request, work))
+        await asyncio.sleep(0.05)
+        request.transport.closing = True
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+    asyncio.run(run())
+    assert cancelled == [True]
+
+
+def test_set_api_key_runs_off_the_server_loop(mainRoute, rwUtils, monkeypatch):
+    threads = {}
+    monkeypatch.setattr(rwUtils, "checkAPIKey", lambda apiKey: threads.setdefault("check", threading.get_ident()) and True)
+    monkeypatch.setattr(rwUtils, "setAPIKey", lambda apiKey: threads.setdefault("set", threading.get_ident()))
+    monkeypatch.setattr(rwUtils, "prefetchModelSearch", lambda: None, raising=False)
+
+    async def run():
+        threads["loop"] = threading.get_ident()
+        response = await mainRoute.setAPIKey(FakeRequest({"apiKey": "k" * 40}))
+        return json.loads(response.text)
+
+    assert asyncio.run(run()) == {"success": True}
+    assert threads["check"] != threads["loop"]
+    assert threads["set"] != threads["loop"]
@@ -0,0 +1,131 @@
+import http.server
+import os
+import threading
+
+import pytest
+
+PAYLOAD = os.urandom(64 * 1024 + 7)
+
+
+class RangeHandler(http.server.BaseHTTPRequestHandler):
+    honor_ranges = True
+    overrun_ranges = False
+    get_etag = '"v1"'
+    ranged_gets = []
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length, extra=(), etag='"v1"'):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        for key, value in extra:
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, len(PAYLOAD))
+
+    def do_GET(self):
+        requested = self.headers.get("Range")
+        if requested and self.honor_ranges:
+            start, end = (int(value) for value in requested.split("=")[1].split("-"))
+            type(self).ranged_gets.append((start, end))
+            if self.overrun_ranges:
+                # Sends the rest of the file from ``start``, labelled as the range asked for
+                body = PAYLOAD[start:]
+            else:
+                body = PAYLOAD[start:end + 1]
+            self._headers(206, len(body), [("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")], self.get_etag)
+        else:
+            body = PAYLOAD
+            self._headers(200, len(body), etag=self.get_etag)
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    RangeHandler.ranged_gets = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/video.mp4"
+    httpd.shutdown()
+    RangeHandler.honor_ranges = True
+    RangeHandler.overrun_ranges = False
+    RangeHandler.get_etag = '"v1"'
+
+
+@pytest.fixture
+def manager(rwUtils, monkeypatch):
+    monkeypatch.setattr(rwUtils, "DOWNLOAD_MIN_SEGMENT_BYTES", 16 * 1024)
+    return rwUtils.RunwareDownloadManager()
+
+
+def test_segmented_download_matches_source(manager, server, tmp_path):
+    target = tmp_path / "video.mp4"
+    assert manager.downloadSegmented(server, str(target), segments=4, timeout=5) == len(PAYLOAD)
+    assert target.read_bytes() == PAYLOAD
+    assert len(RangeHandler.ranged_gets) == 4
+
+
+def test_ignored_range_falls_back_to_one_stream(manager, server, tmp_path):
+    RangeHandler.honor_ranges = False
+    target = tmp_path / "video.mp4"
+    assert manager.downloadSegmented(server, str(target), segments=4, timeout=5) == len(PAYLOAD)
+    assert target.read_bytes() == PAYLOAD
+
+
+def test_short_segment_is_not_accepted(manager, server, tmp_path, rwUtils, monkeypatch):
+    def short_segment(url, filepath, start, end, *args):
+        return end - start
+
+    monkeypatch.setattr(manager, "_fetch_segment", short_segment)
+    target = tmp_path / "video.mp4"
+    with pytest.raises(Exception, match="expected"):
+        manager.downloadSegmented(server, str(target), segments=2, timeout=5)
+    assert not target.exists()
+
+
+def test_overrunning_segment_never_writes_past_its_range(manager, server, tmp_path):
+    RangeHandler.overrun_ranges = True
+    target = tmp_path / "video.mp4"
+    assert manager.downloadSegmented(server, str(target), segments=4, timeout=5) == len(PAYLOAD)
+    assert target.read_bytes() == PAYLOAD
+
+
+def test_fallback_checks_the_etag(manager, server, tmp_path):
+    RangeHandler.honor_ranges = False
+    RangeHandler.get_etag = '"v2"'
+    target = tmp_path / "video.mp4"
+    with pytest.raises(Exception, match="File changed"):
+        manager.downloadSegmented(server, str(target), segments=4, timeout=5)
+    assert not target.exists()
+
+
+def test_short_single_stream_is_retried_and_removed(manager, server, tmp_path, rwUtils, monkeypatch):
+    monkeypatch.setattr(rwUtils, "DOWNLOAD_RETRY_DELAYS", [0])
+
+    class ShortResponse:
+        status_code = 200
+        headers = {"Content-Length": "10"}
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, chunk_size):
+            yield b"12345"
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+    monkeypatch.setattr(manager._session, "get", lambda *args, **kwargs: ShortResponse())
+    target = tmp_path / "file.bin"
+    with pytest.raises(Exception, match="received 5 bytes, expected 10"):
+        manager.download(server, str(target), maxRetries=2)
+    assert not target.exists()
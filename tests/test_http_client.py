@@ -0,0 +1,70 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+def client(rwUtils, monkeypatch):
+    monkeypatch.setattr(rwUtils, "RETRY_COOLDOWNS", [0] * len(rwUtils.RETRY_COOLDOWNS))
+    requests = []
+    replies = []
+
+    def handler(request):
+        requests.append(request)
+        reply = replies.pop(0) if replies else {"data": []}
+        if isinstance(reply, Exception):
+            raise reply
+        return httpx.Response(200, json=reply)
+
+    httpClient = rwUtils.RunwareHttpClient()
+    httpClient._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    httpClient.requests = requests
+    httpClient.replies = replies
+    yield httpClient
+    asyncio.run(httpClient.close())
+
+
+def test_posts_json_without_advertising_zstd(client):
+    client.replies.append({"data": [{"taskUUID": "t1"}]})
+    result = asyncio.run(client.post([{"taskType": "ping"}], {"Authorization": "Bearer k"}, 5))
+    assert result == {"data": [{"taskUUID": "t1"}]}
+    request = client.requests[0]
+    assert json.loads(request.content) == [{"taskType": "ping"}]
+    assert request.headers["Authorization"] == "Bearer k"
+    assert "zstd" not in request.headers["Accept-Encoding"]
+
+
+def test_streamed_payload_is_sent_with_its_length(rwUtils, client, tmp_path):
+    media = tmp_path / "clip.bin"
+    media.write_bytes(bytes(range(256)) * 10)
+    payload = [{"taskType": "mediaStorage", "media": rwUtils.StreamedBase64(str(media))}]
+    asyncio.run(client.post(payload, {}, 5))
+    request = client.requests[0]
+    sent = json.loads(request.content)
+    assert base64.b64decode(sent[0]["media"]) == media.read_bytes()
+    assert int(request.headers["Content-Length"]) == len(request.content)
+
+
+def test_connection_errors_are_retried(rwUtils, client):
+    client.replies.extend([httpx.ConnectError("refused"), httpx.RemoteProtocolError("reset"), {"data": ["ok"]}])
+    assert asyncio.run(client.post([], {}, 5)) == {"data": ["ok"]}
+    assert len(client.requests) == 3
+
+
+def test_retries_zero_posts_once(client):
+    client.replies.append(httpx.ConnectError("refused"))
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.post([], {}, 5, retries=0))
+    assert len(client.requests) == 1
+
+
+def test_transport_falls_back_to_requests_without_httpx(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_HTTP_TRANSPORT", "httpx")
+    assert rwUtils.usesAsyncHttpTransport("https://api.runware.ai/v1")
+    assert not rwUtils.usesAsyncHttpTransport("wss://ws-api.runware.ai/v1")
+    monkeypatch.setattr(rwUtils, "httpx", None)
+    assert not rwUtils.usesAsyncHttpTransport("https://api.runware.ai/v1")
@@ -0,0 +1,46 @@
+import concurrent.futures
+
+import numpy as np
+import torch
+
+
+def test_lossy_encodes_get_their_own_store_key(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT", "PNG")
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT_REFERENCE", "JPEG")
+    monkeypatch.setenv("RUNWARE_JPEG_QUALITY", "80")
+    assert rwUtils.encodedSignature("sig", "image") == "sig"
+    assert rwUtils.encodedSignature("sig", "mask") == "sig"
+    assert rwUtils.encodedSignature("sig", "reference") == "sig:JPEG:80"
+
+
+def test_lossy_upload_is_not_reused_by_lossless_role(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_ENABLE_IMAGES_CACHING", "true")
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT", "PNG")
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT_REFERENCE", "JPEG")
+    store = {}
+    uploads = []
+
+    class Queue:
+        def submit(self, imgSig, imgDataUri, foreground=False):
+            uploads.append((imgSig, imgDataUri.split(";")[0]))
+            store[imgSig] = f"uuid-{len(uploads)}"
+            future = concurrent.futures.Future()
+            future.set_result(store[imgSig])
+            return future
+
+    monkeypatch.setattr(rwUtils, "imageStoreGet", lambda imgSig: store.get(imgSig, False))
+    monkeypatch.setattr(rwUtils, "getUploadQueue", lambda: Queue())
+    monkeypatch.setattr(rwUtils.getUploadPolicy(), "decide", lambda *args: rwUtils.UPLOAD_POLICY_UPLOAD)
+
+    image = torch.rand(1, 16, 16, 3)
+    assert rwUtils.convertTensor2IMG(image, role="reference") == "uuid-1"
+    assert rwUtils.convertTensor2IMG(image.clone(), role="image") == "uuid-2"
+    assert rwUtils.convertTensor2IMG(image.clone(), role="reference") == "uuid-1"
+    assert [mime for _, mime in uploads] == ["data:image/jpeg", "data:image/png"]
+
+
+def test_mask_role_is_always_png(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT", "JPEG")
+    mask = (np.random.rand(8, 8) * 255).astype(np.uint8)
+    data, mime = rwUtils.encodeImageArray(mask, "mask")
+    assert mime == "image/png" and data.startswith(b"\x89PNG")
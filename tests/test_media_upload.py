@@ -0,0 +1,25 @@
+import pytest
+import torch
+
+pytest.importorskip("soundfile")
+
+
+@pytest.fixture
+def node(rwUtils):
+    from modules.mediaUpload import RunwareMediaUpload
+    return RunwareMediaUpload
+
+
+def test_is_changed_follows_content_not_the_uuid_widget(node):
+    audio = {"waveform": torch.rand(1, 1, 2048), "sample_rate": 22050}
+    first = node.IS_CHANGED(media=audio, mediaUUID="")
+    # The node writes the uploaded mediaUUID back into its widget after a run
+    assert node.IS_CHANGED(media=audio, mediaUUID="uuid-after-upload") == first
+    other = {"waveform": torch.rand(1, 1, 2048), "sample_rate": 22050}
+    assert node.IS_CHANGED(media=other, mediaUUID="uuid-after-upload") != first
+
+
+def test_is_changed_uses_the_runware_reference(node, rwUtils):
+    waveform = torch.rand(1, 1, 2048)
+    rwUtils.registerMediaProvenance(waveform, "https://im.runware.ai/audio/a.mp3")
+    assert node.IS_CHANGED(media={"waveform": waveform, "sample_rate": 44100}) == "https://im.runware.ai/audio/a.mp3"
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+
+@pytest.fixture
+def searches(rwUtils, monkeypatch):
+    calls = []
+
+    async def fake_request(genConfig):
+        calls.append(genConfig[0])
+        await asyncio.sleep(0.02)
+        return {"data": [{"totalResults": 1, "results": [{"air": genConfig[0]["category"]}]}]}
+
+    monkeypatch.setattr(rwUtils, "inferenecRequestAsync", fake_request)
+    monkeypatch.setenv("RUNWARE_API_KEY", "a" * 32)
+    monkeypatch.setenv("RUNWARE_MODEL_SEARCH_TTL", "600")
+    return calls
+
+
+def test_identical_searches_share_one_request(rwUtils, searches):
+    cache = rwUtils.RunwareModelSearchCache()
+
+    async def run():
+        # "type" is not sent for lora, so these are the same search
+        return await asyncio.gather(*(cache.search("", "lora", "all", modelType, "all") for modelType in ("base", "x")))
+
+    first, second = asyncio.run(run())
+    assert first == second and len(searches) == 1
+
+
+def test_warm_hit_skips_the_api(rwUtils, searches):
+    cache = rwUtils.RunwareModelSearchCache()
+
+    async def run():
+        await cache.search("flux", "checkpoint", "all", "base", "all")
+        await cache.search("flux", "checkpoint", "all", "base", "all")
+
+    asyncio.run(run())
+    assert len(searches) == 1
+
+
+def test_stale_entry_is_served_while_refreshing(rwUtils, searches, monkeypatch):
+    cache = rwUtils.RunwareModelSearchCache()
+
+    async def run():
+        await cache.search("", "controlnet", "all", "base", "all")
+        monkeypatch.setenv("RUNWARE_MODEL_SEARCH_TTL", "0")
+        stale = await cache.search("", "controlnet", "all", "base", "all")
+        assert len(searches) == 1
+        await asyncio.sleep(0.05)
+        return stale
+
+    assert asyncio.run(run())["totalResults"] == 1
+    assert len(searches) == 2
+
+
+def test_results_are_scoped_to_the_api_key(rwUtils, searches, monkeypatch):
+    cache = rwUtils.RunwareModelSearchCache()
+
+    async def run():
+        await cache.search("", "checkpoint", "all", "base", "all")
+        monkeypatch.setenv("RUNWARE_API_KEY", "b" * 32)
+        await cache.search("", "checkpoint", "all", "base", "all")
+
+    asyncio.run(run())
+    assert len(searches) == 2
+
+
+def test_untyped_categories_drop_type(rwUtils):
+    task = rwUtils.buildModelSearchTask("", "controlnet", "sdxl", "base", "canny")
+    assert "type" not in task
+    assert task["conditioning"] == "canny" and task["architecture"] == "sdxl"
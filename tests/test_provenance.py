@@ -0,0 +1,53 @@
+import io
+
+import torch
+from PIL import Image
+
+
+def encode(color, mode="RGB"):
+    buffer = io.BytesIO()
+    Image.new(mode, (8, 8), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_decoded_batch_is_passed_by_reference(rwUtils):
+    imageBytesList = [encode((255, 0, 0)), encode((0, 255, 0))]
+    references = ["uuid-red", "https://im.runware.ai/green.png"]
+    with torch.inference_mode():
+        batch = rwUtils.decodeImagesToTensor(imageBytesList, mode="RGB")
+        rwUtils.registerDecodedProvenance(batch, imageBytesList, references, mode="RGB")
+        assert rwUtils.convertTensor2IMG(batch[0:1]) == "uuid-red"
+        assert rwUtils.convertTensor2IMG(batch[1:2]) == "https://im.runware.ai/green.png"
+
+
+def test_same_pixels_found_by_signature(rwUtils):
+    registry = rwUtils.RunwareProvenanceRegistry()
+    with torch.inference_mode():
+        image = torch.rand(1, 4, 4, 3)
+        imgSig = registry.register(image, "uuid-1")
+        assert registry.lookup(image) == "uuid-1"
+        assert registry.lookup(image.clone()) is None
+    assert registry.lookupSignature(imgSig) == "uuid-1"
+
+
+def test_converted_mode_is_not_registered(rwUtils):
+    imageBytesList = [encode((1, 2, 3, 128), mode="RGBA")]
+    batch = rwUtils.decodeImagesToTensor(imageBytesList, mode="RGB")
+    registry = rwUtils.getProvenanceRegistry()
+    rwUtils.registerDecodedProvenance(batch, imageBytesList, ["uuid-rgba"], mode="RGB")
+    assert registry.lookup(batch[0]) is None
+
+
+def test_media_provenance_of_inference_waveform(rwUtils):
+    with torch.inference_mode():
+        waveform = torch.rand(1, 2, 480)
+        rwUtils.registerMediaProvenance(waveform, "https://am.runware.ai/a.mp3")
+        media = {"waveform": waveform, "sample_rate": 48000}
+        assert rwUtils.lookupMediaProvenance(media) == "https://am.runware.ai/a.mp3"
+        assert rwUtils.lookupMediaProvenance({"waveform": waveform.clone(), "sample_rate": 48000}) is None
+
+
+def test_media_provenance_of_video_object(rwUtils):
+    video = rwUtils.VideoObject("https://vm.runware.ai/v.mp4", media_uuid="media-uuid")
+    assert rwUtils.lookupMediaProvenance(video) == "media-uuid"
+    assert rwUtils.lookupMediaProvenance(rwUtils.VideoObject("data:video/mp4;base64,AAAA")) is None
@@ -0,0 +1,110 @@
+import pytest
+
+
+def task(taskUUID, **fields):
+    payload = {"taskType": "imageInference", "taskUUID": taskUUID, "positivePrompt": "a cat", "seed": 7}
+    payload.update(fields)
+    return payload
+
+
+@pytest.fixture
+def cache(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_RESULT_CACHE", "true")
+    monkeypatch.delenv("RUNWARE_RESULT_CACHE_BYPASS", raising=False)
+    return rwUtils.RunwareResultCache()
+
+
+def result(taskUUID, url="https://im.runware.ai/image/a.png"):
+    return {"data": [{"taskType": "imageInference", "taskUUID": taskUUID, "imageURL": url}]}
+
+
+def test_hit_is_retargeted_to_new_task(cache):
+    assert cache.lookup([task("first")]) is None
+    cache.observe("first", result("first"))
+    hit = cache.lookup([task("second")])
+    assert hit["data"][0]["taskUUID"] == "second"
+    assert hit["data"][0]["imageURL"] == "https://im.runware.ai/image/a.png"
+
+
+def test_different_payload_misses(cache):
+    cache.lookup([task("first")])
+    cache.observe("first", result("first"))
+    assert cache.lookup([task("second", seed=8)]) is None
+
+
+def test_unseeded_generation_is_not_cached(cache):
+    unseeded = task("first")
+    del unseeded["seed"]
+    assert cache.cacheKey([unseeded]) is None
+    assert cache.cacheKey([{"taskType": "imageCaption", "taskUUID": "x", "inputImage": "uuid"}]) is not None
+
+
+def test_task_type_bypass(cache, monkeypatch):
+    monkeypatch.setenv("RUNWARE_RESULT_CACHE_BYPASS", "imageInference, upscale")
+    assert cache.cacheKey([task("first")]) is None
+
+
+def test_node_bypass_skips_read_but_refreshes(cache):
+    cache.lookup([task("first")])
+    cache.observe("first", result("first"))
+    assert cache.lookup([task("second")], bypass=True) is None
+    cache.observe("second", result("second", url="https://im.runware.ai/image/b.png"))
+    assert cache.lookup([task("third")])["data"][0]["imageURL"].endswith("b.png")
+
+
+def test_failed_request_is_forgotten(cache):
+    cache.lookup([task("first")])
+    assert "first" in cache._awaiting
+    cache.forget("first")
+    assert cache._awaiting == {}
+
+
+def test_inference_request_failure_does_not_leak(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_RESULT_CACHE", "true")
+    monkeypatch.setenv("RUNWARE_TIMEOUT", "5")
+    monkeypatch.setattr(rwUtils, "_result_cache", rwUtils.RunwareResultCache())
+
+    class FailingClient:
+        def request(self, genConfig, timeout):
+            raise TimeoutError()
+
+    monkeypatch.setattr(rwUtils, "usesWebSocketTransport", lambda endpoint=None: True)
+    monkeypatch.setattr(rwUtils, "_get_ws_client", lambda: FailingClient())
+    with pytest.raises(Exception, match="Timed Out"):
+        rwUtils.inferenecRequest([task("first")])
+    assert rwUtils.getResultCache()._awaiting == {}
+
+
+def test_expired_url_without_local_copy_misses(cache):
+    expired = "https://im.runware.ai/image/a.png?Expires=1000"
+    cache.lookup([task("first")])
+    cache.observe("first", result("first", url=expired))
+    assert cache.lookup([task("second")]) is None
+
+
+def test_url_expiry_formats(rwUtils):
+    assert rwUtils.urlExpiry("https://x/a.png?Expires=1700000000") == 1700000000
+    assert rwUtils.urlExpiry("https://x/a.png?X-Amz-Date=20240101T000000Z&X-Amz-Expires=60") == 1704067260
+    assert rwUtils.urlExpiry("https://x/a.png") is None
+
+
+def test_artifacts_are_trimmed_without_rescanning_each_save(cache, rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_RESULT_CACHE_MAX_BYTES", "250")
+    scans = []
+    iterdir = type(rwUtils.RESULT_CACHE_DIR).iterdir
+
+    def counting_iterdir(path):
+        scans.append(path)
+        return iterdir(path)
+
+    monkeypatch.setattr(type(rwUtils.RESULT_CACHE_DIR), "iterdir", counting_iterdir)
+    urls = [f"https://im.runware.ai/image/{index}.png" for index in range(4)]
+    cache.lookup([task("t1")])
+    cache.observe("t1", {"data": [{"taskUUID": "t1", "imageURL": url} for url in urls]})
+    for url in urls[:2]:
+        cache.saveArtifact(url, data=b"x" * 100)
+    assert len(scans) == 1  # the first save sizes the directory, the second adds to the total
+    for url in urls[2:]:
+        cache.saveArtifact(url, data=b"x" * 100)
+    remaining = list(iterdir(rwUtils.RESULT_CACHE_DIR))
+    assert len(remaining) == 2
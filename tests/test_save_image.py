@@ -0,0 +1,69 @@
+import io
+import sys
+import time
+import types
+
+import pytest
+import torch
+from PIL import Image
+
+
+def _png(color, size=(4, 3)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def saveImage(rwUtils, tmp_path, monkeypatch):
+    folderPaths = types.ModuleType("folder_paths")
+    folderPaths.get_output_directory = lambda: str(tmp_path / "output")
+    folderPaths.get_temp_directory = lambda: str(tmp_path / "temp")
+    # ComfyUI creates its temp directory at startup
+    (tmp_path / "temp").mkdir()
+    monkeypatch.setitem(sys.modules, "folder_paths", folderPaths)
+    files = {}
+
+    def fetch(url, timeout=30, logPrefix=""):
+        # The first URL finishes last, so results arrive out of order
+        if url.startswith("https://x/0"):
+            time.sleep(0.05)
+        return files[url]
+
+    monkeypatch.setattr(rwUtils, "getDownloadManager", lambda: types.SimpleNamespace(fetch=fetch))
+    monkeypatch.setattr(rwUtils, "getDownloadConcurrency", lambda: 4)
+    from modules import saveImage
+    monkeypatch.setattr(saveImage, "folder_paths", folderPaths)
+    node = saveImage.RunwareSaveImage()
+    node.files = files
+    return node
+
+
+def test_batch_keeps_url_order(saveImage, tmp_path, rwUtils):
+    colors = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    urls = [f"https://x/{i}.png" for i in range(len(colors))]
+    saveImage.files.update({url: _png(color) for url, color in zip(urls, colors)})
+
+    result = saveImage.save_images(",".join(urls), filenamePrefix="run")
+    batch = result["result"][0]
+    assert batch.shape == (3, 3, 4, 3)
+    for i, color in enumerate(colors):
+        assert torch.equal(batch[i, 0, 0], torch.tensor(color, dtype=torch.float32) / 255)
+    names = [saved["filename"] for saved in result["ui"]["images"]]
+    assert [name[-8:] for name in names] == ["_001.png", "_002.png", "_003.png"]
+    for name, url in zip(names, urls):
+        assert (tmp_path / "output" / name).read_bytes() == saveImage.files[url]
+    assert rwUtils.getProvenanceRegistry().lookup(batch[1]) == urls[1]
+
+
+def test_svg_gets_a_placeholder_slice(saveImage, tmp_path):
+    saveImage.files["https://x/0.svg"] = b"<svg xmlns='http://www.w3.org/2000/svg'/>"
+    saveImage.files["https://x/1.png"] = _png((0, 0, 255), size=(1, 1))
+
+    result = saveImage.save_images("https://x/0.svg, https://x/1.png", saveImage=False)
+    batch = result["result"][0]
+    assert batch.shape == (2, 1, 1, 3)
+    assert torch.allclose(batch[0], torch.full((1, 1, 3), 0.5))
+    assert torch.equal(batch[1, 0, 0], torch.tensor([0.0, 0.0, 1.0]))
+    assert [saved["type"] for saved in result["ui"]["images"]] == ["temp", "temp"]
+    assert (tmp_path / "temp" / result["ui"]["images"][0]["filename"]).read_bytes().startswith(b"<svg")
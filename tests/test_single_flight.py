@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+
+def _task(**overrides):
+    task = {"taskType": "imageInference", "taskUUID": "t1", "positivePrompt": "a cat", "seed": 7}
+    task.update(overrides)
+    return [task]
+
+
+def test_canonical_key_ignores_task_uuid_and_key_order(rwUtils):
+    key = rwUtils.canonicalTaskKey(_task())
+    reordered = [dict(reversed(list(_task(taskUUID="t2")[0].items())))]
+    assert key is not None and rwUtils.canonicalTaskKey(reordered) == key
+    assert rwUtils.canonicalTaskKey(_task(positivePrompt="a dog")) != key
+
+
+@pytest.mark.parametrize("genConfig", [
+    _task(seed=None),
+    [{"taskType": "videoInference", "taskUUID": "t1", "settings": {"steps": 4}}],
+    [{"taskType": "3dInference", "taskUUID": "t1", "model": "m", "inputs": {"image": "uuid"}}],
+    [{"taskType": "photoMaker", "taskUUID": "t1", "positivePrompt": "img of a cat"}],
+    [{"taskType": "someNewTask", "taskUUID": "t1"}],
+    _task() + _task(taskUUID="t2"),
+    _task(image=object()),
+], ids=["unseeded", "unseeded-settings", "unseeded-3d", "unseeded-photomaker", "unknown-type", "several-tasks", "unserializable"])
+def test_canonical_key_exclusions(rwUtils, genConfig):
+    assert rwUtils.canonicalTaskKey(genConfig) is None
+
+
+def test_seed_in_settings_counts_and_deterministic_needs_none(rwUtils):
+    assert rwUtils.canonicalTaskKey([{"taskType": "videoInference", "taskUUID": "t1", "settings": {"seed": 3}}])
+    assert rwUtils.canonicalTaskKey([{"taskType": "3dInference", "taskUUID": "t1", "seed": 3}])
+    assert rwUtils.canonicalTaskKey([{"taskType": "imageCaption", "taskUUID": "t1", "inputImage": "uuid"}])
+
+
+@pytest.fixture
+def registry(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_SINGLE_FLIGHT", "true")
+    return rwUtils.RunwareInflightRegistry()
+
+
+def test_follower_gets_leader_result_retargeted(registry):
+    leader, isLeader = registry.join(_task())
+    follower, isFollowerLeader = registry.join(_task(taskUUID="t2"))
+    assert isLeader and not isFollowerLeader and follower is leader
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(registry.wait(follower, "t2")))
+    waiter.start()
+    registry.resolve(leader, {"data": [{"taskUUID": "t1", "imageURL": "https://x/a.png"}]})
+    waiter.join(5)
+    assert results == [{"data": [{"taskUUID": "t2", "imageURL": "https://x/a.png"}]}]
+
+    # The flight is over, so the next identical request is sent again
+    assert registry.join(_task(taskUUID="t3"))[1]
+
+
+def test_leader_failure_reaches_followers(registry):
+    leader, _ = registry.join(_task())
+    follower, _ = registry.join(_task(taskUUID="t2"))
+    registry.fail(leader, ConnectionError("closed"))
+    with pytest.raises(ConnectionError):
+        registry.wait(follower, "t2")
+    assert registry.join(_task(taskUUID="t3"))[1]
+
+
+def test_async_followers_alias_the_leader_until_released(registry):
+    leader, _ = registry.join(_task(deliveryMethod="async"))
+    registry.join(_task(taskUUID="t2", deliveryMethod="async"))
+    assert registry.leaderFor("t2") == "t1"
+    registry.resolve(leader, {"data": [{"taskUUID": "t1", "status": "processing"}]})
+    assert not registry.join(_task(taskUUID="t3", deliveryMethod="async"))[1]
+    registry.release("t1")
+    assert registry.join(_task(taskUUID="t4", deliveryMethod="async"))[1]
+
+
+def test_disabled_or_unkeyed_requests_are_not_shared(rwUtils, registry, monkeypatch):
+    assert registry.join(_task(seed=None)) == (None, True)
+    monkeypatch.setenv("RUNWARE_SINGLE_FLIGHT", "false")
+    assert registry.join(_task()) == (None, True)
+
+
+def test_unclaimed_async_leader_stops_being_joined(registry, rwUtils, monkeypatch):
+    leader, _ = registry.join(_task(deliveryMethod="async"))
+    registry.resolve(leader, {"data": [{"taskUUID": "t1", "status": "processing"}]})
+    monkeypatch.setattr(rwUtils, "SINGLE_FLIGHT_UNCLAIMED_GRACE", 0)
+    # The leader failed after submitting and never waited for its task
+    assert registry.join(_task(taskUUID="t2", deliveryMethod="async"))[1]
+
+
+def test_claimed_async_leader_stays_joinable(registry, rwUtils, monkeypatch):
+    leader, _ = registry.join(_task(deliveryMethod="async"))
+    registry.resolve(leader, {"data": [{"taskUUID": "t1", "status": "processing"}]})
+    registry.claim("t1")
+    monkeypatch.setattr(rwUtils, "SINGLE_FLIGHT_UNCLAIMED_GRACE", 0)
+    assert not registry.join(_task(taskUUID="t2", deliveryMethod="async"))[1]
+
+
+def test_wait_failing_before_watching_releases_the_flight(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_SINGLE_FLIGHT", "true")
+    registry = rwUtils.getInflightRegistry()
+    leader, _ = registry.join(_task(taskUUID="w1", seed=11, deliveryMethod="async"))
+    registry.resolve(leader, {"data": [{"taskUUID": "w1", "status": "processing"}]})
+
+    def broken_lookup(taskUUID):
+        raise RuntimeError("cache unavailable")
+
+    monkeypatch.setattr(rwUtils.getResultCache(), "resolvedResult", broken_lookup)
+    with pytest.raises(RuntimeError):
+        rwUtils.waitForTaskResult("w1")
+    assert registry.join(_task(taskUUID="w2", seed=11, deliveryMethod="async"))[1]
+    registry.release("w2")
@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+
+@pytest.fixture
+def watcher(rwUtils, monkeypatch):
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_PROFILES", {})
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_DEFAULT_PROFILE", (0.01, 10, 0.01, 30))
+    return rwUtils.RunwareTaskWatcher()
+
+
+def _done(taskUUID):
+    return {"data": [{"taskUUID": taskUUID, "status": "success"}]}
+
+
+def test_due_tasks_share_one_poll_frame(rwUtils, watcher, monkeypatch):
+    frames = []
+
+    async def fake_batch(taskUUIDs):
+        frames.append(list(taskUUIDs))
+        return {taskUUID: _done(taskUUID) for taskUUID in taskUUIDs}
+
+    monkeypatch.setattr(rwUtils, "getResponseBatchAsync", fake_batch)
+
+    async def run():
+        return await asyncio.gather(*(watcher.watch(f"t{i}") for i in range(3)))
+
+    results = asyncio.run(run())
+    assert [result["data"][0]["taskUUID"] for result in results] == ["t0", "t1", "t2"]
+    assert frames == [["t0", "t1", "t2"]]
+
+
+def test_slow_batch_does_not_stall_other_batches(rwUtils, watcher, monkeypatch):
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_BATCH_SIZE", 1)
+    polled = []
+
+    async def fake_batch(taskUUIDs):
+        polled.extend(taskUUIDs)
+        if taskUUIDs == ["stuck"]:
+            await asyncio.sleep(3600)
+        return {taskUUID: _done(taskUUID) for taskUUID in taskUUIDs}
+
+    monkeypatch.setattr(rwUtils, "getResponseBatchAsync", fake_batch)
+
+    async def run():
+        stuck = asyncio.ensure_future(watcher.watch("stuck"))
+        await asyncio.sleep(0)
+        result = await asyncio.wait_for(watcher.watch("quick"), 2)
+        # The stuck task is not polled again while its frame is outstanding
+        assert polled.count("stuck") == 1
+        stuck.cancel()
+        return result
+
+    assert asyncio.run(run())["data"][0]["taskUUID"] == "quick"
+
+
+def test_pushed_result_resolves_without_polling(rwUtils, watcher, monkeypatch):
+    async def fake_batch(taskUUIDs):
+        return {taskUUID: {"data": [{"taskUUID": taskUUID, "status": "processing"}]} for taskUUID in taskUUIDs}
+
+    monkeypatch.setattr(rwUtils, "getResponseBatchAsync", fake_batch)
+
+    async def run():
+        watch = asyncio.ensure_future(watcher.watch("t1"))
+        await asyncio.sleep(0.05)
+        assert not watch.done()
+        watcher.offer("t1", _done("t1"))
+        return await asyncio.wait_for(watch, 1)
+
+    assert asyncio.run(run())["data"][0]["status"] == "success"
+
+
+def test_polling_deadline_fails_the_watch(rwUtils, watcher, monkeypatch):
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_DEFAULT_PROFILE", (0.01, 10, 0.01, 0.05))
+
+    async def fake_batch(taskUUIDs):
+        return {}
+
+    monkeypatch.setattr(rwUtils, "getResponseBatchAsync", fake_batch)
+    with pytest.raises(TimeoutError, match="polling deadline"):
+        asyncio.run(asyncio.wait_for(watcher.watch("t1"), 2))
+
+
+def test_poll_frame_is_sent_once_with_its_own_deadline(rwUtils, monkeypatch):
+    calls = []
+
+    class SilentClient:
+        async def request_async(self, gen_config, timeout, retries=None):
+            calls.append(retries)
+            await asyncio.sleep(3600)
+
+    monkeypatch.setattr(rwUtils, "getCustomEndpoint", lambda: "wss://example.invalid/v1")
+    monkeypatch.setattr(rwUtils, "_get_ws_client", lambda: SilentClient())
+    started = time.monotonic()
+    assert asyncio.run(rwUtils.getResponseBatchAsync(["t1"], timeout=0.1)) is None
+    assert time.monotonic() - started < 1
+    assert calls == [0]
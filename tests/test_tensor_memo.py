@@ -0,0 +1,115 @@
+import concurrent.futures
+
+import pytest
+import torch
+
+
+@pytest.fixture
+def memo(rwUtils):
+    return rwUtils.RunwareTensorMemo(maxBytes=1024 * 1024)
+
+
+def test_key_of_inference_tensor(memo):
+    with torch.inference_mode():
+        tensor = torch.rand(1, 4, 4, 3)
+    assert tensor.is_inference()
+    key = memo.key(tensor, "upload")
+    assert key == memo.key(tensor, "upload")
+    memo.put(key, tensor, "sig", "value")
+    assert memo.get(key, tensor) == ("sig", "value")
+
+
+def test_in_place_edit_misses(memo):
+    tensor = torch.rand(1, 4, 4, 3)
+    memo.put(memo.key(tensor), tensor, "sig", "value")
+    assert memo.get(memo.key(tensor), tensor) == ("sig", "value")
+    tensor.mul_(0.5)
+    assert memo.get(memo.key(tensor), tensor) is None
+
+
+def test_views_of_one_storage_do_not_collide(memo):
+    batch = torch.rand(2, 4, 4, 3)
+    memo.put(memo.key(batch[0]), batch[0], "first", "a")
+    assert memo.get(memo.key(batch[1]), batch[1]) is None
+    assert memo.get(memo.key(batch[0]), batch[0]) == ("first", "a")
+
+
+def test_budget_evicts_oldest(rwUtils):
+    memo = rwUtils.RunwareTensorMemo(maxBytes=200)
+    tensors = [torch.rand(2, 2) for _ in range(3)]
+    for index, tensor in enumerate(tensors):
+        memo.put(memo.key(tensor), tensor, "s", "x" * 60)
+    assert memo.get(memo.key(tensors[0]), tensors[0]) is None
+    assert memo.get(memo.key(tensors[2]), tensors[2]) is not None
+
+
+def test_encoders_under_inference_mode(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_ENABLE_IMAGES_CACHING", "false")
+    uploads = []
+
+    class Queue:
+        def submit(self, imgSig, imgDataUri, foreground=False):
+            uploads.append(imgSig)
+            future = concurrent.futures.Future()
+            future.set_result("uploaded-uuid")
+            return future
+
+    monkeypatch.setattr(rwUtils, "imageStoreGet", lambda imgSig: None)
+    monkeypatch.setattr(rwUtils, "getUploadQueue", lambda: Queue())
+
+    with torch.inference_mode():
+        image = torch.rand(1, 8, 8, 3)
+        first = rwUtils.convertTensor2IMG(image)
+        assert first.startswith("data:image/")
+        assert rwUtils.convertTensor2IMG(image) == first
+        assert rwUtils.convertTensor2IMGBase64Only(image).startswith("data:image/")
+        assert rwUtils.convertTensor2IMGForVideo(image) == "uploaded-uuid"
+    assert len(uploads) == 1
+
+
+def test_repeated_tensor_reaches_the_upload_policy(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_ENABLE_IMAGES_CACHING", "true")
+    monkeypatch.setenv("RUNWARE_MIN_IMAGE_CACHE_SIZE", "0")
+    monkeypatch.setenv("RUNWARE_UPLOAD_SYNC_MIN_SECONDS", "3600")
+    monkeypatch.setattr(rwUtils, "_upload_policy", rwUtils.RunwareUploadPolicy())
+    monkeypatch.setattr(rwUtils, "_tensor_memo", None)
+    submitted = []
+
+    class Queue:
+        def submit(self, imgSig, imgDataUri, foreground=False):
+            # Background uploads never finish here, so the store stays empty
+            submitted.append(foreground)
+            future = concurrent.futures.Future()
+            if foreground:
+                future.set_result("uuid-1")
+            return future
+
+    monkeypatch.setattr(rwUtils, "getUploadQueue", lambda: Queue())
+    image = torch.rand(1, 16, 16, 3)
+    assert rwUtils.convertTensor2IMG(image).startswith("data:")
+    # Seen before: the policy uploads it instead of the memo resending the data URI
+    assert rwUtils.convertTensor2IMG(image) == "uuid-1"
+    assert rwUtils.convertTensor2IMG(image) == "uuid-1"
+    assert submitted == [False, True]
+
+
+def test_memo_key_covers_encode_settings(rwUtils, monkeypatch):
+    monkeypatch.setenv("RUNWARE_ENABLE_IMAGES_CACHING", "false")
+    monkeypatch.setenv("RUNWARE_IMAGE_ENCODE_FORMAT", "PNG")
+    monkeypatch.setattr(rwUtils, "_tensor_memo", None)
+    encode = rwUtils.encodeImageArray
+    encodes = []
+
+    def counting_encode(imageNP, role="image"):
+        encodes.append(rwUtils.getPngCompressLevel())
+        return encode(imageNP, role)
+
+    monkeypatch.setattr(rwUtils, "encodeImageArray", counting_encode)
+    image = torch.rand(1, 16, 16, 3)
+    for level in ("6", "6", "1"):
+        monkeypatch.setenv("RUNWARE_PNG_COMPRESS_LEVEL", level)
+        rwUtils.convertTensor2IMG(image)
+    monkeypatch.setenv("RUNWARE_ENABLE_IMAGES_CACHING", "true")
+    monkeypatch.setenv("RUNWARE_MIN_IMAGE_CACHE_SIZE", "100000")
+    rwUtils.convertTensor2IMG(image)
+    assert encodes == [6, 1, 1]
@@ -0,0 +1,67 @@
+import threading
+import time
+
+import pytest
+
+
+@pytest.fixture
+def uploads(rwUtils, monkeypatch):
+    release = threading.Event()
+    sent = []
+
+    def fake_upload(imageDataUri):
+        sent.append(imageDataUri)
+        assert release.wait(5)
+        return f"uuid-{len(sent)}"
+
+    monkeypatch.setattr(rwUtils, "uploadImageSync", fake_upload)
+    return release, sent
+
+
+def test_same_signature_is_uploaded_once(rwUtils, uploads):
+    release, sent = uploads
+    queue = rwUtils.RunwareUploadQueue(workers=2)
+    futures = [queue.submit("sig", "data:image/png;base64,AAAA") for _ in range(3)]
+    futures.append(queue.submit("sig", "data:image/png;base64,AAAA", foreground=True))
+    assert all(future is futures[0] for future in futures)
+    release.set()
+    assert futures[0].result(timeout=5) == "uuid-1"
+    assert sent == ["data:image/png;base64,AAAA"]
+    assert queue.getStats()["deduped"] == 3
+    assert rwUtils.getImageStore().get("sig") == "uuid-1"
+
+
+def test_finished_signature_can_upload_again(rwUtils, uploads):
+    release, sent = uploads
+    release.set()
+    queue = rwUtils.RunwareUploadQueue(workers=1)
+    assert queue.submit("sig", "first").result(timeout=5) == "uuid-1"
+    assert queue.submit("sig", "second").result(timeout=5) == "uuid-2"
+    assert queue.getStats()["inFlight"] == 0
+
+
+def test_foreground_jumps_queued_background_work(rwUtils, uploads):
+    release, sent = uploads
+    queue = rwUtils.RunwareUploadQueue(workers=1)
+    blocker = queue.submit("busy", "busy")
+    while not sent:  # the only worker is now blocked on "busy"
+        time.sleep(0.01)
+    background = [queue.submit(f"bg{i}", f"bg{i}") for i in range(3)]
+    foreground = queue.submit("bg2", "bg2", foreground=True)
+    assert foreground is background[2]
+    release.set()
+    for future in [blocker, *background]:
+        future.result(timeout=5)
+    assert sent == ["busy", "bg2", "bg0", "bg1"]
+
+
+def test_upload_error_reaches_every_waiter(rwUtils, monkeypatch):
+    def failing_upload(imageDataUri):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(rwUtils, "uploadImageSync", failing_upload)
+    queue = rwUtils.RunwareUploadQueue(workers=1)
+    future = queue.submit("sig", "data")
+    with pytest.raises(ConnectionError):
+        future.result(timeout=5)
+    assert queue.getStats()["failures"] == 1
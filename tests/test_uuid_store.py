@@ -0,0 +1,62 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+
+def _legacy_cache(path, entries):
+    path.write_text(json.dumps(entries))
+    return path
+
+
+def test_legacy_json_is_migrated_once(rwUtils, tmp_path):
+    now = datetime.now()
+    legacy = _legacy_cache(tmp_path / "imagesCache.json", {
+        "fresh": {"uuid": "uuid-fresh", "expires": (now + timedelta(days=1)).isoformat()},
+        "expired": {"uuid": "uuid-old", "expires": (now - timedelta(days=1)).isoformat()},
+        "broken": {"uuid": "uuid-broken", "expires": "not a date"},
+        "no-uuid": {"expires": (now + timedelta(days=1)).isoformat()},
+    })
+    store = rwUtils.RunwareUUIDStore(tmp_path / "cache.db", legacyJsonPath=legacy)
+    assert store.get("fresh") == "uuid-fresh"
+    assert store.get("expired") is None
+    assert store.get("broken") is None
+    assert store.get("no-uuid") is None
+    assert not legacy.exists()
+    assert (tmp_path / "imagesCache.json.migrated").exists()
+
+    # A second store on the same database does not need (or find) the JSON file
+    again = rwUtils.RunwareUUIDStore(tmp_path / "cache.db", legacyJsonPath=legacy)
+    assert again.get("fresh") == "uuid-fresh"
+
+
+def test_migration_keeps_newer_rows(rwUtils, tmp_path):
+    store = rwUtils.RunwareUUIDStore(tmp_path / "cache.db")
+    store.set("shared", "uuid-new")
+    legacy = _legacy_cache(tmp_path / "imagesCache.json", {
+        "shared": {"uuid": "uuid-legacy", "expires": (datetime.now() + timedelta(days=1)).isoformat()},
+    })
+    migrated = rwUtils.RunwareUUIDStore(tmp_path / "cache.db", legacyJsonPath=legacy)
+    assert migrated.get("shared") == "uuid-new"
+
+
+def test_unreadable_legacy_file_is_left_in_place(rwUtils, tmp_path):
+    legacy = tmp_path / "imagesCache.json"
+    legacy.write_text("{not json")
+    store = rwUtils.RunwareUUIDStore(tmp_path / "cache.db", legacyJsonPath=legacy)
+    assert legacy.exists()
+    store.set("a", "uuid-a")
+    assert store.get("a") == "uuid-a"
+
+
+def test_expired_rows_miss_and_sweep_evicts_least_recent(rwUtils, tmp_path):
+    store = rwUtils.RunwareUUIDStore(tmp_path / "cache.db", maxEntries=2)
+    store.set("gone", "uuid-gone", ttl=-1)
+    assert store.get("gone") is None
+    for key in ("a", "b", "c"):
+        store.set(key, f"uuid-{key}")
+        time.sleep(0.01)
+    store.get("a")  # a is now the most recently used
+    assert store.sweep() == (0, 1)
+    assert store.get("b") is None
+    assert store.get("a") == "uuid-a" and store.get("c") == "uuid-c"
+
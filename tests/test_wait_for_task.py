@@ -0,0 +1,49 @@
+import pytest
+
+
+@pytest.fixture
+def polls(rwUtils, monkeypatch):
+    responses = {}
+
+    async def fake_batch(taskUUIDs):
+        return {taskUUID: responses[taskUUID] for taskUUID in taskUUIDs if taskUUID in responses}
+
+    monkeypatch.setattr(rwUtils, "getResponseBatchAsync", fake_batch)
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_PROFILES", {})
+    monkeypatch.setattr(rwUtils, "ASYNC_POLL_DEFAULT_PROFILE", (0.01, 10, 0.01, 30))
+    monkeypatch.setattr(rwUtils, "_task_watcher", None)
+    return responses
+
+
+def test_returns_complete_result(rwUtils, polls):
+    polls["t1"] = {"data": [{"taskUUID": "t1", "status": "success", "imageURL": "https://x/a.png"}]}
+    assert rwUtils.waitForTaskResult("t1") == polls["t1"]
+
+
+def test_error_result_completes_the_wait(rwUtils, polls):
+    polls["t1"] = {"errors": [{"taskUUID": "t1", "message": "provider failed"}]}
+    assert rwUtils.waitForTaskResult("t1")["errors"][0]["message"] == "provider failed"
+
+
+def test_processing_result_keeps_waiting_until_timeout(rwUtils, polls):
+    polls["t1"] = {"data": [{"taskUUID": "t1", "status": "processing"}]}
+    with pytest.raises(TimeoutError, match="did not complete within"):
+        rwUtils.waitForTaskResult("t1", timeout=0.2)
+
+
+def test_custom_completion_check(rwUtils, polls):
+    polls["t1"] = {"data": [{"taskUUID": "t1", "outputs": {"files": [{"url": "https://x/a.glb"}]}}]}
+    result = rwUtils.waitForTaskResult("t1", isComplete=lambda result: bool(result["data"][0].get("outputs")))
+    assert result["data"][0]["outputs"]["files"]
+
+
+def test_interrupt_stops_the_wait(rwUtils, polls, monkeypatch):
+    class Interrupted(Exception):
+        pass
+
+    def interrupt():
+        raise Interrupted()
+
+    monkeypatch.setattr(rwUtils, "throw_exception_if_processing_interrupted", interrupt)
+    with pytest.raises(Interrupted):
+        rwUtils.waitForTaskResult("t1")
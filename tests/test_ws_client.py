@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+import pytest
+
+
+class FakeSocket:
+    def __init__(self):
+        self.frames = []
+        self.closed = False
+
+    async def send(self, message):
+        self.frames.append(json.loads(message))
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def client(rwUtils):
+    client = rwUtils.RunwareWebSocketClient()
+    client._ws = FakeSocket()
+    return client
+
+
+async def connected(client):
+    # A live reader task makes _ensure_connected reuse the fake socket
+    client._reader_task = asyncio.get_running_loop().create_future()
+    return client._ws
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def request(client, taskUUID, timeout=5):
+    task = {"taskType": "imageInference", "taskUUID": taskUUID}
+    return asyncio.ensure_future(client._send_and_wait([task], timeout=timeout))
+
+
+def test_tagged_replies_route_by_task_uuid(client):
+    async def run():
+        await connected(client)
+        first, second = request(client, "a"), request(client, "b")
+        await settle()
+        client._dispatch_message({"data": [{"taskUUID": "b", "imageUUID": "2"}, {"taskUUID": "a", "imageUUID": "1"}]})
+        return await first, await second
+
+    first, second = asyncio.run(run())
+    assert first == {"data": [{"taskUUID": "a", "imageUUID": "1"}]}
+    assert second == {"data": [{"taskUUID": "b", "imageUUID": "2"}]}
+
+
+def test_untagged_error_fails_single_request(client):
+    async def run():
+        await connected(client)
+        pending = request(client, "a")
+        await settle()
+        client._dispatch_message({"errors": [{"message": "Invalid payload"}]})
+        return await pending
+
+    assert asyncio.run(run()) == {"errors": [{"message": "Invalid payload"}]}
+
+
+def test_untagged_error_fails_whole_batch_frame(client, monkeypatch):
+    monkeypatch.setenv("RUNWARE_REQUEST_BATCH_WINDOW_MS", "5")
+
+    async def run():
+        ws = await connected(client)
+        requests = [request(client, taskUUID, timeout=2) for taskUUID in "abc"]
+        await asyncio.sleep(0.05)
+        assert len(ws.frames) == 1 and len(ws.frames[0]) == 3
+        client._dispatch_message({"errors": [{"message": "Invalid payload"}]})
+        return await asyncio.gather(*requests)
+
+    results = asyncio.run(run())
+    assert all(result == {"errors": [{"message": "Invalid payload"}]} for result in results)
+
+
+def test_untagged_error_goes_to_oldest_unanswered_frame(client):
+    async def run():
+        await connected(client)
+        first, second = request(client, "a"), request(client, "b")
+        await settle()
+        client._dispatch_message({"errors": [{"message": "Invalid payload"}]})
+        client._dispatch_message({"data": [{"taskUUID": "b", "imageUUID": "2"}]})
+        return await first, await second
+
+    first, second = asyncio.run(run())
+    assert first == {"errors": [{"message": "Invalid payload"}]}
+    assert second == {"data": [{"taskUUID": "b", "imageUUID": "2"}]}
+
+
+def test_unrouted_frames_go_to_task_watcher(client, rwUtils, monkeypatch):
+    offered = []
+    monkeypatch.setattr(rwUtils.getTaskWatcher(), "offer", lambda taskUUID, result: offered.append((taskUUID, result)))
+    client._dispatch_message({"data": [{"taskUUID": "async-task", "status": "success"}]})
+    assert offered == [("async-task", {"data": [{"taskUUID": "async-task", "status": "success"}]})]
+
+
+def test_drop_leaves_a_replaced_socket_alone(client):
+    async def run():
+        stale = await connected(client)
+        current = client._ws = FakeSocket()
+        await client._drop(stale)
+        assert client._ws is current and not current.closed
+        await client._drop(current)
+        assert client._ws is None and current.closed
+
+    asyncio.run(run())
+
+
+def test_disconnect_fails_requests_sent_on_that_socket(client):
+    async def run():
+        await connected(client)
+        pending = request(client, "a")
+        await settle()
+        await client._disconnect()
+        with pytest.raises(ConnectionError):
+            await pending
+
+    asyncio.run(run())